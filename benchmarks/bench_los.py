@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Line-of-sight benchmark: batched queries, cached queries and the old
+per-observer update_vision approach.
+
+    python benchmarks/bench_los.py [--repeat N]
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
+
+from tactical_map import random_map
+from line_of_sight import batch_line_of_sight, LOSCache
+from visioning import VisionSystem
+
+def per_call_ms(fn, repeat):
+    fn()  # warm up tables and caches
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for size, units in ((50, 50), (256, 50), (1024, 50)):
+        game_map = random_map(size, size, 0.2, rng)
+        # Two forces within a 40-tile skirmish area
+        center = rng.integers(20, size - 20, 2)
+        squad = np.clip(center + rng.integers(-20, 20, (units, 2)), 0, size - 1)
+        enemies = np.clip(center + rng.integers(-20, 20, (units, 2)), 0, size - 1)
+        cache = LOSCache(game_map)
+
+        batched = per_call_ms(lambda: batch_line_of_sight(game_map, squad, enemies), args.repeat)
+        cached = per_call_ms(lambda: cache.batch(squad, enemies), args.repeat)
+        vision = VisionSystem(game_map)
+        vision.sight_range = 40
+
+        def per_observer():
+            for pos in squad:
+                vision.update_vision(tuple(pos))
+                vision.visible[enemies[:, 0], enemies[:, 1]]
+
+        fov = per_call_ms(per_observer, max(1, args.repeat // 10))
+        print(f"{size:>4}x{size:<4} {units}x{units} pairs: batched {batched:7.3f} ms   "
+              f"cached {cached:7.3f} ms   update_vision per observer {fov:8.3f} ms")
+
+if __name__ == "__main__":
+    main()
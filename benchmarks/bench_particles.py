@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Particle benchmark: Particle objects with draw.circle (the original path),
+the NumPy ParticleSystem with draw.circle, and ParticleSystem with atlas blits.
+
+    python benchmarks/bench_particles.py [--frames N]
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
+os.environ.setdefault('SDL_VIDEODRIVER', "dummy")
+
+import pygame
+pygame.init()
+from game.particles import Particle, ParticleSystem, update_particles
+
+POPULATIONS = (1000, 10000, 50000)
+SCREEN_SIZE = (1000, 700)
+COLORS = ((255, 100, 100), (255, 200, 80), (120, 200, 255))
+
+def emitters(population):
+    """Spread bursts of 20 over the screen"""
+    bursts = population // 20
+    return [((i * 97) % SCREEN_SIZE[0], (i * 61) % SCREEN_SIZE[1], COLORS[i % len(COLORS)])
+            for i in range(bursts)]
+
+def run_objects(screen, population, frames):
+    particles = []
+    points = emitters(population)
+    update_time = draw_time = 0.0
+    for frame in range(frames):
+        for x, y, color in points[:max(1, (population - len(particles)) // 20)]:
+            particles.extend(Particle(x, y, color) for _ in range(20))
+        start = time.perf_counter()
+        particles = update_particles(particles)
+        middle = time.perf_counter()
+        for particle in particles:
+            particle.draw(screen)
+        update_time += middle - start
+        draw_time += time.perf_counter() - middle
+    return update_time / frames, draw_time / frames
+
+def run_system(screen, population, frames, draw):
+    system = ParticleSystem(seed=0)
+    points = emitters(population)
+    update_time = draw_time = 0.0
+    for frame in range(frames):
+        for x, y, color in points[:max(1, (population - len(system)) // 20)]:
+            system.emit(x, y, color, 20)
+        start = time.perf_counter()
+        system.update()
+        middle = time.perf_counter()
+        draw(system, screen)
+        update_time += middle - start
+        draw_time += time.perf_counter() - middle
+    return update_time / frames, draw_time / frames
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    paths = (
+        ("Particle objects + draw.circle", lambda pop: run_objects(screen, pop, args.frames)),
+        ("ParticleSystem + draw.circle", lambda pop: run_system(
+            screen, pop, args.frames, ParticleSystem.draw_circles)),
+        ("ParticleSystem + atlas blits", lambda pop: run_system(
+            screen, pop, args.frames, ParticleSystem.draw)),
+    )
+    print(f"{'':<32} {'particles':>9} {'update ms':>10} {'draw ms':>9} {'frame ms':>9}")
+    for population in POPULATIONS:
+        for label, run in paths:
+            update, draw = run(population)
+            print(f"{label:<32} {population:>9} {update * 1e3:>10.3f} {draw * 1e3:>9.3f} "
+                  f"{(update + draw) * 1e3:>9.3f}")
+        print()
+
+if __name__ == "__main__":
+    main()
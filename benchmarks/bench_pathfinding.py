@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Pathfinding benchmark: A* vs jump point search, and distance-field queries.
+
+    python benchmarks/bench_pathfinding.py [--size N]
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from tactical_map import new_map, random_map
+from pathfinding import PathFinder
+
+def block_map(size, rng):
+    """Open ground with rectangular buildings, the layout JPS is built for"""
+    game_map = new_map(size, size)
+    for _ in range(size * size // 1800):
+        x, y = rng.integers(0, size - 4, 2)
+        w, h = rng.integers(4, 30, 2)
+        game_map[x:x + w, y:y + h] = 1
+    game_map[0, 0] = game_map[-1, -1] = 0
+    return game_map
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1e3
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=512)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    size = args.size
+    maps = {
+        "buildings": block_map(size, rng),
+        "noise 10%": random_map(size, size, 0.1, rng),
+    }
+    for label, game_map in maps.items():
+        game_map[0, 0] = game_map[-1, -1] = 0
+        finder = PathFinder(game_map)
+        print(f"\n{label}, {size}x{size}, corner to corner")
+        for method in ("astar", "jps"):
+            path, ms = timed(finder.find_path, (0, 0), (size - 1, size - 1), method)
+            print(f"  {method:<6} {ms:8.1f} ms   {len(path) if path else 'no'} tiles")
+
+        floor = np.argwhere(game_map == 0)
+        squad = [tuple(int(v) for v in floor[i]) for i in rng.choice(len(floor), 4)]
+        enemies = [tuple(int(v) for v in floor[i]) for i in rng.choice(len(floor), 200)]
+        _, build = timed(finder.distance_field, squad, "squad")
+        _, query = timed(finder.nearest_targets, enemies, squad, "squad")
+        print(f"  squad distance field {build:8.1f} ms to build, "
+              f"{query * 1e3 / len(enemies):.2f} us per nearest-operative query")
+
+if __name__ == "__main__":
+    main()
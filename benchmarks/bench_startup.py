@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark: time from launching the game to its first presented frame,
+with the slowest imports from python -X importtime.
+
+    python benchmarks/bench_startup.py [--runs N] [--top N]
+"""
+import os
+import re
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Runs the game from the repository root like run_game.py, so config.ini and
+# data/ are the real ones, and exits as soon as the first frame is presented.
+# The font path cache goes to the benchmark's own directory instead of data/cache.
+CHILD = """
+import os, sys
+sys.path.insert(0, "src")
+import pygame
+from game.assets import assets
+assets.font_cache_path = os.environ["BENCH_FONT_CACHE"]
+def first_frame(*args):
+    sys.stdout.write("FIRST_FRAME\\n")
+    sys.stdout.flush()
+    os._exit(0)
+pygame.display.flip = pygame.display.update = first_frame
+import main
+main.main()
+"""
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s+(\S+)")
+
+def launch(font_cache_path):
+    """:return: (seconds to first frame, importtime lines)"""
+    env = dict(os.environ)
+    env.update(PYGAME_HIDE_SUPPORT_PROMPT="1", PYTHONDONTWRITEBYTECODE="1",
+               BENCH_FONT_CACHE=font_cache_path)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    start = time.perf_counter()
+    child = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if "FIRST_FRAME" not in child.stdout:
+        raise RuntimeError(f"game exited before its first frame:\n{child.stderr[-2000:]}")
+    return elapsed, child.stderr.splitlines()
+
+def slowest_packages(lines):
+    """
+    (cumulative us, package) per top-level package, slowest first; a package's
+    outermost import is its largest, and includes whatever it imports
+    """
+    packages = {}
+    for line in lines:
+        match = IMPORT_LINE.match(line)
+        if match:
+            package = match.group(3).split(".")[0]
+            packages[package] = max(packages.get(package, 0), int(match.group(2)))
+    return sorted(((us, package) for package, us in packages.items()), reverse=True)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=12)
+    args = parser.parse_args()
+
+    times = []
+    # The first run resolves the fonts; later runs start from its cache
+    with tempfile.TemporaryDirectory() as cache_dir:
+        font_cache_path = os.path.join(cache_dir, "font_paths.json")
+        for _ in range(args.runs):
+            elapsed, lines = launch(font_cache_path)
+            times.append(elapsed)
+    times.sort()
+    print(f"launch to first frame: best {times[0] * 1e3:.0f} ms, "
+          f"median {times[len(times) // 2] * 1e3:.0f} ms over {args.runs} runs")
+
+    print(f"\n{'cumulative ms':>13}  package (last run)")
+    for cumulative, package in slowest_packages(lines)[:args.top]:
+        print(f"{cumulative / 1e3:>13.1f}  {package}")
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,8 @@ class PlayerDataDashboard:
         
         # Initialize dashboard components
         self.analytics_dashboard = PlayerAnalyticsDashboard()
+        # Opened by path: no system font lookup, so game.assets is not needed here
+        self.footer_font = pygame.font.Font("assets/fonts/default.ttf", 18)
         
         # Navigation
         self.current_view = "analytics"
@@ -44,7 +46,7 @@ class PlayerDataDashboard:
         pygame.draw.rect(self.screen, (30, 35, 45), (0, SCREEN_HEIGHT - 40, SCREEN_WIDTH, 40), 0)
         pygame.draw.line(self.screen, (60, 70, 90), (0, SCREEN_HEIGHT - 40), (SCREEN_WIDTH, SCREEN_HEIGHT - 40), 2)
         
-        font = pygame.font.Font("assets/fonts/default.ttf", 18)
+        font = self.footer_font
         footer_text = font.render("BlackOpsMissionCommand Player Data Dashboard | Press ESC to exit", True, (150, 160, 180))
         self.screen.blit(footer_text, (20, SCREEN_HEIGHT - 30))
         
@@ -18,6 +18,11 @@ class AnalyticsDashboard:
         self.revenue_report = RevenueReport()
         self.player_tracking = PlayerTracking()
         
+        # Fonts are loaded once, not on every frame, and by path: no system font
+        # lookup, so game.assets is not needed here
+        self.tab_font = pygame.font.Font("assets/fonts/default.ttf", 24)
+        self.footer_font = pygame.font.Font("assets/fonts/default.ttf", 18)
+        
         # Set initial state
         self.current_tab = "analytics"
         self.tabs = {
@@ -114,7 +119,7 @@ class AnalyticsDashboard:
             pygame.draw.rect(self.screen, (80, 90, 120), (i * tab_width, 0, tab_width, 60), 2)
             
             # Draw tab text
-            font = pygame.font.Font("assets/fonts/default.ttf", 24)
+            font = self.tab_font
             text = font.render(tab_name, True, TEXT_COLOR)
             self.screen.blit(text, (i * tab_width + tab_width//2 - text.get_width()//2, 20))
             
@@ -127,7 +132,7 @@ class AnalyticsDashboard:
         pygame.draw.rect(self.screen, (30, 35, 45), (0, SCREEN_HEIGHT - 40, SCREEN_WIDTH, 40), 0)
         pygame.draw.line(self.screen, (60, 70, 90), (0, SCREEN_HEIGHT - 40), (SCREEN_WIDTH, SCREEN_HEIGHT - 40), 2)
         
-        font = pygame.font.Font("assets/fonts/default.ttf", 18)
+        font = self.footer_font
         footer_text = font.render("BlackOpsMissionCommand Analytics Dashboard | Press ESC to exit", True, (150, 160, 180))
         self.screen.blit(footer_text, (20, SCREEN_HEIGHT - 30))
         
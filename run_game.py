@@ -89,6 +89,17 @@ def create_default_config():
         'DATE': '2023-01-01'  # Will be updated on first run
     }
     
+    # Frame budget settings
+    config['PERFORMANCE'] = {
+        'PARTICLE_BUDGET_MS': '3.0',
+        'FRAME_BUDGET_MS': '14.0',
+        'PARTICLE_MIN_SCALE': '0.1',
+        'SHOW_PROFILER': 'false',
+        'COMBAT_FPS': '60',
+        'MENU_FPS': '30',
+        'IDLE_WAIT_MS': '1000'
+    }
+    
     with open('config.ini', 'w') as configfile:
         config.write(configfile)
 
@@ -99,6 +110,7 @@ def main():
     parser.add_argument('--resolution', type=str, default="1000x700", 
                         help='Set custom resolution (e.g. 1280x720)')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    parser.add_argument('--seed', type=int, default=None, help='Master RNG seed for reproducible runs')
     args = parser.parse_args()
     
     # Store arguments in environment
@@ -106,6 +118,8 @@ def main():
     os.environ['GAME_FULLSCREEN'] = str(args.fullscreen)
     os.environ['GAME_RESOLUTION'] = args.resolution
     os.environ['GAME_DEBUG'] = str(args.debug)
+    if args.seed is not None:
+        os.environ['GAME_SEED'] = str(args.seed)
     
     try:
         from src.main import main as run_game
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Black Ops: Mission Command - Headless Combat Replay Runner
+"""
+import sys
+import os
+
+def setup_environment():
+    """Make the game package importable without a display"""
+    src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), 'src'))
+    if src_dir not in sys.path:
+        sys.path.insert(0, src_dir)
+    os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
+
+if __name__ == "__main__":
+    setup_environment()
+
+    from game.replay import main
+    sys.exit(main())
@@ -1,13 +1,43 @@
 # Package initialization file
-from .characters import Character, create_team
-from .enemies import Enemy
-from .missions import Mission, create_missions
-from .ui import Button, draw_mission_select_screen, draw_combat_screen, draw_mission_complete_screen, draw_game_over_screen, draw_victory_screen, draw_ad_opportunity_screen
-from .combat import handle_combat_events, enemy_turn
-from .particles import Particle, update_particles
-from .economy import EconomySystem
-from .ads_manager import AdManager
-from .ml_model import AdaptiveGameAI
-from .analytics import Analytics
-from .tutorial import TutorialSystem
-from .ai_agents import AIOrchestrator
+#
+# Names are imported from their submodules on first access (PEP 562), so
+# importing one game module does not pull in the ML model (scikit-learn),
+# the AI agents (schedule) or the UI of every other module.
+import importlib
+
+_EXPORTS = {
+    ".characters": ["Character", "create_team"],
+    ".enemies": ["Enemy"],
+    ".missions": ["Mission", "create_missions"],
+    ".ui": ["Button", "MissionList", "draw_mission_select_screen", "draw_combat_screen", "draw_mission_complete_screen",
+            "draw_game_over_screen", "draw_victory_screen", "draw_ad_opportunity_screen"],
+    ".combat": ["register_combat_regions", "enemy_turn"],
+    ".combat_core": ["CombatState", "run_battle"],
+    ".combat_log": ["CombatLog"],
+    ".batch_sim": ["simulate_mission", "balance_report"],
+    ".particles": ["Particle", "ParticleSystem", "ParticleGovernor", "update_particles"],
+    ".profiler": ["FrameProfiler"],
+    ".screen_layers": ["ScreenLayers"],
+    ".event_router": ["EventRouter"],
+    ".starfield": ["Starfield"],
+    ".economy": ["EconomySystem"],
+    ".ads_manager": ["AdManager"],
+    ".ml_model": ["AdaptiveGameAI"],
+    ".analytics": ["Analytics"],
+    ".tutorial": ["TutorialSystem"],
+    ".ai_agents": ["AIOrchestrator"],
+}
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULE_OF)
+
+def __getattr__(name):
+    module = _MODULE_OF.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
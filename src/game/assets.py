@@ -0,0 +1,124 @@
+"""
+One owner for the game's fonts, glyph atlases and other reusable surfaces.
+
+Resolving a system font by name makes pygame enumerate every installed font
+(fc-list on Linux, the registry on Windows), which is a large part of a cold
+start. The first time a (family, bold, italic) is resolved, the file pygame
+picked is written to FONT_CACHE_PATH; later runs open that file directly and
+never enumerate. Delete the file to pick up newly installed fonts.
+
+Only the game goes through here. The standalone dashboards (dashboard.py,
+dashboard/dashboard.py) do not import the game package; they open their
+bundled .ttf by path, once per dashboard, which involves no font lookup.
+"""
+import os
+import json
+import pygame
+
+FONT_CACHE_PATH = "data/cache/font_paths.json"
+
+# Characters a GlyphAtlas pre-renders by default: enough for numbers and stats
+ATLAS_CHARS = "".join(chr(c) for c in range(32, 127))
+
+class GlyphAtlas:
+    """
+    One pre-rendered surface per character, for text that changes every
+    frame (timers, counters) and would only churn the text cache. Drawing is
+    one blit per character without kerning, which suits numbers and labels.
+    """
+    def __init__(self, font, color, chars=ATLAS_CHARS):
+        self.font = font
+        self.color = color
+        self.glyphs = {char: font.render(char, True, color) for char in chars}
+        self.height = font.get_height()
+
+    def width(self, text):
+        glyphs = self.glyphs
+        return sum(glyphs[char].get_width() for char in text if char in glyphs)
+
+    def draw(self, surface, text, pos):
+        """Blit text with its top-left at pos; characters not in the atlas are skipped"""
+        x, y = pos
+        blits = []
+        for char in text:
+            glyph = self.glyphs.get(char)
+            if glyph is not None:
+                blits.append((glyph, (x, y)))
+                x += glyph.get_width()
+        surface.blits(blits, doreturn=False)
+        return pygame.Rect(pos[0], y, x - pos[0], self.height)
+
+class AssetManager:
+    def __init__(self, font_cache_path=FONT_CACHE_PATH):
+        self.font_cache_path = font_cache_path
+        self.font_paths = None   # "family|bold|italic" -> resolved font file, loaded on first use
+        self.fonts = {}          # (family, size, bold, italic) -> Font
+        self.atlases = {}        # (font, color) -> GlyphAtlas
+        self.surfaces = {}       # caller's key -> Surface
+        self.font_lookups = 0    # fonts resolved through SysFont, i.e. cache misses
+
+    def font(self, family, size, bold=False, italic=False):
+        """The system font family at size, created once and shared"""
+        key = (family, size, bold, italic)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = self.fonts[key] = self.open_font(family, size, bold, italic)
+        return font
+
+    def open_font(self, family, size, bold, italic):
+        if self.font_paths is None:
+            self.font_paths = self.load_font_paths()
+        name = f"{family}|{bold}|{italic}"
+        entry = self.font_paths.get(name)
+        if entry is not None and (entry["path"] is None or os.path.exists(entry["path"])):
+            return pygame.sysfont.font_constructor(entry["path"], size, entry["bold"], entry["italic"])
+
+        # Let SysFont do the lookup and note what it chose
+        chosen = {}
+        def constructor(path, size, set_bold, set_italic):
+            chosen.update(path=path, bold=set_bold, italic=set_italic)
+            return pygame.sysfont.font_constructor(path, size, set_bold, set_italic)
+        font = pygame.font.SysFont(family, size, bold=bold, italic=italic, constructor=constructor)
+        self.font_lookups += 1
+        self.font_paths[name] = chosen
+        self.save_font_paths()
+        return font
+
+    def load_font_paths(self):
+        try:
+            with open(self.font_cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_font_paths(self):
+        try:
+            os.makedirs(os.path.dirname(self.font_cache_path) or ".", exist_ok=True)
+            # Write under a temporary name so a crash never leaves a partial file
+            tmp_path = f"{self.font_cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self.font_paths, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.font_cache_path)
+        except OSError:
+            pass  # Only costs the next start a font lookup
+
+    def glyph_atlas(self, font, color):
+        key = (font, tuple(color))
+        if key not in self.atlases:
+            self.atlases[key] = GlyphAtlas(font, tuple(color))
+        return self.atlases[key]
+
+    def surface(self, key, factory):
+        """Cached surface for key, built by factory() on first request"""
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.surfaces[key] = factory()
+        return surface
+
+    def clear_surfaces(self):
+        self.surfaces.clear()
+        self.atlases.clear()
+
+assets = AssetManager()
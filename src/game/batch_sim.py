@@ -0,0 +1,109 @@
+"""
+Vectorized battle simulator for mission balancing.
+
+Resolves many independent battles at once with the same rules as
+combat_core.run_battle: each round the strongest living operative attacks
+the weakest living enemy, then every living enemy attacks a random living
+operative. Unit health lives in (n_battles, n_units) NumPy arrays and the
+take_damage formula max(0, damage - defense) is applied to the whole batch.
+"""
+import numpy as np
+
+def unit_stats(units):
+    """Return (health, attack, defense) arrays for a list of units"""
+    health = np.array([unit.max_health for unit in units], dtype=np.int32)
+    attack = np.array([unit.attack for unit in units], dtype=np.int32)
+    defense = np.array([unit.defense for unit in units], dtype=np.int32)
+    return health, attack, defense
+
+def simulate_stats(team_stats, enemy_stats, n_battles, rng=None, max_turns=200):
+    """
+    Simulate n_battles fights between two sets of unit stats
+    :param team_stats: (health, attack, defense) arrays for the operatives
+    :param enemy_stats: (health, attack, defense) arrays for the enemies
+    :param rng: numpy Generator or seed for the enemy target picks
+    :return: dict of per-battle arrays: won, lost, turns, damage_taken
+    """
+    rng = np.random.default_rng(rng)
+    team_max, team_atk, team_def = (np.asarray(a) for a in team_stats)
+    enemy_max, enemy_atk, enemy_def = (np.asarray(a) for a in enemy_stats)
+
+    team_hp = np.tile(team_max, (n_battles, 1))
+    enemy_hp = np.tile(enemy_max, (n_battles, 1))
+    active = np.ones(n_battles, dtype=bool)
+    won = np.zeros(n_battles, dtype=bool)
+    lost = np.zeros(n_battles, dtype=bool)
+    turns = np.full(n_battles, max_turns, dtype=np.int32)
+    rows = np.arange(n_battles)
+
+    for turn in range(max_turns):
+        idx = rows[active]
+        if idx.size == 0:
+            break
+        t_hp = team_hp[idx]
+        e_hp = enemy_hp[idx]
+
+        # Player phase: strongest living operative hits the weakest living enemy
+        t_alive = t_hp > 0
+        e_alive = e_hp > 0
+        attacker = np.argmax(np.where(t_alive, team_atk, -1), axis=1)
+        target = np.argmin(np.where(e_alive, e_hp, np.iinfo(np.int32).max), axis=1)
+        can_attack = t_alive.any(axis=1) & e_alive.any(axis=1)
+        damage = np.maximum(0, team_atk[attacker] - enemy_def[target]) * can_attack
+        local = np.arange(idx.size)
+        e_hp[local, target] = np.maximum(0, e_hp[local, target] - damage)
+
+        # Enemy phase: each living enemy hits a random living operative
+        for e in range(enemy_hp.shape[1]):
+            t_alive = t_hp > 0
+            n_alive = t_alive.sum(axis=1)
+            attacking = (e_hp[:, e] > 0) & (n_alive > 0)
+            pick = (rng.random(idx.size) * n_alive).astype(np.int32)
+            target = np.argmax(np.cumsum(t_alive, axis=1) > pick[:, None], axis=1)
+            damage = np.maximum(0, enemy_atk[e] - team_def[target]) * attacking
+            t_hp[local, target] = np.maximum(0, t_hp[local, target] - damage)
+
+        team_hp[idx] = t_hp
+        enemy_hp[idx] = e_hp
+
+        win = (e_hp <= 0).all(axis=1)
+        lose = ~win & (t_hp <= 0).all(axis=1)
+        done = win | lose
+        won[idx[win]] = True
+        lost[idx[lose]] = True
+        # Like CombatState.turn, only rounds the battle continued past are counted
+        turns[idx[done]] = turn
+        active[idx[done]] = False
+
+    return {
+        "won": won,
+        "lost": lost,
+        "turns": turns,
+        "damage_taken": (team_max.sum() - team_hp.sum(axis=1)).astype(np.int32),
+    }
+
+def simulate_mission(mission, team, n_battles, rng=None, max_turns=200):
+    """Simulate n_battles fights of a team against a Mission's enemy list"""
+    return simulate_stats(unit_stats(team), unit_stats(mission.enemies),
+                          n_battles, rng, max_turns)
+
+def summarize(results):
+    """Reduce per-battle arrays to win rate and turns-to-win figures"""
+    won = results["won"]
+    turns_to_win = results["turns"][won]
+    return {
+        "battles": int(won.size),
+        "win_rate": float(won.mean()) if won.size else 0.0,
+        "loss_rate": float(results["lost"].mean()) if won.size else 0.0,
+        "mean_turns_to_win": float(turns_to_win.mean()) if turns_to_win.size else None,
+        "median_turns_to_win": float(np.median(turns_to_win)) if turns_to_win.size else None,
+        "mean_damage_taken": float(results["damage_taken"].mean()) if won.size else 0.0,
+    }
+
+def balance_report(missions, team, n_battles=100000, seed=None, max_turns=200):
+    """Summarize every mission against the given roster"""
+    rng = np.random.default_rng(seed)
+    return {
+        mission.title: summarize(simulate_mission(mission, team, n_battles, rng, max_turns))
+        for mission in missions
+    }
@@ -1,5 +1,8 @@
 import pygame
-import random
+from .rng import get_stream
+from .fonts import fonts
+from .text_cache import render_text
+from .sprites import SpriteCache
 
 # Colors (defined here for Character class)
 BACKGROUND = (15, 25, 45)
@@ -12,13 +15,6 @@ HEALTH_RED = (200, 50, 50)
 LIGHT_BLUE = (100, 180, 255)
 YELLOW = (255, 215, 0)
 
-# Fonts
-title_font = pygame.font.SysFont("Arial", 48, bold=True)
-heading_font = pygame.font.SysFont("Arial", 36, bold=True)
-subtitle_font = pygame.font.SysFont("Arial", 28, bold=True)
-normal_font = pygame.font.SysFont("Arial", 24)
-small_font = pygame.font.SysFont("Arial", 20)
-
 class Character:
     def __init__(self, name, role, health, attack, defense, special_name, special_desc, image_color):
         self.name = name
@@ -35,16 +31,32 @@ class Character:
         self.selected = False
         self.special_cooldown = 0
         self.alive = True
-        self.player_value_score = random.uniform(0.3, 0.9)  # For ad targeting
+        self.player_value_score = get_stream("characters").uniform(0.3, 0.9)  # For ad targeting
+        self.sprite_cache = SpriteCache()
+        
+    def health_bar_width(self, bar_width=100):
+        return max(0, int(bar_width * (self.health / self.max_health)))
         
     def draw(self, surface, x, y, size=80):
+        """Blit the cached sprite for the current size, selection and health"""
         self.x, self.y = x, y
+        health_width = self.health_bar_width()
+        self.sprite_cache.blit(
+            surface, x, y, (size, self.selected), health_width,
+            self.draw_direct, size, health_width
+        )
+        
+    def draw_direct(self, surface, x, y, size=80, health_width=None):
+        """Draw the character with primitives; draw() caches the result"""
+        if health_width is None:
+            health_width = self.health_bar_width()
         pygame.draw.circle(surface, self.image_color, (x, y), size)
         pygame.draw.circle(surface, WHITE, (x, y), size, 3)
         
         # Draw character initials
-        initials = self.name.split()[0][0] + self.name.split()[1][0]
-        text = heading_font.render(initials, True, WHITE)
+        first, last = self.name.split()[:2]
+        initials = first[0] + last[0]
+        text = render_text(fonts.heading, initials, WHITE)
         text_rect = text.get_rect(center=(x, y))
         surface.blit(text, text_rect)
         
@@ -58,17 +70,16 @@ class Character:
         bar_x = x - bar_width//2
         bar_y = y + size + 10
         pygame.draw.rect(surface, HEALTH_RED, (bar_x, bar_y, bar_width, bar_height))
-        health_width = max(0, int(bar_width * (self.health / self.max_health)))
         pygame.draw.rect(surface, HEALTH_GREEN, (bar_x, bar_y, health_width, bar_height))
         pygame.draw.rect(surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
         
         # Draw name
-        name_text = small_font.render(self.name, True, WHITE)
+        name_text = render_text(fonts.small, self.name, WHITE)
         name_rect = name_text.get_rect(center=(x, y - size - 20))
         surface.blit(name_text, name_rect)
         
         # Draw role
-        role_text = small_font.render(self.role, True, LIGHT_BLUE)
+        role_text = render_text(fonts.small, self.role, LIGHT_BLUE)
         role_rect = role_text.get_rect(center=(x, y - size - 5))
         surface.blit(role_text, role_rect)
         
@@ -80,30 +91,30 @@ class Character:
         pygame.draw.rect(surface, LIGHT_GRAY, (x, y, card_width, card_height), 2, 10)
         
         # Draw character info
-        name_text = subtitle_font.render(self.name, True, WHITE)
+        name_text = render_text(fonts.subtitle, self.name, WHITE)
         surface.blit(name_text, (x+20, y+15))
         
-        role_text = normal_font.render(self.role, True, LIGHT_BLUE)
+        role_text = render_text(fonts.normal, self.role, LIGHT_BLUE)
         surface.blit(role_text, (x+20, y+50))
         
         # Draw stats
-        health_text = small_font.render(f"Health: {self.health}/{self.max_health}", True, WHITE)
+        health_text = render_text(fonts.small, f"Health: {self.health}/{self.max_health}", WHITE)
         surface.blit(health_text, (x+20, y+90))
         
-        attack_text = small_font.render(f"Attack: {self.attack}", True, WHITE)
+        attack_text = render_text(fonts.small, f"Attack: {self.attack}", WHITE)
         surface.blit(attack_text, (x+20, y+115))
         
-        defense_text = small_font.render(f"Defense: {self.defense}", True, WHITE)
+        defense_text = render_text(fonts.small, f"Defense: {self.defense}", WHITE)
         surface.blit(defense_text, (x+20, y+140))
         
         # Draw special ability
         pygame.draw.rect(surface, ACCENT, (x+150, y+90, 140, 60), 0, 8)
-        special_title = small_font.render(self.special_name, True, WHITE)
+        special_title = render_text(fonts.small, self.special_name, WHITE)
         surface.blit(special_title, (x+160, y+95))
         
         # Draw cooldown indicator
         if self.special_cooldown > 0:
-            cooldown_text = small_font.render(f"Cooldown: {self.special_cooldown}", True, YELLOW)
+            cooldown_text = render_text(fonts.small, f"Cooldown: {self.special_cooldown}", YELLOW)
             surface.blit(cooldown_text, (x+160, y+135))
         
     def take_damage(self, damage):
@@ -1,76 +1,56 @@
-import pygame
-import math
-import random
-from .particles import Particle
+from . import combat_core
+from .ui import team_slot, enemy_slot
 
-def handle_combat_events(event, mouse_pos, team, enemies, selected_character, player_turn, combat_log, particles):
-    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-        # Character selection
-        selected_character = None
-        for char in team:
-            if not char.alive:
-                continue
-            dist = math.sqrt((char.x - mouse_pos[0])**2 + (char.y - mouse_pos[1])**2)
-            if dist < 80:
-                selected_character = char
-                char.selected = True
-                combat_log.append(f"{char.name} selected")
-            else:
-                char.selected = False
-                
-        # Enemy selection for attack
-        if selected_character:
-            for enemy in enemies:
-                if enemy.health <= 0:
-                    continue
-                dist = math.sqrt((enemy.x - mouse_pos[0])**2 + (enemy.y - mouse_pos[1])**2)
-                if dist < 60:
-                    # Attack
-                    damage = selected_character.attack
-                    actual_damage = enemy.take_damage(damage)
-                    combat_log.append(f"{selected_character.name} attacks {enemy.name} for {actual_damage} damage!")
-                    
-                    # Create particles
-                    for _ in range(20):
-                        particles.append(Particle(enemy.x, enemy.y, (255, 100, 100)))
-                    
-                    # Check if enemy defeated
-                    if enemy.health <= 0:
-                        combat_log.append(f"{enemy.name} defeated!")
-                    
-                    selected_character.selected = False
-                    selected_character = None
-                    return None, False
-    
-    return selected_character, player_turn
+# Click radius around operatives and enemies on the combat screen
+CHARACTER_CLICK_RADIUS = 80
+ENEMY_CLICK_RADIUS = 60
 
-def enemy_turn(enemies, team, combat_log, particles):
-    # Simple AI: enemies attack random alive character
-    for enemy in enemies:
-        if enemy.health > 0:
-            # Find random alive character
-            alive_chars = [char for char in team if char.alive]
-            if not alive_chars:
-                return "lose"
-                
-            target = random.choice(alive_chars)
-            damage = enemy.attack
-            actual_damage = target.take_damage(damage)
-            combat_log.append(f"{enemy.name} attacks {target.name} for {actual_damage} damage!")
-            
-            # Create particles
-            for _ in range(15):
-                particles.append(Particle(target.x, target.y, (255, 100, 100)))
-            
-            if not target.alive:
-                combat_log.append(f"{target.name} is down!")
-    
-    # Check if all enemies defeated
-    if all(enemy.health <= 0 for enemy in enemies):
-        return "win"
-        
-    # Check if all characters down
-    if all(not char.alive for char in team):
-        return "lose"
-        
-    return "continue"
+def spawn_hit_particles(events, particles, count):
+    # Create particles
+    for kind, unit, _ in events:
+        if kind == "hit":
+            particles.emit(unit.x, unit.y, (255, 100, 100), count)
+
+def click_character(state, char):
+    if state.player_turn:
+        combat_core.select_character(state, char)
+
+def click_enemy(state, enemy, particles):
+    if state.player_turn:
+        events = combat_core.player_attack(state, state.selected, enemy)
+        spawn_hit_particles(events, particles, 20)
+
+def click_nothing(state):
+    if state.player_turn:
+        combat_core.select_character(state, None)
+
+def register_combat_regions(router, state, particles, game_state="combat"):
+    """
+    Route clicks on the units of a new combat to their actions, replacing
+    the previous combat's units. Enemies are registered last so that, once
+    an operative is selected, a click where an enemy's circle overlaps an
+    operative's attacks the enemy; with nothing selected enemies are
+    disabled and the operative below is picked.
+    """
+    router.remove_group(game_state, "units")
+    for i, char in enumerate(state.team):
+        router.on_click_circle(
+            game_state, team_slot(i), CHARACTER_CLICK_RADIUS,
+            lambda char=char: click_character(state, char),
+            enabled=lambda char=char: char.alive,
+            group="units"
+        )
+    for i, enemy in enumerate(state.enemies):
+        router.on_click_circle(
+            game_state, enemy_slot(i), ENEMY_CLICK_RADIUS,
+            lambda enemy=enemy: click_enemy(state, enemy, particles),
+            enabled=lambda enemy=enemy: enemy.health > 0 and state.selected is not None,
+            group="units"
+        )
+    router.on_miss(game_state, lambda: click_nothing(state))
+
+def enemy_turn(state, particles):
+    """Run the enemy turn and spawn hit effects; returns win, lose or continue"""
+    result, events = combat_core.enemy_turn(state)
+    spawn_hit_particles(events, particles, 15)
+    return result
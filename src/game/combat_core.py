@@ -0,0 +1,150 @@
+"""
+Headless combat rules.
+
+Everything here works on plain unit objects (anything with name, health,
+max_health, attack, defense and take_damage) and never touches pygame, so a
+battle can be resolved without a display: balance runs, replays and
+server-side validation all drive the same functions as the game UI.
+"""
+import random
+from .rng import streams
+
+class CombatState:
+    def __init__(self, team, enemies, rng=None, log=None, seed=None):
+        """
+        Hold everything needed to resolve one battle
+        :param team: list of Character objects
+        :param enemies: list of Enemy objects
+        :param rng: random.Random used for enemy target picks
+        :param log: list or CombatLog that receives combat log lines
+        :param seed: seed for a fresh combat RNG (drawn from the "combat" stream if omitted)
+        """
+        self.team = team
+        self.enemies = enemies
+        if rng is None:
+            seed = seed if seed is not None else streams.spawn_seed("combat")
+            rng = random.Random(seed)
+        self.seed = seed
+        self.rng = rng
+        self.log = log if log is not None else []
+        self.actions = []  # compact action record for replays
+        self.selected = None
+        self.player_turn = True
+        self.turn = 0
+        self.result = "continue"  # continue, win, lose
+
+    def alive_team(self):
+        return [char for char in self.team if char.alive]
+
+    def alive_enemies(self):
+        return [enemy for enemy in self.enemies if enemy.health > 0]
+
+    def check_result(self):
+        """Update and return the battle outcome"""
+        if all(enemy.health <= 0 for enemy in self.enemies):
+            self.result = "win"
+        elif all(not char.alive for char in self.team):
+            self.result = "lose"
+        else:
+            self.result = "continue"
+        return self.result
+
+def reset_units(team, enemies):
+    """Restore every unit to full health before a new battle"""
+    for char in team:
+        char.health = char.max_health
+        char.alive = True
+        char.selected = False
+        char.special_cooldown = 0
+    for enemy in enemies:
+        enemy.health = enemy.max_health
+
+def select_character(state, character):
+    """Select an operative for the next action (None clears the selection)"""
+    for char in state.team:
+        char.selected = char is character
+    state.selected = character
+    if character is not None:
+        state.actions.append(["s", state.team.index(character)])
+        state.log.append(f"{character.name} selected")
+
+def player_attack(state, attacker, enemy):
+    """
+    Resolve a player attack and hand the turn to the enemies
+    :return: list of ("hit", unit, damage) events for the presentation layer
+    """
+    events = []
+    if not state.player_turn or not attacker.alive or enemy.health <= 0:
+        return events
+
+    state.actions.append(["a", state.team.index(attacker), state.enemies.index(enemy)])
+    actual_damage = enemy.take_damage(attacker.attack)
+    state.log.append(f"{attacker.name} attacks {enemy.name} for {actual_damage} damage!")
+    events.append(("hit", enemy, actual_damage))
+
+    if enemy.health <= 0:
+        state.log.append(f"{enemy.name} defeated!")
+
+    select_character(state, None)
+    state.player_turn = False
+    return events
+
+def enemy_turn(state):
+    """
+    Let every living enemy attack a random living operative
+    :return: (result, events) where result is "win", "lose" or "continue"
+    """
+    events = []
+    state.actions.append(["e"])
+    for enemy in state.enemies:
+        if enemy.health <= 0:
+            continue
+        alive_chars = state.alive_team()
+        if not alive_chars:
+            break
+
+        target = state.rng.choice(alive_chars)
+        actual_damage = target.take_damage(enemy.attack)
+        state.log.append(f"{enemy.name} attacks {target.name} for {actual_damage} damage!")
+        events.append(("hit", target, actual_damage))
+
+        if not target.alive:
+            state.log.append(f"{target.name} is down!")
+
+    result = state.check_result()
+    if result == "continue":
+        state.player_turn = True
+        state.turn += 1
+        # Reduce cooldowns
+        for char in state.team:
+            if char.special_cooldown > 0:
+                char.special_cooldown -= 1
+    return result, events
+
+def choose_attack(state):
+    """
+    Default automated policy: the strongest living operative attacks the
+    weakest living enemy. Used by simulations when no player is present.
+    """
+    attackers = state.alive_team()
+    targets = state.alive_enemies()
+    if not attackers or not targets:
+        return None, None
+    attacker = max(attackers, key=lambda char: char.attack)
+    target = min(targets, key=lambda enemy: enemy.health)
+    return attacker, target
+
+def run_battle(state, policy=choose_attack, max_turns=200):
+    """
+    Resolve a whole battle without any rendering
+    :return: final result ("win", "lose" or "continue" if max_turns ran out)
+    """
+    while state.turn < max_turns:
+        attacker, target = policy(state)
+        if attacker is None:
+            return state.check_result()
+        player_attack(state, attacker, target)
+        result, _ = enemy_turn(state)
+        if result != "continue":
+            return result
+    return state.result
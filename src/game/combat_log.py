@@ -0,0 +1,76 @@
+"""
+Bounded combat log.
+
+The last max_lines lines are kept in a ring buffer, so memory stays flat
+however long a session runs; the full history can optionally be appended
+to a file as lines arrive. A render function given to the log is called
+once per line when it is logged, and the results are kept alongside the
+lines, so drawing the log is only blits. Nothing here needs pygame: the
+renderer is supplied by the UI.
+"""
+import os
+from collections import deque
+
+class CombatLog:
+    def __init__(self, lines=(), max_lines=64, spill_path=None, render=None):
+        """
+        :param lines: initial lines
+        :param max_lines: lines kept in memory
+        :param spill_path: file every line is also appended to, for the full history
+        :param render: function(line) called once per line, e.g. to make its text surface
+        """
+        self.lines = deque(maxlen=max_lines)
+        self.rendered = deque(maxlen=max_lines)
+        self.render = render
+        self.spill_path = spill_path
+        self.spill = None
+        self.total = 0
+        if spill_path is not None:
+            os.makedirs(os.path.dirname(spill_path) or ".", exist_ok=True)
+            self.spill = open(spill_path, "a", buffering=1)  # line buffered
+            self.spill_start = self.spill.tell()  # earlier sessions' lines come before this
+        for line in lines:
+            self.append(line)
+
+    def append(self, line):
+        self.lines.append(line)
+        if self.render is not None:
+            self.rendered.append(self.render(line))
+        if self.spill is not None:
+            self.spill.write(line + "\n")
+        self.total += 1
+
+    def __iter__(self):
+        return iter(self.lines)
+
+    def __len__(self):
+        return len(self.lines)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self.lines)[index]
+        return self.lines[index]
+
+    def tail(self, count):
+        """The last count lines, oldest first"""
+        start = max(0, len(self.lines) - count)
+        return [self.lines[i] for i in range(start, len(self.lines))]
+
+    def rendered_tail(self, count):
+        """What render returned for the last count lines, oldest first"""
+        start = max(0, len(self.rendered) - count)
+        return [self.rendered[i] for i in range(start, len(self.rendered))]
+
+    def history(self):
+        """Every line this log has logged, read back from the spill file when there is one"""
+        if self.spill is None:
+            return list(self.lines)
+        self.spill.flush()
+        with open(self.spill_path) as f:
+            f.seek(self.spill_start)
+            return f.read().splitlines()
+
+    def close(self):
+        if self.spill is not None:
+            self.spill.close()
+            self.spill = None
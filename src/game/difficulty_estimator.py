@@ -0,0 +1,139 @@
+"""
+Monte Carlo difficulty estimator.
+
+Fans batch simulations of every mission out over a process pool. Each chunk
+gets its own SeedSequence child so the random enemy target picks are
+independent across workers and the whole run is reproducible from one seed.
+Chunk results are merged into per-mission win-probability and damage
+distribution tables, and written as a prior AdaptiveGameAI uses to pick a
+starting difficulty.
+"""
+import os
+import json
+import datetime
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .batch_sim import simulate_stats, unit_stats
+from .characters import create_team
+from .missions import create_missions
+
+PRIOR_FILE = "data/models/difficulty_prior.json"
+DAMAGE_PERCENTILES = (10, 25, 50, 75, 90, 99)
+
+def _simulate_chunk(mission_index, team_stats, enemy_stats, n_battles, seed_seq, max_turns):
+    """Worker: run one chunk and return mergeable histograms"""
+    results = simulate_stats(team_stats, enemy_stats, n_battles,
+                             np.random.default_rng(seed_seq), max_turns)
+    won = results["won"]
+    return {
+        "mission": mission_index,
+        "battles": int(won.size),
+        "wins": int(won.sum()),
+        "losses": int(results["lost"].sum()),
+        "turns_to_win": np.bincount(results["turns"][won], minlength=max_turns + 1),
+        "damage": np.bincount(results["damage_taken"],
+                              minlength=int(np.sum(team_stats[0])) + 1),
+    }
+
+def _percentiles(histogram, percentiles):
+    total = histogram.sum()
+    if total == 0:
+        return {f"p{p}": None for p in percentiles}
+    cumulative = np.cumsum(histogram)
+    return {
+        f"p{p}": int(np.searchsorted(cumulative, total * p / 100.0))
+        for p in percentiles
+    }
+
+def _merge(missions, chunks, max_turns, team_total_health):
+    tables = []
+    for index, mission in enumerate(missions):
+        parts = [c for c in chunks if c["mission"] == index]
+        battles = sum(c["battles"] for c in parts)
+        wins = sum(c["wins"] for c in parts)
+        losses = sum(c["losses"] for c in parts)
+        turns = np.sum([c["turns_to_win"] for c in parts], axis=0) if parts else np.zeros(max_turns + 1)
+        damage = np.sum([c["damage"] for c in parts], axis=0) if parts else np.zeros(team_total_health + 1)
+        tables.append({
+            "title": mission.title,
+            "difficulty": mission.difficulty,
+            "battles": battles,
+            "win_probability": wins / battles if battles else 0.0,
+            "loss_probability": losses / battles if battles else 0.0,
+            "mean_turns_to_win": float(np.dot(np.arange(turns.size), turns) / wins) if wins else None,
+            "mean_damage_taken": float(np.dot(np.arange(damage.size), damage) / battles) if battles else 0.0,
+            "damage_percentiles": _percentiles(damage, DAMAGE_PERCENTILES),
+            "damage_histogram": damage.astype(int).tolist(),
+        })
+    return tables
+
+def estimate_difficulty(missions=None, team=None, battles_per_mission=100000,
+                        workers=None, seed=None, max_turns=200, chunks_per_worker=4):
+    """
+    Simulate every mission across a process pool
+    :return: dict with per-mission tables and a by-difficulty win prior
+    """
+    missions = missions if missions is not None else create_missions()
+    team = team if team is not None else create_team()
+    workers = workers or os.cpu_count() or 1
+    team_stats = unit_stats(team)
+
+    # Split each mission into roughly equal chunks, one seed stream per chunk
+    n_chunks = max(1, min(battles_per_mission, workers * chunks_per_worker))
+    sizes = np.full(n_chunks, battles_per_mission // n_chunks)
+    sizes[:battles_per_mission % n_chunks] += 1
+    seed_seq = np.random.SeedSequence(seed)
+    streams = seed_seq.spawn(len(missions) * n_chunks)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for index, mission in enumerate(missions):
+            enemy_stats = unit_stats(mission.enemies)
+            for chunk, size in enumerate(sizes):
+                futures.append(pool.submit(
+                    _simulate_chunk, index, team_stats, enemy_stats, int(size),
+                    streams[index * n_chunks + chunk], max_turns
+                ))
+        chunks = [future.result() for future in futures]
+
+    tables = _merge(missions, chunks, max_turns, int(team_stats[0].sum()))
+
+    # Average the win probability of missions sharing a difficulty rating
+    by_difficulty = {}
+    for table in tables:
+        by_difficulty.setdefault(str(table["difficulty"]), []).append(table["win_probability"])
+
+    return {
+        "generated": datetime.datetime.now().isoformat(),
+        "seed": seed_seq.entropy,
+        "battles_per_mission": battles_per_mission,
+        "workers": workers,
+        "missions": tables,
+        "by_difficulty": {k: float(np.mean(v)) for k, v in by_difficulty.items()},
+    }
+
+def save_prior(prior, path=PRIOR_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(prior, f, indent=2)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Estimate mission difficulty by Monte Carlo simulation")
+    parser.add_argument("--battles", type=int, default=100000, help="Battles per mission")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=None, help="Master seed")
+    parser.add_argument("--max-turns", type=int, default=200, help="Turn limit per battle")
+    parser.add_argument("--out", type=str, default=PRIOR_FILE, help="Output JSON file")
+    args = parser.parse_args(argv)
+
+    prior = estimate_difficulty(battles_per_mission=args.battles, workers=args.workers,
+                                seed=args.seed, max_turns=args.max_turns)
+    save_prior(prior, args.out)
+
+    for table in prior["missions"]:
+        pct = table["damage_percentiles"]
+        print(f"{table['title']:<28} difficulty {table['difficulty']}  "
+              f"win {table['win_probability']:.3f}  "
+              f"damage p50 {pct['p50']} p90 {pct['p90']}")
+    print(f"Prior written to {args.out}")
@@ -1,5 +1,8 @@
 import pygame
 import random
+from .fonts import fonts
+from .text_cache import render_text
+from .sprites import SpriteCache
 
 # Colors
 WHITE = (240, 240, 240)
@@ -7,10 +10,6 @@ HEALTH_GREEN = (50, 200, 80)
 HEALTH_RED = (200, 50, 50)
 LIGHT_BLUE = (100, 180, 255)
 
-# Fonts
-heading_font = pygame.font.SysFont("Arial", 36, bold=True)
-small_font = pygame.font.SysFont("Arial", 20)
-
 class Enemy:
     def __init__(self, name, health, attack, defense, image_color):
         self.name = name
@@ -21,14 +20,26 @@ class Enemy:
         self.image_color = image_color
         self.x = 0
         self.y = 0
+        self.sprite_cache = SpriteCache()
+        
+    def health_bar_width(self, bar_width=80):
+        return max(0, int(bar_width * (self.health / self.max_health)))
         
     def draw(self, surface, x, y, size=60):
+        """Blit the cached sprite for the current size and health"""
         self.x, self.y = x, y
+        health_width = self.health_bar_width()
+        self.sprite_cache.blit(surface, x, y, size, health_width, self.draw_direct, size, health_width)
+        
+    def draw_direct(self, surface, x, y, size=60, health_width=None):
+        """Draw the enemy with primitives; draw() caches the result"""
+        if health_width is None:
+            health_width = self.health_bar_width()
         pygame.draw.rect(surface, self.image_color, (x-size, y-size, size*2, size*2), 0, 10)
         pygame.draw.rect(surface, WHITE, (x-size, y-size, size*2, size*2), 2, 10)
         
         # Draw enemy icon
-        icon_text = heading_font.render("E", True, WHITE)
+        icon_text = render_text(fonts.heading, "E", WHITE)
         icon_rect = icon_text.get_rect(center=(x, y))
         surface.blit(icon_text, icon_rect)
         
@@ -38,12 +49,11 @@ class Enemy:
         bar_x = x - bar_width//2
         bar_y = y + size + 5
         pygame.draw.rect(surface, HEALTH_RED, (bar_x, bar_y, bar_width, bar_height))
-        health_width = max(0, int(bar_width * (self.health / self.max_health)))
         pygame.draw.rect(surface, HEALTH_GREEN, (bar_x, bar_y, health_width, bar_height))
         pygame.draw.rect(surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
         
         # Draw name
-        name_text = small_font.render(self.name, True, WHITE)
+        name_text = render_text(fonts.small, self.name, WHITE)
         name_rect = name_text.get_rect(center=(x, y - size - 15))
         surface.blit(name_text, name_rect)
         
@@ -0,0 +1,110 @@
+"""
+Mouse click routing through a spatial index.
+
+Interactive regions (buttons, units) are registered per game state with the
+handler to run when they are clicked. Each state's regions are bucketed in a
+uniform grid, so a click only tests the few regions in its cell instead of
+every widget on screen. A handler returns the next game state, or None to
+stay in the current one.
+"""
+import pygame
+
+class Region:
+    def __init__(self, rect, handler, radius=None, enabled=None, group=None):
+        """
+        :param rect: clickable area (the bounding box when radius is given)
+        :param handler: function() run on a click, returning the next state or None
+        :param radius: make the region a circle of this radius around rect's centre
+        :param enabled: function() -> bool; disabled regions are clicked through
+        :param group: tag for removing a set of regions together
+        """
+        self.rect = pygame.Rect(rect)
+        self.handler = handler
+        self.radius = radius
+        self.enabled = enabled
+        self.group = group
+
+    def contains(self, pos):
+        if self.radius is None:
+            return self.rect.collidepoint(pos)
+        cx, cy = self.rect.center
+        return (pos[0] - cx) ** 2 + (pos[1] - cy) ** 2 < self.radius ** 2
+
+class SpatialIndex:
+    """Uniform grid of regions; later regions are on top"""
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}    # (column, row) -> [Region]
+        self.regions = []
+
+    def cells_of(self, rect):
+        size = self.cell_size
+        for column in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield column, row
+
+    def insert(self, region):
+        self.regions.append(region)
+        for cell in self.cells_of(region.rect):
+            self.cells.setdefault(cell, []).append(region)
+
+    def remove_group(self, group):
+        regions = [region for region in self.regions if region.group != group]
+        self.cells = {}
+        self.regions = []
+        for region in regions:
+            self.insert(region)
+
+    def query(self, pos):
+        """Topmost enabled region containing pos, or None"""
+        cell = (pos[0] // self.cell_size, pos[1] // self.cell_size)
+        for region in reversed(self.cells.get(cell, ())):
+            if (region.enabled is None or region.enabled()) and region.contains(pos):
+                return region
+        return None
+
+class EventRouter:
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.indexes = {}    # game state -> SpatialIndex
+        self.fallbacks = {}  # game state -> handler for clicks that hit no region
+
+    def index(self, state):
+        if state not in self.indexes:
+            self.indexes[state] = SpatialIndex(self.cell_size)
+        return self.indexes[state]
+
+    def on_click(self, state, rect, handler, radius=None, enabled=None, group=None):
+        """Run handler when rect is left-clicked in state"""
+        region = Region(rect, handler, radius, enabled, group)
+        self.index(state).insert(region)
+        return region
+
+    def on_click_circle(self, state, center, radius, handler, enabled=None, group=None):
+        rect = pygame.Rect(0, 0, 2 * radius, 2 * radius)
+        rect.center = center
+        return self.on_click(state, rect, handler, radius, enabled, group)
+
+    def on_miss(self, state, handler):
+        """Run handler for left clicks in state that hit no region"""
+        self.fallbacks[state] = handler
+
+    def remove_group(self, state, group):
+        self.index(state).remove_group(group)
+
+    def hit(self, state, pos):
+        index = self.indexes.get(state)
+        return index.query(pos) if index is not None else None
+
+    def dispatch(self, state, event):
+        """
+        Route a left click to its region's handler
+        :return: the handler's result (the next state, or None)
+        """
+        if not (event.type == pygame.MOUSEBUTTONDOWN and event.button == 1):
+            return None
+        region = self.hit(state, event.pos)
+        if region is not None:
+            return region.handler()
+        fallback = self.fallbacks.get(state)
+        return fallback() if fallback is not None else None
@@ -0,0 +1,38 @@
+"""
+Fonts shared by every game module, created on first use.
+
+pygame.font.SysFont scans the installed fonts, so each font is built once,
+the first time anything asks for it, instead of by every module at import
+time. Importing a game module therefore needs neither pygame.font.init()
+nor any font lookups. The fonts themselves come from the asset manager,
+which remembers resolved font files across runs.
+"""
+from .assets import assets
+
+# name -> (family, size, bold)
+FONT_SPECS = {
+    "title": ("Arial", 48, True),
+    "heading": ("Arial", 36, True),
+    "subtitle": ("Arial", 28, True),
+    "normal": ("Arial", 24, False),
+    "small": ("Arial", 20, False),
+}
+
+class FontRegistry:
+    """fonts.small, fonts.title, ... are created on first access and then kept"""
+    def __init__(self, specs=FONT_SPECS):
+        self.specs = dict(specs)
+
+    def __getattr__(self, name):
+        specs = self.__dict__.get("specs", {})
+        if name not in specs:
+            raise AttributeError(f"No font named {name!r}")
+        font = self.get(*specs[name])
+        setattr(self, name, font)
+        return font
+
+    def get(self, family, size, bold=False):
+        """A font outside FONT_SPECS, shared like the named ones"""
+        return assets.font(family, size, bold)
+
+fonts = FontRegistry()
@@ -0,0 +1,44 @@
+import pygame
+
+class FrameScheduler:
+    """
+    Paces the main loop per game state.
+
+    While something is animating the loop runs at the state's target FPS
+    (clock.tick sleeps out the rest of the frame). When nothing is, there is
+    no point drawing again until something happens, so the loop blocks in
+    pygame.event.wait instead: it wakes the moment input arrives, and
+    otherwise every idle_wait_ms so slow-changing things still refresh.
+    """
+    def __init__(self, state_fps=None, default_fps=30, idle_wait_ms=1000):
+        """
+        :param state_fps: {game_state: target FPS while animating}
+        :param default_fps: target for states not in state_fps
+        """
+        self.state_fps = dict(state_fps or {})
+        self.default_fps = default_fps
+        self.idle_wait_ms = idle_wait_ms
+        self.clock = pygame.time.Clock()
+        self.pending = []  # the event that ended an idle wait
+        self.idle_frames = 0
+
+    def target_fps(self, game_state):
+        return self.state_fps.get(game_state, self.default_fps)
+
+    def events(self):
+        """This frame's events, including one that woke an idle wait"""
+        events = self.pending + pygame.event.get()
+        self.pending = []
+        return events
+
+    def wait(self, game_state, animating):
+        """Sleep until the next frame is due; call once at the end of every frame"""
+        if animating:
+            self.clock.tick(self.target_fps(game_state))
+            return
+        self.idle_frames += 1
+        event = pygame.event.wait(self.idle_wait_ms)
+        if event.type != pygame.NOEVENT:
+            self.pending.append(event)
+        # Keep the clock from counting the idle time as one long frame
+        self.clock.tick()
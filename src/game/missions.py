@@ -1,6 +1,8 @@
 import pygame
 import random
 from .enemies import Enemy
+from .fonts import fonts
+from .text_cache import render_text
 
 # Colors
 ACCENT = (0, 150, 200)
@@ -11,11 +13,6 @@ GREEN_ACCENT = (50, 200, 100)
 YELLOW = (255, 215, 0)
 LIGHT_BLUE = (100, 180, 255)
 
-# Fonts
-subtitle_font = pygame.font.SysFont("Arial", 28, bold=True)
-normal_font = pygame.font.SysFont("Arial", 24)
-small_font = pygame.font.SysFont("Arial", 20)
-
 class Mission:
     def __init__(self, title, description, location, difficulty, enemies):
         self.title = title
@@ -33,20 +30,20 @@ class Mission:
         pygame.draw.rect(surface, LIGHT_GRAY, (x, y, width, height), 2, 15)
         
         # Draw title
-        title_text = subtitle_font.render(self.title, True, WHITE)
+        title_text = render_text(fonts.subtitle, self.title, WHITE)
         surface.blit(title_text, (x+20, y+15))
         
         # Draw location
-        loc_text = normal_font.render(f"Location: {self.location}", True, LIGHT_BLUE)
+        loc_text = render_text(fonts.normal, f"Location: {self.location}", LIGHT_BLUE)
         surface.blit(loc_text, (x+20, y+55))
         
         # Draw difficulty
-        diff_text = normal_font.render(f"Difficulty: {'★' * self.difficulty}", True, YELLOW)
+        diff_text = render_text(fonts.normal, f"Difficulty: {'★' * self.difficulty}", YELLOW)
         surface.blit(diff_text, (x+20, y+85))
         
         # Draw status
-        status_text = normal_font.render("COMPLETED" if self.completed else "IN PROGRESS" if is_current else "AVAILABLE", 
-                                       True, GREEN_ACCENT if self.completed else YELLOW if is_current else LIGHT_BLUE)
+        status_text = render_text(fonts.normal, "COMPLETED" if self.completed else "IN PROGRESS" if is_current else "AVAILABLE", 
+                                  GREEN_ACCENT if self.completed else YELLOW if is_current else LIGHT_BLUE)
         surface.blit(status_text, (x+width-150, y+15))
 
 def create_missions():
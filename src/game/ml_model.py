@@ -9,7 +9,9 @@ import numpy as np
 class AdaptiveGameAI:
     def __init__(self):
         self.model_file = "data/models/player_behavior_model.pkl"
+        self.prior_file = "data/models/difficulty_prior.json"
         self.model = self.load_model()
+        self.difficulty_prior = self.load_difficulty_prior()
         self.player_data = []
         
     def load_model(self):
@@ -17,6 +19,13 @@ class AdaptiveGameAI:
             return joblib.load(self.model_file)
         return None
     
+    def load_difficulty_prior(self):
+        """Load simulated win rates per difficulty (see run_balance.py), used by starting_difficulty"""
+        if os.path.exists(self.prior_file):
+            with open(self.prior_file, "r") as f:
+                return json.load(f).get("by_difficulty", {})
+        return {}
+    
     def collect_data(self, player_id, action, success, difficulty):
         """Collect player behavior data for ML training"""
         self.player_data.append({
@@ -69,7 +78,6 @@ class AdaptiveGameAI:
         """Adjust game difficulty based on player performance"""
         if not self.model:
             return current_difficulty
-        
         # Predict player success probability
         proba = self.model.predict_proba([[player_id, current_difficulty]])[0][1]
         
@@ -81,6 +89,18 @@ class AdaptiveGameAI:
             return min(10, current_difficulty + 1)
         return current_difficulty
     
+    def starting_difficulty(self, default=1, target=0.5):
+        """
+        Pick a first difficulty from the simulated prior: the hardest one the
+        scripted team still wins at least target of the time. The prior is a
+        fixed policy's win rate, close to 0 or 1 per difficulty, so it is not
+        a player success probability and adjust_difficulty does not use it.
+        """
+        if not self.difficulty_prior:
+            return default
+        winnable = [int(d) for d, p in self.difficulty_prior.items() if p >= target]
+        return max(winnable) if winnable else min(int(d) for d in self.difficulty_prior)
+    
     def generate_addictive_content(self, player_id):
         """Generate content to keep player engaged"""
         # In a real implementation, this would use player behavior data
@@ -1,25 +1,257 @@
 import pygame
-import random
+import numpy as np
+from .rng import get_stream, streams
+
+_rng = get_stream("particles")
+
+MAX_RADIUS = 6  # Particles start at size 2-6 and only shrink
+
+# ParticleSystem's per-particle arrays
+FIELDS = ("pos", "vel", "size", "life", "color")
 
 class Particle:
     def __init__(self, x, y, color):
         self.x = x
         self.y = y
         self.color = color
-        self.size = random.randint(2, 6)
-        self.speed_x = random.uniform(-3, 3)
-        self.speed_y = random.uniform(-3, 3)
-        self.life = random.randint(20, 40)
-        
+        self.size = _rng.randint(2, 6)
+        self.speed_x = _rng.uniform(-3, 3)
+        self.speed_y = _rng.uniform(-3, 3)
+        self.life = _rng.randint(20, 40)
+
     def update(self):
         self.x += self.speed_x
         self.y += self.speed_y
         self.life -= 1
         self.size = max(0, self.size - 0.1)
         return self.life > 0
-        
+
     def draw(self, surface):
         pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), int(self.size))
 
 def update_particles(particles):
     return [p for p in particles if p.update()]
+
+class ParticleAtlas:
+    """Pre-rendered circle sprites, one per (palette colour, radius)"""
+    def __init__(self, max_radius=MAX_RADIUS):
+        self.max_radius = max_radius
+        self.sprites = []  # index: color_id * (max_radius + 1) + radius
+
+    def add_color(self, color):
+        for radius in range(self.max_radius + 1):
+            self.sprites.append(self.render(color, radius))
+
+    def render(self, color, radius):
+        """Same pixels as pygame.draw.circle centred on the sprite"""
+        size = 2 * radius + 1
+        key = (0, 0, 0) if tuple(color) != (0, 0, 0) else (255, 0, 255)
+        sprite = pygame.Surface((size, size))
+        sprite.fill(key)
+        if radius > 0:
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+        if pygame.display.get_surface() is not None:
+            # Matching the display format avoids a conversion on every blit
+            sprite = sprite.convert()
+        sprite.set_colorkey(key, pygame.RLEACCEL)
+        return sprite
+
+class ParticleGovernor:
+    """
+    Keeps particle work (update + draw) within budget_ms per frame, and the
+    whole frame within frame_budget_ms, by scaling emission counts and
+    lifetimes down when over budget and letting them recover when there is
+    headroom. When a frame runs over, a matching share of the live particles
+    is culled so the cost drops on the next frame instead of when the
+    current particles expire.
+    """
+    def __init__(self, budget_ms=3.0, frame_budget_ms=None, min_scale=0.1,
+                 headroom=0.75, recovery=1.05):
+        self.budget_ms = budget_ms
+        self.frame_budget_ms = frame_budget_ms
+        self.min_scale = min_scale
+        self.headroom = headroom
+        self.recovery = recovery
+        self.scale = 1.0
+        self.load = 0.0  # measured cost / budget, > 1 means over budget
+        self.requested = 0
+        self.emitted = 0
+        self.culled = 0
+
+    def observe(self, particle_ms, frame_ms=None):
+        """Feed the last frame's measured times; call once per frame"""
+        load = particle_ms / self.budget_ms
+        if self.frame_budget_ms and frame_ms:
+            load = max(load, frame_ms / self.frame_budget_ms)
+        self.load = load
+        if load > 1:
+            # Particle cost is roughly linear in count
+            self.scale = max(self.min_scale, self.scale / load)
+        elif load < self.headroom:
+            self.scale = min(1.0, self.scale * self.recovery)
+
+    def emission(self, count, rng):
+        """Scaled spawn count, rounded stochastically so small bursts are not always lost"""
+        scaled = count * self.scale
+        allowed = int(scaled) + (rng.random() < scaled - int(scaled))
+        self.requested += count
+        self.emitted += allowed
+        return allowed
+
+    @property
+    def lifetime_scale(self):
+        return 0.5 + 0.5 * self.scale
+
+    def cull_keep_fraction(self):
+        """Share of live particles to keep this frame"""
+        return 1.0 / self.load if self.load > 1 else 1.0
+
+    def stats(self):
+        return {
+            "scale": round(self.scale, 3),
+            "load": round(self.load, 3),
+            "requested": self.requested,
+            "emitted": self.emitted,
+            "decimated": self.requested - self.emitted,
+            "culled": self.culled,
+        }
+
+class ParticleSystem:
+    """
+    Particles stored as a structure of NumPy arrays.
+
+    Live particles are packed at the front of preallocated arrays and the
+    free pool is the tail, so emitting is one slice assignment per field and
+    an update is one vectorized step that gathers survivors into
+    preallocated scratch arrays, so a frame makes no per-field copies.
+    Capacity doubles when a burst needs more room, up to max_capacity;
+    particles beyond that are dropped.
+
+    Colours are kept as indices into a small palette, which is also the
+    row of each particle's sprite in the atlas used by draw.
+    """
+    def __init__(self, capacity=1024, max_capacity=65536, seed=None, governor=None):
+        self.count = 0
+        self.governor = governor
+        self.max_capacity = max_capacity
+        self.dropped = 0
+        seed = seed if seed is not None else streams.spawn_seed("particles")
+        self.rng = np.random.default_rng(seed)
+        self.palette = {}  # (r, g, b) -> color id
+        self.atlas = ParticleAtlas()
+        self.allocate(capacity)
+
+    def allocate(self, capacity):
+        """(Re)allocate the arrays, keeping live particles"""
+        n = self.count
+        old = getattr(self, "pos", None)
+        pos = np.zeros((capacity, 2), dtype=np.float32)
+        vel = np.zeros((capacity, 2), dtype=np.float32)
+        size = np.zeros(capacity, dtype=np.float32)
+        life = np.zeros(capacity, dtype=np.int16)
+        color = np.zeros(capacity, dtype=np.uint16)
+        if old is not None:
+            pos[:n], vel[:n], size[:n] = self.pos[:n], self.vel[:n], self.size[:n]
+            life[:n], color[:n] = self.life[:n], self.color[:n]
+        self.pos, self.vel, self.size, self.life, self.color = pos, vel, size, life, color
+        # Compaction gathers survivors into these and swaps them with the fields
+        self.scratch = {field: np.zeros_like(getattr(self, field)) for field in FIELDS}
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.capacity = capacity
+
+    def color_id(self, color):
+        color = tuple(color[:3])
+        if color not in self.palette:
+            self.palette[color] = len(self.palette)
+            self.atlas.add_color(color)
+        return self.palette[color]
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, x, y, color, count):
+        """Spawn count particles at (x, y) with random speed, size and lifetime"""
+        life_scale = 1.0
+        if self.governor is not None:
+            count = self.governor.emission(count, self.rng)
+            life_scale = self.governor.lifetime_scale
+        free = self.capacity - self.count
+        if count > free and self.capacity < self.max_capacity:
+            capacity = self.capacity
+            while capacity - self.count < count and capacity < self.max_capacity:
+                capacity *= 2
+            self.allocate(min(capacity, self.max_capacity))
+        accepted = min(count, self.capacity - self.count)
+        self.dropped += count - accepted
+        if accepted <= 0:
+            return 0
+
+        s = slice(self.count, self.count + accepted)
+        self.pos[s] = (x, y)
+        self.vel[s] = self.rng.uniform(-3, 3, (accepted, 2))
+        self.size[s] = self.rng.integers(2, 7, accepted)
+        self.life[s] = np.maximum(1, self.rng.integers(20, 41, accepted) * life_scale)
+        self.color[s] = self.color_id(color)
+        self.count += accepted
+        return accepted
+
+    def update(self):
+        """Advance every particle one frame and compact out the dead ones"""
+        n = self.count
+        if not n:
+            return
+        self.pos[:n] += self.vel[:n]
+        self.life[:n] -= 1
+        size = self.size[:n]
+        np.subtract(size, 0.1, out=size)
+        np.maximum(size, 0, out=size)
+
+        alive = np.greater(self.life[:n], 0, out=self.alive[:n])
+        if self.governor is not None and self.governor.load > 1:
+            survivors = int(np.count_nonzero(alive))
+            alive &= self.rng.random(n) < self.governor.cull_keep_fraction()
+            self.governor.culled += survivors - int(np.count_nonzero(alive))
+        live = int(np.count_nonzero(alive))
+        if live < n:
+            # Gather survivors into the scratch arrays, which then become the
+            # fields; the old fields are the next compaction's scratch
+            keep = np.flatnonzero(alive)
+            for field in FIELDS:
+                values, scratch = getattr(self, field), self.scratch[field]
+                np.take(values[:n], keep, axis=0, out=scratch[:live])
+                setattr(self, field, scratch)
+                self.scratch[field] = values
+        self.count = live
+
+    def clear(self):
+        self.count = 0
+
+    def stats(self):
+        stats = {"live": self.count, "capacity": self.capacity, "dropped": self.dropped}
+        if self.governor is not None:
+            stats.update(self.governor.stats())
+        return stats
+
+    def draw(self, surface):
+        """Blit every particle's pre-rendered sprite in one Surface.blits call"""
+        n = self.count
+        radius = np.minimum(self.size[:n].astype(np.int32), self.atlas.max_radius)
+        shown = radius > 0
+        radius = radius[shown]
+        sprite_ids = (self.color[:n][shown] * (self.atlas.max_radius + 1) + radius).tolist()
+        topleft = self.pos[:n][shown].astype(np.int32) - radius[:, None]
+        # Zipping flat lists builds the (x, y) tuples much faster than a nested tolist()
+        destinations = zip(topleft[:, 0].tolist(), topleft[:, 1].tolist())
+        sprites = self.atlas.sprites
+        surface.blits(zip(map(sprites.__getitem__, sprite_ids), destinations), doreturn=False)
+
+    def draw_circles(self, surface):
+        """Reference path: one pygame.draw.circle per particle"""
+        n = self.count
+        positions = self.pos[:n].astype(np.int32).tolist()
+        radii = self.size[:n].astype(np.int32).tolist()
+        colors = list(self.palette)
+        color_ids = self.color[:n].tolist()
+        for pos, radius, color_id in zip(positions, radii, color_ids):
+            if radius > 0:
+                pygame.draw.circle(surface, colors[color_id], pos, radius)
@@ -0,0 +1,77 @@
+import time
+import configparser
+from contextlib import contextmanager
+
+def load_performance_config(path="config.ini"):
+    """[PERFORMANCE] settings with defaults for anything missing"""
+    config = configparser.ConfigParser()
+    config.read(path)
+    return {
+        "particle_budget_ms": config.getfloat("PERFORMANCE", "PARTICLE_BUDGET_MS", fallback=3.0),
+        "frame_budget_ms": config.getfloat("PERFORMANCE", "FRAME_BUDGET_MS", fallback=14.0),
+        "particle_min_scale": config.getfloat("PERFORMANCE", "PARTICLE_MIN_SCALE", fallback=0.1),
+        "show_profiler": config.getboolean("PERFORMANCE", "SHOW_PROFILER", fallback=False),
+        "combat_fps": config.getint("PERFORMANCE", "COMBAT_FPS", fallback=60),
+        "menu_fps": config.getint("PERFORMANCE", "MENU_FPS", fallback=30),
+        "idle_wait_ms": config.getint("PERFORMANCE", "IDLE_WAIT_MS", fallback=1000),
+    }
+
+class FrameProfiler:
+    """
+    Per-frame timings of named sections of the main loop.
+
+    Wrap work in `with profiler.section("particles"):` between begin_frame()
+    and end_frame(); a section entered several times in one frame adds up.
+    Frame time is the work between begin_frame and end_frame, so it does not
+    include the sleep in clock.tick.
+    """
+    def __init__(self, smoothing=0.1):
+        self.smoothing = smoothing
+        self.frames = 0
+        self.frame_ms = 0.0       # smoothed
+        self.last_frame_ms = 0.0
+        self.averages = {}        # name -> smoothed ms per frame
+        self.current = {}         # name -> ms so far this frame
+        self.last = {}            # name -> ms in the last finished frame
+        self.frame_start = None
+
+    def begin_frame(self):
+        self.frame_start = time.perf_counter()
+        self.current = {}
+
+    @contextmanager
+    def section(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.current[name] = self.current.get(name, 0.0) + elapsed
+
+    def end_frame(self):
+        if self.frame_start is None:
+            return
+        self.last_frame_ms = (time.perf_counter() - self.frame_start) * 1000
+        self.last = self.current
+        if self.frames == 0:
+            self.frame_ms = self.last_frame_ms
+            self.averages = dict(self.current)
+        else:
+            a = self.smoothing
+            self.frame_ms += a * (self.last_frame_ms - self.frame_ms)
+            # Sections skipped this frame decay towards zero
+            for name in set(self.averages) | set(self.current):
+                average = self.averages.get(name, 0.0)
+                self.averages[name] = average + a * (self.current.get(name, 0.0) - average)
+        self.frames += 1
+        self.frame_start = None
+
+    def average(self, name):
+        return self.averages.get(name, 0.0)
+
+    def report(self):
+        """Lines for an on-screen overlay, slowest section first"""
+        lines = [f"frame {self.frame_ms:5.2f} ms"]
+        for name, ms in sorted(self.averages.items(), key=lambda item: -item[1]):
+            lines.append(f"  {name:<12} {ms:5.2f} ms")
+        return lines
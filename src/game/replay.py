@@ -0,0 +1,92 @@
+"""
+Combat replays.
+
+A replay is the mission index, the combat RNG seed and the compact action
+list recorded on CombatState.actions:
+
+    ["s", char]          select an operative
+    ["a", char, enemy]   operative attacks enemy
+    ["e"]                enemy turn
+
+Replays are stored one JSON object per line and re-executed headless with
+combat_core, which reproduces the fight exactly.
+"""
+import os
+import json
+import datetime
+import argparse
+from . import combat_core
+from .characters import create_team
+from .missions import create_missions
+
+REPLAY_DIR = "data/replays"
+REPLAY_VERSION = 1
+
+def make_replay(state, mission_index):
+    """Build a replay record from a won or lost combat"""
+    return {
+        "version": REPLAY_VERSION,
+        "mission": mission_index,
+        "seed": state.seed,
+        "actions": state.actions,
+        "result": state.result,
+        "timestamp": datetime.datetime.now().isoformat(),
+    }
+
+def save_replay(replay, player_id="default"):
+    """Append a replay to the player's replay log"""
+    os.makedirs(REPLAY_DIR, exist_ok=True)
+    path = os.path.join(REPLAY_DIR, f"{player_id}.jsonl")
+    with open(path, "a") as f:
+        f.write(json.dumps(replay, separators=(",", ":")) + "\n")
+    return path
+
+def load_replays(path):
+    with open(path, "r") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def run_replay(replay, team=None, missions=None):
+    """
+    Re-execute a recorded combat without rendering
+    :return: the final CombatState
+    """
+    team = team if team is not None else create_team()
+    missions = missions if missions is not None else create_missions()
+    enemies = missions[replay["mission"]].enemies
+    combat_core.reset_units(team, enemies)
+    state = combat_core.CombatState(team, enemies, seed=replay["seed"])
+
+    for action in replay["actions"]:
+        kind = action[0]
+        if kind == "s":
+            combat_core.select_character(state, team[action[1]])
+        elif kind == "a":
+            combat_core.player_attack(state, team[action[1]], enemies[action[2]])
+        elif kind == "e":
+            combat_core.enemy_turn(state)
+        else:
+            raise ValueError(f"Unknown replay action: {action!r}")
+    return state
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-run recorded combats headless")
+    parser.add_argument("path", help="Replay log (.jsonl)")
+    parser.add_argument("--index", type=int, default=None, help="Only run this replay")
+    parser.add_argument("--log", action="store_true", help="Print the combat log")
+    args = parser.parse_args(argv)
+
+    replays = load_replays(args.path)
+    if args.index is not None:
+        replays = [replays[args.index]]
+
+    mismatches = 0
+    for i, replay in enumerate(replays):
+        state = run_replay(replay)
+        status = "ok" if state.result == replay["result"] else "MISMATCH"
+        mismatches += status != "ok"
+        print(f"#{i} mission {replay['mission']} seed {replay['seed']}: "
+              f"{state.result} after {len(replay['actions'])} actions [{status}]")
+        if args.log:
+            for line in state.log:
+                print(f"    {line}")
+    return 1 if mismatches else 0
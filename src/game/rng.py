@@ -0,0 +1,45 @@
+"""
+Named random streams for each game subsystem.
+
+Every subsystem (combat, particles, characters, background, ...) draws from
+its own random.Random whose seed is derived from one master seed, so a run
+can be reproduced by setting GAME_SEED and one subsystem consuming more
+numbers never shifts another subsystem's sequence.
+"""
+import os
+import random
+import hashlib
+
+class RNGStreams:
+    def __init__(self, seed=None):
+        self.seed = None
+        self.streams = {}
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """Reseed every stream in place (existing references stay valid)"""
+        if seed is None:
+            seed = random.SystemRandom().randrange(2**63)
+        self.seed = int(seed)
+        for name, stream in self.streams.items():
+            stream.seed(self.derive_seed(name))
+
+    def derive_seed(self, name):
+        digest = hashlib.sha256(f"{self.seed}:{name}".encode()).digest()
+        return int.from_bytes(digest[:8], "little")
+
+    def stream(self, name):
+        """Return the random.Random for a subsystem, creating it on first use"""
+        if name not in self.streams:
+            self.streams[name] = random.Random(self.derive_seed(name))
+        return self.streams[name]
+
+    def spawn_seed(self, name):
+        """Draw a fresh 63-bit seed from a stream, e.g. one per combat"""
+        return self.stream(name).getrandbits(63)
+
+_env_seed = os.environ.get("GAME_SEED")
+streams = RNGStreams(int(_env_seed) if _env_seed else None)
+
+def get_stream(name):
+    return streams.stream(name)
@@ -0,0 +1,94 @@
+"""
+Retained drawing for screens that are mostly static.
+
+A screen's static content (backdrop, titles, cards, the buttons in their
+idle look) is drawn once into a background surface and reused until its key
+changes. Buttons are drawn over it and redrawn only when their hover state
+changes, and only the rectangles that changed are sent to
+pygame.display.update, so an idle menu costs next to nothing per frame.
+"""
+import pygame
+
+# Buttons baked into a background are drawn as if the mouse were nowhere
+NO_MOUSE = (-1, -1)
+
+class ScreenLayers:
+    def __init__(self, screen, backdrop=None):
+        """
+        :param screen: the display surface
+        :param backdrop: function(surface) drawn under every background
+        """
+        self.screen = screen
+        self.backdrop = backdrop
+        self.background = screen.copy()
+        self.key = None
+        self.widgets = []
+        self.hovered = []
+        self.overlay_rect = None
+        self.dirty = []
+        self.rebuilds = 0
+
+    def invalidate(self):
+        """Redraw everything on the next update, e.g. after the screen was drawn directly"""
+        self.key = None
+        self.overlay_rect = None
+
+    def update(self, key, widgets, mouse_pos, draw, *args):
+        """
+        Bring the screen up to date for this frame
+        :param key: changes whenever the static content does, e.g. (game_state, tokens)
+        :param widgets: buttons drawn over the background
+        :param draw: draw(surface, *args) draws the static content; only called on a rebuild
+        """
+        if key != self.key or widgets != self.widgets:
+            self.rebuild(key, widgets, mouse_pos, draw, *args)
+            return
+
+        for i, widget in enumerate(widgets):
+            hovered = widget.check_hover(mouse_pos)
+            if hovered != self.hovered[i]:
+                self.hovered[i] = hovered
+                self.restore(widget.rect)
+
+    def rebuild(self, key, widgets, mouse_pos, draw, *args):
+        if self.backdrop is not None:
+            self.backdrop(self.background)
+        draw(self.background, *args)
+        self.key = key
+        self.widgets = list(widgets)
+        self.hovered = [widget.check_hover(mouse_pos) for widget in widgets]
+
+        self.screen.blit(self.background, (0, 0))
+        for widget in self.widgets:
+            widget.draw(self.screen)
+        self.overlay_rect = None
+        self.dirty = [self.screen.get_rect()]
+        self.rebuilds += 1
+
+    def restore(self, rect):
+        """Redraw the background and any widgets under rect and mark it dirty"""
+        self.screen.blit(self.background, rect, rect)
+        for widget in self.widgets:
+            if widget.rect.colliderect(rect):
+                widget.draw(self.screen)
+        self.dirty.append(pygame.Rect(rect))
+
+    def draw_overlay(self, draw, *args):
+        """Draw something that changes every frame on top; draw(surface, *args) returns its Rect"""
+        if self.overlay_rect is not None:
+            self.restore(self.overlay_rect)
+        self.overlay_rect = draw(self.screen, *args)
+        self.dirty.append(self.overlay_rect)
+
+    def clear_overlay(self):
+        if self.overlay_rect is not None:
+            self.restore(self.overlay_rect)
+            self.overlay_rect = None
+
+    def present(self):
+        """Send the changed parts of the screen to the display; returns how many rects were sent"""
+        dirty = self.dirty
+        if dirty:
+            pygame.display.update(dirty)
+            self.dirty = []
+        return len(dirty)
@@ -0,0 +1,58 @@
+"""
+Rasterized unit sprites.
+
+A unit's look (body, initials, name, health bar, selection ring) only
+changes with its size, selection and health, so it is drawn once per such
+state into a transparent surface and afterwards drawn with a single blit.
+"""
+import pygame
+
+# Room around a unit's body for its name above and health bar below
+SPRITE_MARGIN = (400, 100)
+
+def rasterize(draw, size, *args):
+    """
+    Render draw(surface, x, y, size, *args), which draws a unit centred on
+    (x, y), into a surface cropped to what it drew
+    :return: (sprite, offset of the sprite's top-left from the unit's centre)
+    """
+    width, height = 2 * size + SPRITE_MARGIN[0], 2 * size + SPRITE_MARGIN[1]
+    scratch = pygame.Surface((width, height), pygame.SRCALPHA)
+    draw(scratch, width // 2, height // 2, size, *args)
+    bounds = scratch.get_bounding_rect()
+    sprite = scratch.subsurface(bounds).copy()
+    if pygame.display.get_surface() is not None:
+        sprite = sprite.convert_alpha()
+    # Run-length encoding skips the transparent and opaque runs, making the
+    # blit several times cheaper than drawing the unit directly
+    sprite.set_alpha(255, pygame.RLEACCEL)
+    return sprite, (bounds.x - width // 2, bounds.y - height // 2)
+
+class SpriteCache:
+    """
+    A unit's sprites keyed by visual state, e.g. (size, selected). All of
+    them show the same health, so a change of health drops them all.
+    """
+    def __init__(self):
+        self.sprites = {}  # state -> (sprite, offset)
+        self.health = None
+        self.renders = 0
+
+    def get(self, state, health, draw, size, *args):
+        if health != self.health:
+            self.sprites.clear()
+            self.health = health
+        entry = self.sprites.get(state)
+        if entry is None:
+            entry = self.sprites[state] = rasterize(draw, size, *args)
+            self.renders += 1
+        return entry
+
+    def blit(self, surface, x, y, state, health, draw, size, *args):
+        """Draw the unit centred on (x, y), rendering its sprite first if needed"""
+        sprite, (dx, dy) = self.get(state, health, draw, size, *args)
+        surface.blit(sprite, (x + dx, y + dy))
+
+    def clear(self):
+        self.sprites.clear()
+        self.health = None
@@ -0,0 +1,82 @@
+import math
+import pygame
+from .rng import get_stream
+
+# (scroll speed in px per frame, star count, radius, colour), far to near
+STAR_LAYERS = (
+    (0.1, 40, 1, (60, 90, 130)),
+    (0.25, 25, 2, (100, 150, 200)),
+    (0.5, 10, 3, (170, 200, 235)),
+)
+TWINKLE_FRAMES = 90   # length of one twinkle cycle
+TWINKLE_LEVELS = 8    # pre-rendered brightness steps per layer
+
+# Brightness level for each frame of the cycle
+TWINKLE_TABLE = [
+    round((TWINKLE_LEVELS - 1) * (0.5 + 0.5 * math.sin(2 * math.pi * i / TWINKLE_FRAMES)))
+    for i in range(TWINKLE_FRAMES)
+]
+
+class Starfield:
+    """
+    Decorative parallax starfield, rendered once and animated with blits.
+
+    Each layer's stars live on one screen-sized colour-keyed surface that
+    scrolls left at the layer's speed, wrapping with two blits. A few stars
+    per layer twinkle: their brightness comes from TWINKLE_TABLE and each
+    brightness level is a pre-rendered sprite, so every frame costs the same
+    fixed number of blits however long the game runs.
+    """
+    def __init__(self, size, layers=STAR_LAYERS, twinkling=4, rng=None):
+        self.width, self.height = size
+        self.frame = 0
+        rng = rng or get_stream("background")
+        self.layers = []  # (speed, surface, sprites, twinkles)
+        for speed, count, radius, color in layers:
+            surface = self.make_surface(size)
+            for _ in range(count):
+                position = (rng.randrange(self.width), rng.randrange(self.height))
+                pygame.draw.circle(surface, color, position, radius)
+            sprites = [
+                self.make_sprite(color, radius, 0.3 + 0.7 * level / (TWINKLE_LEVELS - 1))
+                for level in range(TWINKLE_LEVELS)
+            ]
+            # (x, y, phase) with (x, y) the sprite's top-left on the layer
+            twinkles = [
+                (rng.randrange(self.width), rng.randrange(self.height), rng.randrange(TWINKLE_FRAMES))
+                for _ in range(twinkling)
+            ]
+            self.layers.append((speed, self.finish(surface), sprites, twinkles))
+
+    @staticmethod
+    def make_surface(size):
+        surface = pygame.Surface(size)
+        surface.fill((0, 0, 0))
+        return surface
+
+    def make_sprite(self, color, radius, brightness):
+        sprite = self.make_surface((2 * radius + 1, 2 * radius + 1))
+        color = tuple(max(1, int(c * brightness)) for c in color)  # never the colour key
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        return self.finish(sprite)
+
+    @staticmethod
+    def finish(surface):
+        if pygame.display.get_surface() is not None:
+            # Matching the display format avoids a conversion on every blit
+            surface = surface.convert()
+        surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return surface
+
+    def update(self):
+        self.frame += 1
+
+    def draw(self, surface):
+        """Draw the field as of the current frame; call update() to animate it"""
+        for speed, layer, sprites, twinkles in self.layers:
+            offset = int(self.frame * speed) % self.width
+            surface.blit(layer, (-offset, 0))
+            surface.blit(layer, (self.width - offset, 0))
+            for x, y, phase in twinkles:
+                level = TWINKLE_TABLE[(self.frame + phase) % TWINKLE_FRAMES]
+                surface.blit(sprites[level], ((x - offset) % self.width, y))
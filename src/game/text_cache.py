@@ -0,0 +1,49 @@
+"""
+Shared cache of rendered text surfaces.
+
+Almost every string the UI draws (titles, button labels, unit names, stats)
+is identical from one frame to the next, so font.render is done once per
+(font, text, color, antialias) and the surface reused until it falls out of
+the LRU. Returned surfaces are shared: blit them, never draw on them.
+"""
+from collections import OrderedDict
+
+class TextCache:
+    def __init__(self, max_entries=512):
+        self.entries = OrderedDict()  # (font, text, color, antialias) -> Surface
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+text_cache = TextCache()
+
+def render_text(font, text, color, antialias=True):
+    """Cached font.render(text, antialias, color)"""
+    return text_cache.render(font, text, color, antialias)
@@ -1,4 +1,6 @@
 import pygame
+from .fonts import fonts
+from .text_cache import render_text
 
 class TutorialSystem:
     def __init__(self, screen):
@@ -11,6 +13,8 @@ class TutorialSystem:
         ]
         self.completed = False
         self.tokens_earned = False
+        self.title_font = fonts.get("Arial", 36)
+        self.body_font = fonts.get("Arial", 24)
     
     def start(self):
         self.current_phase = 0
@@ -29,13 +33,13 @@ class TutorialSystem:
         self.screen.blit(overlay, (0, 0))
         
         # Draw tutorial content
-        font = pygame.font.SysFont("Arial", 36)
-        text = font.render("Welcome to Black Ops: Mission Command!", True, (255, 255, 255))
+        text = render_text(self.title_font, "Welcome to Black Ops: Mission Command!", (255, 255, 255))
         self.screen.blit(text, (250, 200))
         
-        text = pygame.font.SysFont("Arial", 24).render(
-            "In this game, you command an elite team on dangerous missions around the world", 
-            True, (200, 200, 200))
+        text = render_text(
+            self.body_font,
+            "In this game, you command an elite team on dangerous missions around the world",
+            (200, 200, 200))
         self.screen.blit(text, (150, 280))
         
         # Draw continue button
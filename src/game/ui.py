@@ -1,8 +1,11 @@
 import pygame
 import math
 import os
+from collections import OrderedDict
 from .characters import Character, create_team
 from .missions import Mission, create_missions
+from .fonts import fonts
+from .text_cache import render_text
 
 # Screen dimensions
 SCREEN_WIDTH, SCREEN_HEIGHT = 1000, 700
@@ -20,12 +23,8 @@ LIGHT_GRAY = (100, 100, 100)
 HEALTH_GREEN = (50, 200, 80)
 HEALTH_RED = (200, 50, 50)
 
-# Fonts
-title_font = pygame.font.SysFont("Arial", 48, bold=True)
-heading_font = pygame.font.SysFont("Arial", 36, bold=True)
-subtitle_font = pygame.font.SysFont("Arial", 28, bold=True)
-normal_font = pygame.font.SysFont("Arial", 24)
-small_font = pygame.font.SysFont("Arial", 20)
+# Mission cards scroll between their heading and the buttons
+MISSION_LIST_VIEWPORT = (100, 430, 800, SCREEN_HEIGHT - 110 - 430)
 
 class Button:
     def __init__(self, x, y, width, height, text, color=ACCENT, hover_color=LIGHT_BLUE):
@@ -40,7 +39,7 @@ class Button:
         pygame.draw.rect(surface, color, self.rect, 0, 10)
         pygame.draw.rect(surface, WHITE, self.rect, 2, 10)
         
-        text_surf = normal_font.render(self.text, True, WHITE)
+        text_surf = render_text(fonts.normal, self.text, WHITE)
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
         
@@ -54,21 +53,99 @@ class Button:
                 return True
         return False
 
+class MissionList:
+    """
+    Scrollable list of the unlocked missions' cards.
+
+    Only the cards that intersect the viewport are drawn, each from a cached
+    surface keyed by its look, so drawing costs the same for a catalog of 4
+    missions or 10,000. Call refresh() after unlocking missions.
+    """
+    def __init__(self, missions, viewport, card_height=120, spacing=20, cache_size=32):
+        self.missions = missions
+        self.viewport = pygame.Rect(viewport)
+        self.card_height = card_height
+        self.pitch = card_height + spacing
+        self.cache_size = cache_size
+        self.cards = OrderedDict()  # (mission index, is_current, completed) -> Surface
+        self.scroll = 0
+        self.version = 0  # bumped whenever what the list shows changes
+        self.refresh()
+
+    def refresh(self):
+        """Re-read which missions are unlocked"""
+        self.items = [i for i, mission in enumerate(self.missions) if mission.unlocked]
+        self.scroll_to(self.scroll)
+
+    def max_scroll(self):
+        content = len(self.items) * self.pitch - (self.pitch - self.card_height)
+        return max(0, content - self.viewport.height)
+
+    def scroll_to(self, offset):
+        self.scroll = min(max(0, int(offset)), self.max_scroll())
+        self.version += 1
+
+    def scroll_by(self, dy):
+        self.scroll_to(self.scroll + dy)
+
+    def visible_range(self):
+        """Positions in items of the first and one past the last card in view"""
+        first = self.scroll // self.pitch
+        last = (self.scroll + self.viewport.height) // self.pitch + 1
+        return first, min(last, len(self.items))
+
+    def card(self, index, is_current):
+        mission = self.missions[index]
+        key = (index, is_current, mission.completed)
+        surface = self.cards.get(key)
+        if surface is not None:
+            self.cards.move_to_end(key)
+            return surface
+        # Transparent outside the rounded corners
+        surface = pygame.Surface((self.viewport.width, self.card_height), pygame.SRCALPHA)
+        mission.draw(surface, 0, 0, self.viewport.width, self.card_height, is_current)
+        self.cards[key] = surface
+        if len(self.cards) > self.cache_size:
+            self.cards.popitem(last=False)
+        return surface
+
+    def draw(self, surface, current_mission):
+        first, last = self.visible_range()
+        clip = surface.get_clip()
+        surface.set_clip(self.viewport.clip(clip))
+        for position in range(first, last):
+            index = self.items[position]
+            y = self.viewport.y + position * self.pitch - self.scroll
+            surface.blit(self.card(index, index == current_mission), (self.viewport.x, y))
+        surface.set_clip(clip)
+
+def team_slot(i):
+    """Centre of the i-th operative on the combat screen"""
+    return (200 + i*200, 200)
+
+def enemy_slot(i):
+    """Centre of the i-th enemy on the combat screen"""
+    return (SCREEN_WIDTH//2 + 150 + i*150, 200)
+
+def render_log_line(line):
+    """Combat log renderer; each line is rendered once, when it is logged"""
+    return fonts.small.render(line, True, WHITE)
+
 def draw_mission_select_screen(surface, team, missions, current_mission, 
-                              start_mission_button, ad_button, mouse_pos, economy):
+                              start_mission_button, ad_button, mouse_pos, economy, mission_list=None):
     # Title
-    title_text = title_font.render("BLACK OPS: MISSION COMMAND", True, ACCENT)
+    title_text = render_text(fonts.title, "BLACK OPS: MISSION COMMAND", ACCENT)
     surface.blit(title_text, (SCREEN_WIDTH//2 - title_text.get_width()//2, 30))
     
-    subtitle = subtitle_font.render("Select a Mission", True, LIGHT_BLUE)
+    subtitle = render_text(fonts.subtitle, "Select a Mission", LIGHT_BLUE)
     surface.blit(subtitle, (SCREEN_WIDTH//2 - subtitle.get_width()//2, 90))
     
     # Player info
-    player_info = small_font.render(f"Player: {os.environ.get('GAME_PLAYER_ID', 'default')} | Tokens: {economy.data['tokens']}", True, YELLOW)
+    player_info = render_text(fonts.small, f"Player: {os.environ.get('GAME_PLAYER_ID', 'default')} | Tokens: {economy.data['tokens']}", YELLOW)
     surface.blit(player_info, (SCREEN_WIDTH - player_info.get_width() - 20, 20))
     
     # Draw team
-    team_text = subtitle_font.render("Your Team", True, WHITE)
+    team_text = render_text(fonts.subtitle, "Your Team", WHITE)
     surface.blit(team_text, (100, 150))
     
     for i, char in enumerate(team):
@@ -79,12 +156,12 @@ def draw_mission_select_screen(surface, team, missions, current_mission,
         team[0].draw_stats(surface, SCREEN_WIDTH - 350, 180)
     
     # Draw missions
-    missions_text = subtitle_font.render("Available Missions", True, WHITE)
+    missions_text = render_text(fonts.subtitle, "Available Missions", WHITE)
     surface.blit(missions_text, (100, 380))
     
-    for i, mission in enumerate(missions):
-        if mission.unlocked:
-            mission.draw(surface, 100, 430 + i*140, 800, 120, i == current_mission)
+    if mission_list is None:
+        mission_list = MissionList(missions, MISSION_LIST_VIEWPORT)
+    mission_list.draw(surface, current_mission)
     
     # Draw start mission button
     start_mission_button.check_hover(mouse_pos)
@@ -97,41 +174,41 @@ def draw_mission_select_screen(surface, team, missions, current_mission,
 def draw_combat_screen(surface, mission, team, selected_character, combat_log, player_turn, 
                       attack_button, special_button, back_button, mouse_pos):
     # Draw mission title
-    mission_title = subtitle_font.render(f"MISSION: {mission.title}", True, ACCENT)
+    mission_title = render_text(fonts.subtitle, f"MISSION: {mission.title}", ACCENT)
     surface.blit(mission_title, (SCREEN_WIDTH//2 - mission_title.get_width()//2, 20))
     
     # Draw team
-    team_title = subtitle_font.render("YOUR TEAM", True, GREEN_ACCENT)
+    team_title = render_text(fonts.subtitle, "YOUR TEAM", GREEN_ACCENT)
     surface.blit(team_title, (SCREEN_WIDTH//2 - 350, 70))
     
     for i, char in enumerate(team):
-        char.draw(surface, 200 + i*200, 200, 90)
+        x, y = team_slot(i)
+        char.draw(surface, x, y, 90)
         if char.special_cooldown > 0:
-            cooldown_text = small_font.render(f"{char.special_name} on cooldown: {char.special_cooldown}", True, YELLOW)
-            surface.blit(cooldown_text, (200 + i*200 - cooldown_text.get_width()//2, 330))
+            cooldown_text = render_text(fonts.small, f"{char.special_name} on cooldown: {char.special_cooldown}", YELLOW)
+            surface.blit(cooldown_text, (x - cooldown_text.get_width()//2, 330))
     
     # Draw enemies
-    enemies_title = subtitle_font.render("ENEMIES", True, RED_ACCENT)
+    enemies_title = render_text(fonts.subtitle, "ENEMIES", RED_ACCENT)
     surface.blit(enemies_title, (SCREEN_WIDTH//2 + 150, 70))
     
     for i, enemy in enumerate(mission.enemies):
-        enemy.draw(surface, SCREEN_WIDTH//2 + 150 + i*150, 200)
+        enemy.draw(surface, *enemy_slot(i))
     
     # Draw combat log
     pygame.draw.rect(surface, (10, 20, 35), (50, 350, SCREEN_WIDTH-100, 200), 0, 10)
     pygame.draw.rect(surface, ACCENT, (50, 350, SCREEN_WIDTH-100, 200), 2, 10)
     
-    log_title = small_font.render("COMBAT LOG", True, LIGHT_BLUE)
+    log_title = render_text(fonts.small, "COMBAT LOG", LIGHT_BLUE)
     surface.blit(log_title, (70, 360))
     
-    # Display last 8 log entries
-    for i, entry in enumerate(combat_log[-8:]):
-        log_text = small_font.render(entry, True, WHITE)
+    # Display last 8 log entries, rendered when they were logged
+    for i, log_text in enumerate(combat_log.rendered_tail(8)):
         surface.blit(log_text, (70, 400 + i*25))
     
     # Draw action buttons
     if player_turn:
-        action_text = subtitle_font.render("YOUR TURN - Select a character and action", True, GREEN_ACCENT)
+        action_text = render_text(fonts.subtitle, "YOUR TURN - Select a character and action", GREEN_ACCENT)
         surface.blit(action_text, (SCREEN_WIDTH//2 - action_text.get_width()//2, SCREEN_HEIGHT - 150))
         
         attack_button.check_hover(mouse_pos)
@@ -139,7 +216,7 @@ def draw_combat_screen(surface, mission, team, selected_character, combat_log, p
         attack_button.draw(surface)
         special_button.draw(surface)
     else:
-        enemy_text = subtitle_font.render("ENEMY TURN", True, RED_ACCENT)
+        enemy_text = render_text(fonts.subtitle, "ENEMY TURN", RED_ACCENT)
         surface.blit(enemy_text, (SCREEN_WIDTH//2 - enemy_text.get_width()//2, SCREEN_HEIGHT - 150))
     
     # Draw back button
@@ -151,28 +228,28 @@ def draw_mission_complete_screen(surface, mission, next_mission_button, mouse_po
     pygame.draw.rect(surface, (20, 40, 80), (100, 100, SCREEN_WIDTH-200, SCREEN_HEIGHT-250), 0, 20)
     pygame.draw.rect(surface, ACCENT, (100, 100, SCREEN_WIDTH-200, SCREEN_HEIGHT-250), 4, 20)
     
-    complete_text = title_font.render("MISSION COMPLETE!", True, GREEN_ACCENT)
+    complete_text = render_text(fonts.title, "MISSION COMPLETE!", GREEN_ACCENT)
     surface.blit(complete_text, (SCREEN_WIDTH//2 - complete_text.get_width()//2, 150))
     
-    mission_title = subtitle_font.render(f"{mission.title}", True, YELLOW)
+    mission_title = render_text(fonts.subtitle, f"{mission.title}", YELLOW)
     surface.blit(mission_title, (SCREEN_WIDTH//2 - mission_title.get_width()//2, 220))
     
-    desc_text = normal_font.render(mission.description, True, WHITE)
+    desc_text = render_text(fonts.normal, mission.description, WHITE)
     surface.blit(desc_text, (SCREEN_WIDTH//2 - desc_text.get_width()//2, 280))
     
-    reward_text = heading_font.render("Rewards Unlocked:", True, LIGHT_BLUE)
+    reward_text = render_text(fonts.heading, "Rewards Unlocked:", LIGHT_BLUE)
     surface.blit(reward_text, (SCREEN_WIDTH//2 - reward_text.get_width()//2, 350))
     
     pygame.draw.rect(surface, (30, 60, 100), (SCREEN_WIDTH//2 - 200, 400, 400, 120), 0, 15)
     pygame.draw.rect(surface, LIGHT_BLUE, (SCREEN_WIDTH//2 - 200, 400, 400, 120), 2, 15)
     
-    reward1 = normal_font.render("+ Team Experience", True, WHITE)
+    reward1 = render_text(fonts.normal, "+ Team Experience", WHITE)
     surface.blit(reward1, (SCREEN_WIDTH//2 - 180, 420))
     
-    reward2 = normal_font.render("+ New Equipment", True, WHITE)
+    reward2 = render_text(fonts.normal, "+ New Equipment", WHITE)
     surface.blit(reward2, (SCREEN_WIDTH//2 - 180, 450))
     
-    reward3 = normal_font.render("+ Funding for Upgrades", True, WHITE)
+    reward3 = render_text(fonts.normal, "+ Funding for Upgrades", WHITE)
     surface.blit(reward3, (SCREEN_WIDTH//2 - 180, 480))
     
     # Draw next mission button
@@ -183,10 +260,10 @@ def draw_game_over_screen(surface, retry_button, main_menu_button, mouse_pos):
     # Game over screen
     surface.fill((20, 10, 10))
     
-    game_over_text = title_font.render("MISSION FAILED", True, RED_ACCENT)
+    game_over_text = render_text(fonts.title, "MISSION FAILED", RED_ACCENT)
     surface.blit(game_over_text, (SCREEN_WIDTH//2 - game_over_text.get_width()//2, 200))
     
-    over_text = subtitle_font.render("Your team was overwhelmed", True, LIGHT_GRAY)
+    over_text = render_text(fonts.subtitle, "Your team was overwhelmed", LIGHT_GRAY)
     surface.blit(over_text, (SCREEN_WIDTH//2 - over_text.get_width()//2, 280))
     
     # Draw buttons
@@ -199,14 +276,13 @@ def draw_victory_screen(surface, main_menu_button, mouse_pos):
     # Victory screen
     surface.fill((10, 20, 10))
     
-    victory_text = title_font.render("VICTORY!", True, GREEN_ACCENT)
+    victory_text = render_text(fonts.title, "VICTORY!", GREEN_ACCENT)
     surface.blit(victory_text, (SCREEN_WIDTH//2 - victory_text.get_width()//2, 200))
     
-    congrats = subtitle_font.render("You've completed all missions and saved the world!", True, YELLOW)
+    congrats = render_text(fonts.subtitle, "You've completed all missions and saved the world!", YELLOW)
     surface.blit(congrats, (SCREEN_WIDTH//2 - congrats.get_width()//2, 280))
     
     # Draw button
-    main_menu_button.rect.center = (SCREEN_WIDTH//2, 400)
     main_menu_button.check_hover(mouse_pos)
     main_menu_button.draw(surface)
 
@@ -214,7 +290,7 @@ def draw_ad_opportunity_screen(surface, tokens_available, ad_sets_completed):
     """Screen shown when player can watch ads for tokens"""
     surface.fill((10, 20, 35))
     
-    title = title_font.render("EARN MORE TOKENS", True, YELLOW)
+    title = render_text(fonts.title, "EARN MORE TOKENS", YELLOW)
     surface.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 100))
     
     # Explanation
@@ -228,7 +304,7 @@ def draw_ad_opportunity_screen(surface, tokens_available, ad_sets_completed):
     ]
     
     for i, line in enumerate(explanation):
-        text = normal_font.render(line, True, LIGHT_BLUE)
+        text = render_text(fonts.normal, line, LIGHT_BLUE)
         surface.blit(text, (SCREEN_WIDTH//2 - text.get_width()//2, 200 + i*40))
     
     # Draw watch ads button
@@ -0,0 +1,237 @@
+"""
+Batched line-of-sight queries between map tiles.
+
+Lines are traced Bresenham-style, one tile per step along the major axis,
+for every (source, target) pair at once as 2D index arrays over the
+obstacle map. Where the exact line crosses a tile corner on the minor axis
+both candidate tiles are checked, which makes every query symmetric:
+a sees b exactly when b sees a. The source and target tiles themselves
+never block.
+
+The tile offsets of every line up to LINE_TABLE_RADIUS steps are computed
+once per map height (LineTable), so a batch of queries costs two gathers;
+longer lines are traced on the fly.
+
+LOSCache memoizes pairs for static maps in sorted key arrays, so lookups
+are a searchsorted, and set_tile drops only the pairs whose line crosses
+the changed tile.
+"""
+import numpy as np
+from tactical_map import as_map
+
+LINE_TABLE_RADIUS = 64  # lines up to this many steps use precomputed geometry
+
+def _as_points(points):
+    return np.asarray(points, dtype=np.int64).reshape(-1, 2)
+
+def _minor_offsets(k, delta, n):
+    """
+    Minor-axis offsets at step k of a line of n steps, rounded both ways at
+    exact ties (round half up, round half down); identical elsewhere
+    """
+    up = (2 * k * delta + n) // (2 * n)
+    down = -((n - 2 * k * delta) // (2 * n))
+    return up, down
+
+def _trace(dx, dy, height, steps):
+    """
+    Flat-index offsets, relative to the start tile, of the intermediate
+    tiles of lines (dx, dy) in a map whose columns are height tiles tall.
+    Steps past the end of a line repeat its last intermediate tile.
+    :return: (tiles, corner_tiles, n), tiles and corner_tiles being
+             (len(dx), steps) and differing only where a line crosses a corner
+    """
+    n = np.maximum(np.abs(dx), np.abs(dy))[:, None]
+    x_major = (np.abs(dx) >= np.abs(dy))[:, None]
+    major = np.where(x_major[:, 0], dx, dy)[:, None]
+    minor = np.where(x_major[:, 0], dy, dx)[:, None]
+    major_stride = np.sign(major) * np.where(x_major, height, 1)
+    minor_stride = np.where(x_major, 1, height)
+
+    k = np.minimum(np.arange(1, steps + 1)[None, :], n - 1)
+    up, down = _minor_offsets(k, minor, np.maximum(n, 1))
+    along = k * major_stride
+    return along + up * minor_stride, along + down * minor_stride, n[:, 0]
+
+class LineTable:
+    """
+    Precomputed geometry of every line (dx, dy) with |dx|, |dy| <= radius,
+    so a batch of queries is a row gather plus one gather from the map
+    """
+    def __init__(self, height, radius):
+        self.radius = radius
+        self.span = 2 * radius + 1
+        dx, dy = np.divmod(np.arange(self.span * self.span), self.span)
+        tiles, corner_tiles, _ = _trace(dx - radius, dy - radius, height, max(1, radius - 1))
+        self.tiles = tiles.astype(np.int32)
+        self.has_corners = (tiles != corner_tiles).any(axis=1)
+        self.corner_tiles = corner_tiles.astype(np.int32)
+
+    def rows(self, dx, dy):
+        return (dx + self.radius) * self.span + dy + self.radius
+
+_line_tables = {}
+
+def get_line_table(height, radius):
+    key = (height, radius)
+    if key not in _line_tables:
+        _line_tables[key] = LineTable(height, radius)
+    return _line_tables[key]
+
+def pairs_line_of_sight(game_map, a, b):
+    """
+    Line of sight for matched pairs a[i] -> b[i]
+    :param game_map: 2D array (0 = transparent, 1 = blocks sight)
+    :param a, b: (N, 2) arrays of (x, y) tiles
+    :return: bool array of length N
+    """
+    game_map = as_map(game_map)
+    width, height = game_map.shape
+    a, b = _as_points(a), _as_points(b)
+    dx, dy = b[:, 0] - a[:, 0], b[:, 1] - a[:, 1]
+    n = np.maximum(np.abs(dx), np.abs(dy))
+    clear = np.ones(len(a), dtype=bool)
+    if not len(a) or n.max() < 2:
+        return clear
+
+    flat_map = game_map.reshape(-1)  # a view, so memory-mapped maps stay lazy
+    base = a[:, 0] * height + a[:, 1]
+    radius = min(LINE_TABLE_RADIUS, max(width, height) - 1)
+    short = n <= radius
+    if short.any():
+        table = get_line_table(height, radius)
+        rows = table.rows(dx[short], dy[short])
+        start = base[short][:, None]
+        blocked = (flat_map.take(start + table.tiles[rows]) == 1).any(axis=1)
+        # Lines through tile corners also check the tiles on the other side
+        corners = table.has_corners[rows]
+        if corners.any():
+            blocked[corners] |= (
+                flat_map.take(start[corners] + table.corner_tiles[rows[corners]]) == 1
+            ).any(axis=1)
+        clear[short] = ~blocked
+
+    long = ~short
+    if long.any():
+        tiles, corner_tiles, _ = _trace(dx[long], dy[long], height, n.max() - 1)
+        start = base[long][:, None]
+        blocked = flat_map.take(start + tiles) == 1
+        blocked |= flat_map.take(start + corner_tiles) == 1
+        clear[long] = ~blocked.any(axis=1)
+
+    # Adjacent and identical tiles have nothing in between
+    return clear | (n < 2)
+
+def batch_line_of_sight(game_map, sources, targets):
+    """
+    Line of sight between every source and every target
+    :param sources: (S, 2) array-like of (x, y) tiles
+    :param targets: (T, 2) array-like of (x, y) tiles
+    :return: (S, T) bool matrix
+    """
+    sources, targets = _as_points(sources), _as_points(targets)
+    a = np.repeat(sources, len(targets), axis=0)
+    b = np.tile(targets, (len(sources), 1))
+    return pairs_line_of_sight(game_map, a, b).reshape(len(sources), len(targets))
+
+def has_line_of_sight(game_map, a, b):
+    return bool(pairs_line_of_sight(game_map, [a], [b])[0])
+
+def lines_through(a, b, tile):
+    """
+    Which lines a[i] -> b[i] have tile as an intermediate (blocking) tile
+    :return: bool array of length N
+    """
+    a, b = _as_points(a), _as_points(b)
+    x, y = tile
+    dx, dy = b[:, 0] - a[:, 0], b[:, 1] - a[:, 1]
+    n = np.maximum(np.abs(dx), np.abs(dy))
+    x_major = np.abs(dx) >= np.abs(dy)
+    major = np.where(x_major, dx, dy)
+    minor = np.where(x_major, dy, dx)
+    major_offset = np.where(x_major, x - a[:, 0], y - a[:, 1])
+    minor_offset = np.where(x_major, y - a[:, 1], x - a[:, 0])
+
+    k = major_offset * np.sign(major)
+    up, down = _minor_offsets(k, minor, np.maximum(n, 1))
+    return (k > 0) & (k < n) & ((minor_offset == up) | (minor_offset == down))
+
+class LOSCache:
+    def __init__(self, game_map, max_pairs=1 << 20):
+        """
+        Memoized line of sight for maps that rarely change
+        :param game_map: 2D array (0 = transparent, 1 = blocks sight)
+        :param max_pairs: the cache is cleared once it holds more pairs than this
+        """
+        self.game_map = as_map(game_map)
+        self.width, self.height = self.game_map.shape
+        self.max_pairs = max_pairs
+        self.hits = 0
+        self.misses = 0
+        self.clear()
+
+    def clear(self):
+        self.keys = np.zeros(0, dtype=np.int64)  # sorted pair keys
+        self.values = np.zeros(0, dtype=bool)
+
+    def pair_keys(self, a, b):
+        """Order-independent int64 key per pair, from the flat tile indices"""
+        cells = self.width * self.height
+        fa = a[:, 0] * self.height + a[:, 1]
+        fb = b[:, 0] * self.height + b[:, 1]
+        return np.minimum(fa, fb) * cells + np.maximum(fa, fb)
+
+    def lookup(self, keys):
+        """:return: (found, values) for each key"""
+        if not len(self.keys):
+            return np.zeros(len(keys), dtype=bool), np.zeros(len(keys), dtype=bool)
+        pos = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        return self.keys[pos] == keys, self.values[pos]
+
+    def pairs(self, a, b):
+        """Cached equivalent of pairs_line_of_sight"""
+        a, b = _as_points(a), _as_points(b)
+        keys = self.pair_keys(a, b)
+        found, result = self.lookup(keys)
+        self.hits += int(found.sum())
+        missing = ~found
+        if missing.any():
+            self.misses += int(missing.sum())
+            computed = pairs_line_of_sight(self.game_map, a[missing], b[missing])
+            result = result.copy()
+            result[missing] = computed
+            self.store(keys[missing], computed)
+        return result
+
+    def batch(self, sources, targets):
+        """Cached equivalent of batch_line_of_sight"""
+        sources, targets = _as_points(sources), _as_points(targets)
+        a = np.repeat(sources, len(targets), axis=0)
+        b = np.tile(targets, (len(sources), 1))
+        return self.pairs(a, b).reshape(len(sources), len(targets))
+
+    def store(self, keys, values):
+        keys, first = np.unique(keys, return_index=True)
+        if len(self.keys) + len(keys) > self.max_pairs:
+            self.clear()
+        merged_keys = np.concatenate([self.keys, keys])
+        order = np.argsort(merged_keys, kind="stable")
+        self.keys = merged_keys[order]
+        self.values = np.concatenate([self.values, values[first]])[order]
+
+    def set_tile(self, x, y, value):
+        """Change one tile and forget the cached pairs whose line crosses it"""
+        was_opaque = self.game_map[x, y] == 1
+        self.game_map[x, y] = value
+        if was_opaque != (value == 1):
+            self.invalidate_tile(x, y)
+
+    def invalidate_tile(self, x, y):
+        if not len(self.keys):
+            return
+        cells = self.width * self.height
+        fa, fb = np.divmod(self.keys, cells)
+        a = np.stack(np.divmod(fa, self.height), axis=1)
+        b = np.stack(np.divmod(fb, self.height), axis=1)
+        keep = ~lines_through(a, b, (x, y))
+        self.keys, self.values = self.keys[keep], self.values[keep]
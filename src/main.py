@@ -1,14 +1,24 @@
 import pygame
 import sys
-import random
+import os
 from game.characters import create_team
 from game.missions import create_missions
-from game.ui import Button
-from game.combat import handle_combat_events, enemy_turn
-from game.particles import update_particles
+from game.ui import Button, MissionList, MISSION_LIST_VIEWPORT, render_log_line
+from game.combat import register_combat_regions, enemy_turn
+from game.combat_core import CombatState, reset_units
+from game.combat_log import CombatLog
+from game.replay import make_replay, save_replay
+from game.particles import ParticleSystem, ParticleGovernor
+from game.profiler import FrameProfiler, load_performance_config
+from game.frame_pacing import FrameScheduler
+from game.event_router import EventRouter
+from game.fonts import fonts
+from game.assets import assets
+from game.text_cache import text_cache
+from game.screen_layers import ScreenLayers, NO_MOUSE
+from game.starfield import Starfield
 from game.ui import draw_mission_select_screen, draw_combat_screen, draw_mission_complete_screen, draw_game_over_screen, draw_victory_screen, draw_ad_opportunity_screen
 from game.economy import EconomySystem
-from game.ai_agents.agent_orchestrator import AIOrchestrator
 
 # Initialize pygame
 pygame.init()
@@ -18,6 +28,7 @@ pygame.mixer.init()
 SCREEN_WIDTH, SCREEN_HEIGHT = 1000, 700
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Black Ops: Mission Command")
+starfield = Starfield((SCREEN_WIDTH, SCREEN_HEIGHT))
 
 # Colors
 BACKGROUND = (15, 25, 45)
@@ -32,20 +43,42 @@ LIGHT_GRAY = (100, 100, 100)
 HEALTH_GREEN = (50, 200, 80)
 HEALTH_RED = (200, 50, 50)
 
-# Fonts
-title_font = pygame.font.SysFont("Arial", 48, bold=True)
-heading_font = pygame.font.SysFont("Arial", 36, bold=True)
-subtitle_font = pygame.font.SysFont("Arial", 28, bold=True)
-normal_font = pygame.font.SysFont("Arial", 24)
-small_font = pygame.font.SysFont("Arial", 20)
-
 def start_combat(missions, current_mission, team):
-    """Reset characters for new combat"""
-    for char in team:
-        char.health = char.max_health
-        char.alive = True
-        char.special_cooldown = 0
-    return [f"Mission: {missions[current_mission].title}", "Combat initiated!"]
+    """Reset units and create the state for a new combat"""
+    enemies = missions[current_mission].enemies
+    reset_units(team, enemies)
+    # Debug sessions keep every line on disk; the screen only needs the last few
+    spill_path = None
+    if os.environ.get('GAME_DEBUG') == "True":
+        spill_path = os.path.join("data", "combat_logs", f"{os.environ.get('GAME_PLAYER_ID', 'default')}.log")
+    log = CombatLog(
+        [f"Mission: {missions[current_mission].title}", "Combat initiated!"],
+        spill_path=spill_path, render=render_log_line
+    )
+    return CombatState(team, enemies, log=log)
+
+def draw_backdrop(surface):
+    """Background colour and the starfield"""
+    surface.fill(BACKGROUND)
+    starfield.draw(surface)
+
+def draw_profiler_overlay(surface, profiler, particles):
+    """Frame timings and particle budget stats in the top-right corner; returns the area drawn"""
+    stats = particles.stats()
+    lines = profiler.report() + [
+        f"particles {stats['live']} live, scale {stats.get('scale', 1.0):.2f}",
+        f"  decimated {stats.get('decimated', 0)}  culled {stats.get('culled', 0)}  dropped {stats['dropped']}",
+        f"text cache {text_cache.hits} hits, {text_cache.misses} misses",
+    ]
+    # Glyph blits, since these numbers change every frame and would churn the text cache
+    glyphs = assets.glyph_atlas(fonts.small, YELLOW)
+    y = 10
+    area = None
+    for line in lines:
+        rect = glyphs.draw(surface, line, (SCREEN_WIDTH - glyphs.width(line) - 10, y))
+        area = rect if area is None else area.union(rect)
+        y += glyphs.height
+    return area
 
 def main():
     # Create characters
@@ -57,13 +90,22 @@ def main():
     # Initialize game state
     current_mission = 0
     game_state = "mission_select"  # mission_select, combat, mission_complete, game_over, ad_opportunity
-    selected_character = None
-    combat_log = []
-    player_turn = True
-    particles = []
+    combat = None
+    
+    # Frame profiler and particle budget
+    performance = load_performance_config()
+    profiler = FrameProfiler()
+    show_profiler = performance["show_profiler"]
+    governor = ParticleGovernor(
+        budget_ms=performance["particle_budget_ms"],
+        frame_budget_ms=performance["frame_budget_ms"],
+        min_scale=performance["particle_min_scale"]
+    )
+    particles = ParticleSystem(governor=governor)
     
     # Unlock first mission
     missions[0].unlocked = True
+    mission_list = MissionList(missions, MISSION_LIST_VIEWPORT)
     
     # Initialize player economy
     player_id = os.environ.get('GAME_PLAYER_ID', 'default')
@@ -74,166 +116,208 @@ def main():
     next_mission_button = Button(SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT - 100, 200, 50, "NEXT MISSION")
     retry_button = Button(SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT - 100, 140, 50, "RETRY")
     main_menu_button = Button(SCREEN_WIDTH//2 + 10, SCREEN_HEIGHT - 100, 140, 50, "MAIN MENU")
+    victory_menu_button = Button(SCREEN_WIDTH//2 - 70, 375, 140, 50, "MAIN MENU")
     attack_button = Button(SCREEN_WIDTH//2 - 220, SCREEN_HEIGHT - 90, 200, 50, "ATTACK")
     special_button = Button(SCREEN_WIDTH//2 + 20, SCREEN_HEIGHT - 90, 200, 50, "SPECIAL")
     back_button = Button(50, SCREEN_HEIGHT - 70, 120, 40, "BACK")
     ad_button = Button(SCREEN_WIDTH - 200, SCREEN_HEIGHT - 70, 180, 40, "EARN TOKENS")
     watch_ads_button = Button(SCREEN_WIDTH//2 - 150, 500, 300, 60, "WATCH 3 ADS FOR 3 TOKENS")
     
+    # Click handlers return the next game state (None stays put)
+    def start_mission():
+        nonlocal combat
+        if not economy.can_play():
+            return "ad_opportunity"
+        economy.use_token()
+        if combat is not None:
+            combat.log.close()  # release the previous combat's spill file
+        combat = start_combat(missions, current_mission, team)
+        register_combat_regions(router, combat, particles)
+        return "combat"
+    
+    def next_mission():
+        nonlocal current_mission
+        if current_mission < len(missions) - 1:
+            current_mission += 1
+            missions[current_mission].unlocked = True
+            mission_list.refresh()
+            return "mission_select"
+        return "victory"
+    
+    def watch_ads():
+        if economy.watch_ad_set():
+            return "mission_select"
+    
+    def to_state(state):
+        return lambda: state
+    
+    router = EventRouter()
+    router.on_click("mission_select", start_mission_button.rect, start_mission)
+    router.on_click("mission_select", ad_button.rect, to_state("ad_opportunity"))
+    router.on_click("mission_complete", next_mission_button.rect, next_mission)
+    router.on_click("combat", back_button.rect, to_state("mission_select"))
+    router.on_click("ad_opportunity", watch_ads_button.rect, watch_ads)
+    router.on_click("ad_opportunity", back_button.rect, to_state("mission_select"))
+    router.on_click("game_over", retry_button.rect, start_mission)
+    router.on_click("game_over", main_menu_button.rect, to_state("mission_select"))
+    router.on_click("victory", victory_menu_button.rect, to_state("mission_select"))
+    
+    # Static screens are retained and only their changed parts presented
+    layers = ScreenLayers(screen, backdrop=draw_backdrop)
+    
+    # Frame rate per state; static screens sleep until input
+    scheduler = FrameScheduler(
+        {"combat": performance["combat_fps"]},
+        default_fps=performance["menu_fps"],
+        idle_wait_ms=performance["idle_wait_ms"]
+    )
+    
     # Main game loop
-    clock = pygame.time.Clock()
     running = True
     
     while running:
+        profiler.begin_frame()
         mouse_pos = pygame.mouse.get_pos()
         
         # Handle events
-        for event in pygame.event.get():
+        for event in scheduler.events():
             if event.type == pygame.QUIT:
                 running = False
-                
-            # Handle button clicks
-            if game_state == "mission_select":
-                if start_mission_button.handle_event(event):
-                    if economy.can_play():
-                        economy.use_token()
-                        combat_log = start_combat(missions, current_mission, team)
-                        game_state = "combat"
-                        player_turn = True
-                        selected_character = None
-                    else:
-                        game_state = "ad_opportunity"
-                
-                if ad_button.handle_event(event):
-                    game_state = "ad_opportunity"
-                    
-            elif game_state == "mission_complete":
-                if next_mission_button.handle_event(event):
-                    if current_mission < len(missions) - 1:
-                        current_mission += 1
-                        missions[current_mission].unlocked = True
-                        game_state = "mission_select"
-                    else:
-                        game_state = "victory"
-                        
-            elif game_state == "combat":
-                result = handle_combat_events(
-                    event, mouse_pos, team, missions[current_mission].enemies, 
-                    selected_character, player_turn, combat_log, particles
-                )
-                if result:
-                    selected_character, player_turn = result
-                
-            elif game_state == "ad_opportunity":
-                if watch_ads_button.handle_event(event):
-                    if economy.watch_ad_set():
-                        game_state = "mission_select"
-                
-                if back_button.handle_event(event):
-                    game_state = "mission_select"
-            
-            # Back button handling
-            if back_button.handle_event(event):
-                if game_state == "combat":
-                    game_state = "mission_select"
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                show_profiler = not show_profiler
+            if event.type == pygame.MOUSEWHEEL and game_state == "mission_select":
+                mission_list.scroll_by(-event.y * 40)
             
-            # Handle retry and main menu buttons
-            if game_state == "game_over":
-                if retry_button.handle_event(event):
-                    if economy.can_play():
-                        economy.use_token()
-                        combat_log = start_combat(missions, current_mission, team)
-                        game_state = "combat"
-                        player_turn = True
-                        selected_character = None
-                    else:
-                        game_state = "ad_opportunity"
-                if main_menu_button.handle_event(event):
-                    game_state = "mission_select"
-                    
-            if game_state == "victory":
-                if main_menu_button.handle_event(event):
-                    game_state = "mission_select"
+            # Clicks go to the handler of the region under the pointer
+            game_state = router.dispatch(game_state, event) or game_state
         
         # Enemy turn in combat
-        if game_state == "combat" and not player_turn:
-            result = enemy_turn(missions[current_mission].enemies, team, combat_log, particles)
+        if game_state == "combat" and not combat.player_turn:
+            result = enemy_turn(combat, particles)
+            if result != "continue":
+                save_replay(make_replay(combat, current_mission), player_id)
             if result == "win":
-                combat_log.append("Mission successful!")
+                combat.log.append("Mission successful!")
                 missions[current_mission].completed = True
                 game_state = "mission_complete"
             elif result == "lose":
-                combat_log.append("Mission failed! All team members down.")
+                combat.log.append("Mission failed! All team members down.")
                 game_state = "game_over"
-            else:
-                player_turn = True
-                # Reduce cooldowns
-                for char in team:
-                    if char.special_cooldown > 0:
-                        char.special_cooldown -= 1
         
         # Update particles
-        particles = update_particles(particles)
-        
-        # Draw everything
-        screen.fill(BACKGROUND)
-        
-        # Draw decorative elements
-        for i in range(20):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            size = random.randint(1, 3)
-            pygame.draw.circle(screen, (100, 150, 200, 100), (x, y), size)
-        
-        # Draw particles
-        for particle in particles:
-            particle.draw(screen)
+        with profiler.section("particles"):
+            particles.update()
         
-        # Draw UI based on game state
-        if game_state == "mission_select":
-            draw_mission_select_screen(
-                screen, team, missions, current_mission, 
-                start_mission_button, ad_button, mouse_pos, economy
-            )
+        animating = game_state == "combat" or len(particles) > 0
+        if animating:
+            # Animated frames are drawn in full
+            layers.invalidate()
+            with profiler.section("background"):
+                starfield.update()
+                draw_backdrop(screen)
             
-        elif game_state == "combat":
-            draw_combat_screen(
-                screen, missions[current_mission], team, selected_character, 
-                combat_log, player_turn, attack_button, special_button, 
-                back_button, mouse_pos
-            )
+            # Draw particles
+            with profiler.section("particles"):
+                particles.draw(screen)
             
-        elif game_state == "mission_complete":
-            draw_mission_complete_screen(
-                screen, missions[current_mission], 
-                next_mission_button, mouse_pos
-            )
+            # Draw UI based on game state
+            if game_state == "mission_select":
+                draw_mission_select_screen(
+                    screen, team, missions, current_mission, 
+                    start_mission_button, ad_button, mouse_pos, economy, mission_list
+                )
+                
+            elif game_state == "combat":
+                draw_combat_screen(
+                    screen, missions[current_mission], team, combat.selected, 
+                    combat.log, combat.player_turn, attack_button, special_button, 
+                    back_button, mouse_pos
+                )
+                
+            elif game_state == "mission_complete":
+                draw_mission_complete_screen(
+                    screen, missions[current_mission], 
+                    next_mission_button, mouse_pos
+                )
+                
+            elif game_state == "game_over":
+                draw_game_over_screen(
+                    screen, retry_button, 
+                    main_menu_button, mouse_pos
+                )
+                
+            elif game_state == "victory":
+                draw_victory_screen(
+                    screen, victory_menu_button, 
+                    mouse_pos
+                )
+                
+            elif game_state == "ad_opportunity":
+                watch_btn, back_btn = draw_ad_opportunity_screen(
+                    screen, economy.data['tokens'],
+                    economy.data.get('ad_sets_completed', 0)
+                )
+                watch_ads_button.check_hover(mouse_pos)
+                back_button.check_hover(mouse_pos)
+                watch_ads_button.draw(screen)
+                back_button.draw(screen)
             
-        elif game_state == "game_over":
-            draw_game_over_screen(
-                screen, retry_button, 
-                main_menu_button, mouse_pos
-            )
+            if show_profiler:
+                draw_profiler_overlay(screen, profiler, particles)
             
-        elif game_state == "victory":
-            draw_victory_screen(
-                screen, main_menu_button, 
-                mouse_pos
-            )
+            with profiler.section("present"):
+                pygame.display.flip()
+        else:
+            # Static screens: the background is redrawn only when its key
+            # changes and buttons only when their hover state does
+            if game_state == "mission_select":
+                layers.update(
+                    (game_state, current_mission, economy.data['tokens'], mission_list.version),
+                    [start_mission_button, ad_button], mouse_pos,
+                    draw_mission_select_screen, team, missions, current_mission,
+                    start_mission_button, ad_button, NO_MOUSE, economy, mission_list
+                )
+                
+            elif game_state == "mission_complete":
+                layers.update(
+                    (game_state, current_mission), [next_mission_button], mouse_pos,
+                    draw_mission_complete_screen, missions[current_mission],
+                    next_mission_button, NO_MOUSE
+                )
+                
+            elif game_state == "game_over":
+                layers.update(
+                    (game_state,), [retry_button, main_menu_button], mouse_pos,
+                    draw_game_over_screen, retry_button, main_menu_button, NO_MOUSE
+                )
+                
+            elif game_state == "victory":
+                layers.update(
+                    (game_state,), [victory_menu_button], mouse_pos,
+                    draw_victory_screen, victory_menu_button, NO_MOUSE
+                )
+                
+            elif game_state == "ad_opportunity":
+                layers.update(
+                    (game_state, economy.data['tokens'], economy.data.get('ad_sets_completed', 0)),
+                    [watch_ads_button, back_button], mouse_pos,
+                    draw_ad_opportunity_screen, economy.data['tokens'],
+                    economy.data.get('ad_sets_completed', 0)
+                )
             
-        elif game_state == "ad_opportunity":
-            watch_btn, back_btn = draw_ad_opportunity_screen(
-                screen, economy.data['tokens'],
-                economy.data.get('ad_sets_completed', 0)
-            )
-            watch_ads_button.check_hover(mouse_pos)
-            back_button.check_hover(mouse_pos)
-            watch_ads_button.draw(screen)
-            back_button.draw(screen)
-        
-        pygame.display.flip()
-        clock.tick(60)
+            if show_profiler:
+                layers.draw_overlay(draw_profiler_overlay, profiler, particles)
+            else:
+                layers.clear_overlay()
+            
+            with profiler.section("present"):
+                layers.present()
+        profiler.end_frame()
+        governor.observe(profiler.last.get("particles", 0.0), profiler.last_frame_ms)
+        scheduler.wait(game_state, animating)
 
+    if combat is not None:
+        combat.log.close()
     pygame.quit()
     sys.exit()
 
@@ -0,0 +1,209 @@
+"""
+Procedural tactical maps.
+
+A map starts as random noise, is smoothed into caves by a cellular automaton
+(neighbour counts are eight shifted array sums), gets rooms and corridors
+stamped into it, and is then repaired so every floor tile is reachable:
+floor regions are labelled by union-find over vertical runs of floor,
+regions large enough to matter are joined to the main one with a corridor
+and the rest are filled in.
+
+Everything is whole-array NumPy work, so a 1024x1024 map takes well under
+200 ms. Generated maps are also cached on disk, keyed by a hash of
+(seed, size, params), and reopened as memory maps on the next mission.
+"""
+import os
+import json
+import hashlib
+import configparser
+import numpy as np
+from tactical_map import FLOOR, WALL, MAP_DTYPE, save_map, load_map
+
+MAP_CACHE_DIR = "data/maps"
+GENERATOR_VERSION = 1  # bump when the output for a given key changes
+
+DEFAULT_PARAMS = {
+    "fill": 0.45,           # initial wall probability
+    "smooth_steps": 4,      # cellular automaton passes
+    "birth": 5,             # floor becomes wall with at least this many wall neighbours
+    "survive": 4,           # wall stays wall with at least this many wall neighbours
+    "rooms": 12,            # rooms stamped per 100x100 tiles
+    "room_size": (5, 14),   # min and max room edge in tiles
+    "corridor_width": 2,
+    "min_region": 40,       # smaller unreachable pockets are filled in, larger ones connected
+}
+
+def generator_enabled(config_path="config.ini"):
+    """True unless [AI_UPGRADES] Procedural Map Generator is switched off"""
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    value = config.get("AI_UPGRADES", "Procedural Map Generator", fallback="enabled")
+    return value.strip().lower() in ("enabled", "true", "yes", "on", "1")
+
+def make_params(**overrides):
+    unknown = set(overrides) - set(DEFAULT_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown map generator params: {', '.join(sorted(unknown))}")
+    params = dict(DEFAULT_PARAMS)
+    params.update(overrides)
+    return params
+
+def wall_neighbours(walls):
+    """Number of walls among the eight neighbours of every tile; off-map counts as wall"""
+    padded = np.pad(walls, 1, constant_values=True).view(np.uint8)
+    width, height = walls.shape
+    counts = np.zeros((width, height), dtype=np.uint8)
+    for dx in (0, 1, 2):
+        for dy in (0, 1, 2):
+            if dx != 1 or dy != 1:
+                counts += padded[dx:dx + width, dy:dy + height]
+    return counts
+
+def smooth(walls, steps, birth, survive):
+    for _ in range(steps):
+        counts = wall_neighbours(walls)
+        walls = np.where(walls, counts >= survive, counts >= birth)
+    return walls
+
+def stamp_rooms(walls, rng, params):
+    """Carve rooms and join consecutive rooms with L-shaped corridors"""
+    width, height = walls.shape
+    low, high = params["room_size"]
+    count = max(1, round(params["rooms"] * width * height / 10000))
+    sizes = rng.integers(low, high + 1, size=(count, 2))
+    xs = rng.integers(1, np.maximum(2, width - 1 - sizes[:, 0]))
+    ys = rng.integers(1, np.maximum(2, height - 1 - sizes[:, 1]))
+    for x, y, w, h in zip(xs, ys, sizes[:, 0], sizes[:, 1]):
+        walls[x:x + w, y:y + h] = False
+
+    # Visit rooms in a sweep so corridors stay short
+    centers = np.stack([xs + sizes[:, 0] // 2, ys + sizes[:, 1] // 2], axis=1)
+    centers = centers[np.lexsort((centers[:, 1], centers[:, 0] // max(1, width // 8)))]
+    for a, b in zip(centers, centers[1:]):
+        carve_corridor(walls, a, b, params["corridor_width"])
+
+def carve_corridor(walls, a, b, corridor_width):
+    """L-shaped corridor: along x at a's row, then along y at b's column"""
+    width, height = walls.shape
+    (ax, ay), (bx, by) = a, b
+    y0 = min(max(1, ay), height - 1 - corridor_width)
+    x1 = min(max(1, bx), width - 1 - corridor_width)
+    walls[min(ax, bx):max(ax, bx) + corridor_width, y0:y0 + corridor_width] = False
+    walls[x1:x1 + corridor_width, min(ay, by):max(ay, by) + corridor_width] = False
+
+def label_regions(floor):
+    """
+    4-connected floor regions
+    :return: (labels, sizes, first) where labels is -1 on walls and a region
+             index elsewhere, sizes[i] is the tile count of region i and
+             first[i] the flat index of its first tile
+    """
+    # Every vertical run of floor gets an id
+    previous = np.zeros_like(floor)
+    previous[:, 1:] = floor[:, :-1]
+    starts = (floor & ~previous).ravel()
+    run_id = np.cumsum(starts, dtype=np.int32) - 1
+    run_start = np.flatnonzero(starts)
+    runs = len(run_start)
+    if runs == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return np.full(floor.shape, -1, dtype=np.int32), empty, empty
+    run_id = run_id.reshape(floor.shape)
+
+    # One edge per overlapping pair of runs in neighbouring columns
+    both = floor[:-1] & floor[1:]
+    overlap_start = both.copy()
+    overlap_start[:, 1:] &= ~both[:, :-1]
+    a = run_id[:-1][overlap_start]
+    b = run_id[1:][overlap_start]
+
+    # Union-find done in bulk: hook each root onto the smallest root it
+    # touches, then flatten the trees by pointer jumping, until no edge
+    # joins two different roots. Each root ends up as the lowest run id
+    # of its region, i.e. the region's first run.
+    parent = np.arange(runs, dtype=np.int32)
+    while len(a):
+        ra, rb = parent[a], parent[b]
+        joined = ra != rb
+        if not joined.any():
+            break
+        a, b, ra, rb = a[joined], b[joined], ra[joined], rb[joined]
+        np.minimum.at(parent, np.maximum(ra, rb), np.minimum(ra, rb))
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+
+    roots, region_of_run = np.unique(parent, return_inverse=True)
+    # Walls take the previous run's id (or -1) from the cumsum; masked below
+    labels = np.where(floor, region_of_run.astype(np.int32)[run_id], np.int32(-1))
+    sizes = np.bincount(labels.ravel() + 1, minlength=len(roots) + 1)[1:]
+    return labels, sizes, run_start[roots]
+
+def connect_regions(walls, rng, params):
+    """Fill in small floor pockets and join the remaining regions to the largest one"""
+    labels, sizes, first = label_regions(~walls)
+    if len(sizes) <= 1:
+        return walls
+
+    # Pockets too small to be worth a corridor become rock; the lookup's
+    # last entry covers label -1 (walls)
+    small = np.append(sizes < params["min_region"], False)
+    walls |= small[labels]
+
+    main = int(np.argmax(sizes))
+    width, height = walls.shape
+    # A random sample of the main region is plenty to find a short connection
+    sample = rng.integers(width * height, size=4096)
+    sample = sample[labels.ravel()[sample] == main]
+    main_tiles = np.stack(np.unravel_index(np.append(sample, first[main]), walls.shape), axis=1)
+
+    for region in np.flatnonzero(sizes >= params["min_region"]):
+        if region != main:
+            start = np.array(np.unravel_index(first[region], walls.shape))
+            target = main_tiles[np.abs(main_tiles - start).sum(axis=1).argmin()]
+            carve_corridor(walls, start, target, 1)
+    return walls
+
+def generate_map(width, height, seed, **params):
+    """
+    Generate a connected cave-and-rooms map
+    :param params: overrides for DEFAULT_PARAMS
+    :return: uint8 array (0 = walkable, 1 = obstacle)
+    """
+    params = make_params(**params)
+    rng = np.random.default_rng(seed)
+    walls = rng.random((width, height), dtype=np.float32) < params["fill"]
+    walls = smooth(walls, params["smooth_steps"], params["birth"], params["survive"])
+    stamp_rooms(walls, rng, params)
+
+    # Solid border so nothing walks off the map
+    walls[[0, -1], :] = True
+    walls[:, [0, -1]] = True
+    walls = connect_regions(walls, rng, params)
+
+    game_map = np.full((width, height), FLOOR, dtype=MAP_DTYPE)
+    game_map[walls] = WALL
+    return game_map
+
+def cache_key(width, height, seed, params):
+    blob = json.dumps(
+        {"version": GENERATOR_VERSION, "size": [width, height], "seed": seed, "params": params},
+        sort_keys=True,
+    )
+    return hashlib.sha256(blob.encode()).hexdigest()[:20]
+
+def load_or_generate(width, height, seed, cache_dir=MAP_CACHE_DIR, **params):
+    """
+    Open a cached map for (seed, size, params), generating and caching it on a miss
+    :return: copy-on-write memory map, so edits never reach the cached file
+    """
+    params = make_params(**params)
+    path = os.path.join(cache_dir, f"{cache_key(width, height, seed, params)}.map")
+    if not os.path.exists(path):
+        # Write under a temporary name so a crash never leaves a partial cache entry
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        save_map(tmp_path, generate_map(width, height, seed, **params))
+        os.replace(tmp_path, path)
+    return load_map(path, mode="c")
@@ -0,0 +1,317 @@
+"""
+Movement planning on tactical maps.
+
+Units move in eight directions (straight cost 1, diagonal cost sqrt(2)) and
+may not cut corners: a diagonal step needs both adjacent straight tiles to
+be walkable. Searches run on a flat, wall-padded copy of the map so every
+neighbour lookup is a single byte index with no bounds checks.
+
+PathFinder answers point-to-point queries with A* or jump point search and
+keeps Dijkstra distance fields to common targets (objectives, the squad) so
+that "how far is the nearest reachable operative" is one array lookup per
+unit. Fields are dropped when a tile change could alter them.
+"""
+import math
+import heapq
+from collections import OrderedDict
+import numpy as np
+from tactical_map import as_map
+
+SQRT2 = math.sqrt(2)
+INF = float("inf")
+
+class DistanceField:
+    """Travel cost from every tile to the nearest of a set of targets"""
+    def __init__(self, targets, distance, nearest):
+        self.targets = targets
+        self.distance = distance  # float32 (width, height), inf where unreachable
+        self.nearest = nearest    # int32 index into targets, -1 where unreachable
+
+    def cost_at(self, pos):
+        return float(self.distance[pos])
+
+    def nearest_target(self, pos):
+        """The target closest to pos by travel cost, or None if none is reachable"""
+        index = self.nearest[pos]
+        return self.targets[index] if index >= 0 else None
+
+    def next_step(self, pos):
+        """Neighbouring tile one step closer to the nearest target (pos if already there)"""
+        x, y = pos
+        width, height = self.distance.shape
+        best, best_cost = None, self.distance[x, y]
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                if dx and dy and not (np.isfinite(self.distance[nx, y]) and np.isfinite(self.distance[x, ny])):
+                    continue
+                if self.distance[nx, ny] < best_cost:
+                    best, best_cost = (nx, ny), self.distance[nx, ny]
+        return best if best is not None else (pos if best_cost == 0 else None)
+
+class PathFinder:
+    def __init__(self, game_map, cache_size=32):
+        """
+        :param game_map: 2D array (0 = walkable, anything else blocks movement)
+        :param cache_size: distance fields kept before the least recently used is dropped
+        """
+        self.game_map = as_map(game_map)
+        self.width, self.height = self.game_map.shape
+        self.stride = self.height + 2
+        self.fields = OrderedDict()  # key -> DistanceField
+        self.cache_size = cache_size
+        self.rebuild()
+
+    def rebuild(self):
+        """Re-read the whole map, e.g. after it was edited outside set_tile"""
+        padded = np.zeros((self.width + 2, self.height + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = self.game_map == 0
+        self.walk = bytearray(padded.tobytes())
+        s = self.stride
+        # (offset, cost, c1, c2): c1 and c2 are the straight neighbours that must
+        # be open for a diagonal step; 0 for straight steps (the tile itself)
+        self.moves = (
+            (s, 1.0, 0, 0), (-s, 1.0, 0, 0), (1, 1.0, 0, 0), (-1, 1.0, 0, 0),
+            (s + 1, SQRT2, s, 1), (s - 1, SQRT2, s, -1),
+            (-s + 1, SQRT2, -s, 1), (-s - 1, SQRT2, -s, -1),
+        )
+        self.fields.clear()
+
+    def index(self, pos):
+        return (pos[0] + 1) * self.stride + pos[1] + 1
+
+    def position(self, index):
+        x, y = divmod(index, self.stride)
+        return (x - 1, y - 1)
+
+    def is_walkable(self, pos):
+        x, y = pos
+        return 0 <= x < self.width and 0 <= y < self.height and self.walk[self.index(pos)] == 1
+
+    def set_tile(self, x, y, value):
+        """Change one tile and drop only the distance fields it can affect"""
+        self.game_map[x, y] = value
+        i = self.index((x, y))
+        walkable = 1 if value == 0 else 0
+        if self.walk[i] == walkable:
+            return
+        self.walk[i] = walkable
+        x0, x1, y0, y1 = max(0, x - 1), x + 2, max(0, y - 1), y + 2
+        for key, field in list(self.fields.items()):
+            # Opening or closing a tile can only change a field that reaches
+            # the tile or one of its neighbours (diagonal steps past corners)
+            if np.isfinite(field.distance[x0:x1, y0:y1]).any():
+                del self.fields[key]
+
+    def neighbours(self, i):
+        walk = self.walk
+        for offset, cost, c1, c2 in self.moves:
+            if walk[i + offset] and walk[i + c1] and walk[i + c2]:
+                yield i + offset, cost
+
+    def heuristic(self, i, goal):
+        """Octile distance, exact on an empty map"""
+        ix, iy = divmod(i, self.stride)
+        gx, gy = divmod(goal, self.stride)
+        dx, dy = abs(ix - gx), abs(iy - gy)
+        return max(dx, dy) + (SQRT2 - 1) * min(dx, dy)
+
+    def find_path(self, start, goal, method="jps"):
+        """
+        Shortest path between two tiles
+        :param method: "jps" (jump point search, fastest on rooms and open ground)
+                       or "astar" (plain A*, better on dense scattered obstacles)
+        :return: list of (x, y) tiles from start to goal inclusive, or None if unreachable
+        """
+        if not (self.is_walkable(start) and self.is_walkable(goal)):
+            return None
+        s, g = self.index(start), self.index(goal)
+        if s == g:
+            return [tuple(start)]
+        # A* over flat indices with lazy deletion of stale heap entries
+        cost = {s: 0.0}
+        parent = {s: None}
+        heap = [(self.heuristic(s, g), 0.0, s)]
+        while heap:
+            _, c, i = heapq.heappop(heap)
+            if i == g:
+                return self.expand(parent, g)
+            if c > cost[i]:
+                continue
+            if method == "jps":
+                successors = self.jump_successors(i, parent[i], g)
+            else:
+                successors = self.neighbours(i)
+            for j, step in successors:
+                new_cost = c + step
+                if new_cost < cost.get(j, INF):
+                    cost[j] = new_cost
+                    parent[j] = i
+                    heapq.heappush(heap, (new_cost + self.heuristic(j, g), new_cost, j))
+        return None
+
+    def expand(self, parent, goal):
+        """Walk parent links back from goal, filling in the tiles between jump points"""
+        points = []
+        i = goal
+        while i is not None:
+            points.append(i)
+            i = parent[i]
+        points.reverse()
+        path = [self.position(points[0])]
+        for a, b in zip(points, points[1:]):
+            ax, ay = divmod(a, self.stride)
+            bx, by = divmod(b, self.stride)
+            dx, dy = (bx > ax) - (bx < ax), (by > ay) - (by < ay)
+            step = dx * self.stride + dy
+            for k in range(1, max(abs(bx - ax), abs(by - ay)) + 1):
+                path.append(self.position(a + k * step))
+        return path
+
+    def jump_successors(self, i, parent, goal):
+        """Jump points reachable from i, pruning neighbours the parent direction makes redundant"""
+        walk, s = self.walk, self.stride
+        if parent is None:
+            directions = [move[0] for move in self.moves]
+        else:
+            ix, iy = divmod(i, s)
+            px, py = divmod(parent, s)
+            dx, dy = (ix > px) - (ix < px), (iy > py) - (iy < py)
+            directions = []
+            if dx and dy:
+                if walk[i + dy]:
+                    directions.append(dy)
+                if walk[i + dx * s]:
+                    directions.append(dx * s)
+                if walk[i + dy] and walk[i + dx * s]:
+                    directions.append(dx * s + dy)
+            elif dx:
+                ahead, up, down = walk[i + dx * s], walk[i + 1], walk[i - 1]
+                if ahead:
+                    directions.append(dx * s)
+                    if up:
+                        directions.append(dx * s + 1)
+                    if down:
+                        directions.append(dx * s - 1)
+                if up:
+                    directions.append(1)
+                if down:
+                    directions.append(-1)
+            else:
+                ahead, right, left = walk[i + dy], walk[i + s], walk[i - s]
+                if ahead:
+                    directions.append(dy)
+                    if right:
+                        directions.append(s + dy)
+                    if left:
+                        directions.append(-s + dy)
+                if right:
+                    directions.append(s)
+                if left:
+                    directions.append(-s)
+
+        for direction in directions:
+            dx, dy = divmod(direction + 1, s)
+            dy -= 1
+            if dx and dy and not (walk[i + dx * s] and walk[i + dy]):
+                continue
+            j = self.jump(i + direction, dx, dy, goal)
+            if j is not None:
+                ax, ay = divmod(i, s)
+                bx, by = divmod(j, s)
+                steps = max(abs(bx - ax), abs(by - ay))
+                yield j, steps * (SQRT2 if dx and dy else 1.0)
+
+    def jump(self, i, dx, dy, goal):
+        """Follow direction (dx, dy) from tile i until a jump point, the goal or a wall"""
+        walk, s = self.walk, self.stride
+        if dx and dy:
+            step = dx * s + dy
+            while True:
+                if not walk[i]:
+                    return None
+                if i == goal:
+                    return i
+                if (self.jump_straight(i + dx * s, dx * s, goal) is not None
+                        or self.jump_straight(i + dy, dy, goal) is not None):
+                    return i
+                if not (walk[i + dx * s] and walk[i + dy]):
+                    return None
+                i += step
+        return self.jump_straight(i, dx * s + dy, goal)
+
+    def jump_straight(self, i, step, goal):
+        """
+        Straight-line part of jump(): stop at a tile with a forced neighbour,
+        i.e. an open side tile whose diagonal approach from behind is blocked
+        """
+        walk = self.walk
+        side = 1 if abs(step) == self.stride else self.stride
+        while walk[i]:
+            if i == goal:
+                return i
+            if (walk[i + side] and not walk[i - step + side]) or (walk[i - side] and not walk[i - step - side]):
+                return i
+            i += step
+        return None
+
+    def distance_field(self, targets, key=None):
+        """
+        Dijkstra travel costs from every tile to the nearest target, cached
+        :param targets: list of (x, y) tiles; unwalkable ones are ignored
+        :param key: cache key, e.g. "objectives"; defaults to the target tuple.
+                    A named key is recomputed whenever its targets change.
+        """
+        targets = [tuple(t) for t in targets]
+        key = key if key is not None else tuple(targets)
+        field = self.fields.get(key)
+        if field is not None and field.targets == targets:
+            self.fields.move_to_end(key)
+            return field
+
+        field = self.compute_field(targets)
+        self.fields[key] = field
+        self.fields.move_to_end(key)
+        if len(self.fields) > self.cache_size:
+            self.fields.popitem(last=False)
+        return field
+
+    def compute_field(self, targets):
+        size = len(self.walk)
+        cost = [INF] * size
+        owner = [-1] * size
+        heap = []
+        for n, target in enumerate(targets):
+            if self.is_walkable(target):
+                i = self.index(target)
+                if cost[i] > 0:
+                    cost[i], owner[i] = 0.0, n
+                    heap.append((0.0, i))
+        heapq.heapify(heap)
+
+        walk, moves = self.walk, self.moves
+        while heap:
+            c, i = heapq.heappop(heap)
+            if c > cost[i]:
+                continue
+            for offset, step, c1, c2 in moves:
+                j = i + offset
+                new_cost = c + step
+                if new_cost < cost[j] and walk[j] and walk[i + c1] and walk[i + c2]:
+                    cost[j], owner[j] = new_cost, owner[i]
+                    heapq.heappush(heap, (new_cost, j))
+
+        shape = (self.width + 2, self.height + 2)
+        distance = np.array(cost, dtype=np.float32).reshape(shape)[1:-1, 1:-1]
+        nearest = np.array(owner, dtype=np.int32).reshape(shape)[1:-1, 1:-1]
+        return DistanceField(targets, distance, nearest)
+
+    def nearest_targets(self, units, targets, key=None):
+        """
+        Nearest reachable target for many units with one shared distance field
+        :return: list of (target or None, travel cost) per unit
+        """
+        field = self.distance_field(targets, key)
+        return [(field.nearest_target(pos), field.cost_at(pos)) for pos in units]
@@ -0,0 +1,80 @@
+"""
+Tactical map storage.
+
+Maps are uint8 arrays indexed [x, y] (0 = walkable, 1 = obstacle). On disk a
+map is a 16-byte header followed by the raw tiles in x-major order, so
+load_map can return an np.memmap and large maps are paged in as tiles are
+touched instead of being read up front:
+
+    magic   b"BOMAP1\\0\\0"
+    width   uint32, little-endian
+    height  uint32, little-endian
+    tiles   width * height bytes
+"""
+import os
+import struct
+import numpy as np
+
+FLOOR, WALL = 0, 1
+MAP_DTYPE = np.uint8
+MAP_MAGIC = b"BOMAP1\0\0"
+HEADER = struct.Struct("<8sII")
+
+def as_map(game_map):
+    """Return game_map as a uint8 array, without copying if it already is one"""
+    return np.asarray(game_map, dtype=MAP_DTYPE)
+
+def new_map(width, height, fill=FLOOR):
+    return np.full((width, height), fill, dtype=MAP_DTYPE)
+
+def random_map(width, height, density=0.3, rng=None):
+    """Uniform obstacle noise, mostly useful for tests and benchmarks"""
+    rng = rng if rng is not None else np.random.default_rng()
+    return (rng.random((width, height)) < density).astype(MAP_DTYPE)
+
+def read_header(path):
+    """
+    :return: (width, height) of a map file
+    """
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+    if len(header) != HEADER.size:
+        raise ValueError(f"{path}: truncated map header")
+    magic, width, height = HEADER.unpack(header)
+    if magic != MAP_MAGIC:
+        raise ValueError(f"{path}: not a tactical map file")
+    expected = HEADER.size + width * height
+    if os.path.getsize(path) < expected:
+        raise ValueError(f"{path}: expected {expected} bytes for a {width}x{height} map")
+    return width, height
+
+def save_map(path, game_map):
+    """Write a map file; the parent directory is created if needed"""
+    game_map = as_map(game_map)
+    width, height = game_map.shape
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAP_MAGIC, width, height))
+        np.ascontiguousarray(game_map).tofile(f)
+    return path
+
+def create_map_file(path, width, height):
+    """
+    Create an all-floor map file and open it for writing, without ever
+    holding the whole map in memory
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAP_MAGIC, width, height))
+        f.truncate(HEADER.size + width * height)
+    return load_map(path, mode="r+")
+
+def load_map(path, mode="r"):
+    """
+    Open a map file as a memory-mapped uint8 array
+    :param mode: "r" read-only, "r+" write tile changes through to the file,
+                 "c" copy-on-write (changes stay in memory)
+    """
+    width, height = read_header(path)
+    return np.memmap(path, dtype=MAP_DTYPE, mode=mode, offset=HEADER.size,
+                     shape=(width, height))
@@ -1,65 +1,277 @@
-import math
+import sys
+from collections import OrderedDict
 import numpy as np
 import pygame
+from tactical_map import as_map, load_map, random_map
+from map_generator import generator_enabled, generate_map, load_or_generate
 
 # Configuration Constants (adjust based on your game needs)
 MAP_WIDTH = 50   # Grid cells wide
 MAP_HEIGHT = 50  # Grid cells high
 TILE_SIZE = 32   # Pixels per grid cell
 
+# Symmetric shadowcasting works on four quadrants; each maps a (depth, col)
+# pair with -depth <= col <= depth to a grid offset (dx, dy)
+QUADRANTS = (
+    lambda depth, col: (col, -depth),   # north
+    lambda depth, col: (col, depth),    # south
+    lambda depth, col: (depth, col),    # east
+    lambda depth, col: (-depth, col),   # west
+)
+
+# Fog colour per tile state: 0 = unexplored, 1 = explored, 2 = visible
+FOG_RGB = np.array([(30, 30, 40), (60, 60, 80), (0, 0, 0)], dtype=np.uint8)
+FOG_ALPHA = np.array([240, 200, 0], dtype=np.uint8)
+
+# Terrain colour per tile: ground, obstacle
+TERRAIN_COLORS = np.array([(50, 60, 40), (80, 70, 60)], dtype=np.uint8)
+CHUNK_TILES = 16  # Terrain is cached in square chunks of this many tiles
+
+# Per-wall shadow masks, one bit per quadrant probe
+SHADOW, TOUCH_HIGH, TOUCH_LOW, SHADOW_LEFT, SHADOW_RIGHT = range(5)
+
+class FOVTable:
+    """
+    Precomputed shadowcasting geometry for one sight range.
+
+    Every (depth, col) position of a quadrant gets a bit mask of the probes
+    of that quadrant its shadow covers when it is a wall. A probe is one
+    tile seen from one quadrant (tiles on the diagonals and axes are probed
+    from two). Following symmetric shadowcasting, a wall at (depth d, col c)
+    shadows slopes ((2c-1)/2d, (2c+1)/2d); a floor tile is visible when its
+    centre slope is outside every nearer shadow and not pinched between two
+    shadows that touch exactly there, and a wall tile is visible when any
+    part of it is (sampled at its centre and both edges, so a wall glimpsed
+    only through a sliver narrower than half a tile stays dark). The four
+    quadrants share the masks, since a wall only shadows its own quadrant,
+    and computing a field of view is one OR-reduction per quadrant of the
+    masks of the walls in it.
+    """
+    def __init__(self, radius):
+        self.radius = radius
+        self.size = 2 * radius + 1
+        n_tiles = self.size * self.size
+
+        # All (depth, col) pairs of one quadrant; probes are clipped to the sight circle
+        depth = np.concatenate([np.full(2 * d + 1, d) for d in range(1, radius + 1)])
+        col = np.concatenate([np.arange(-d, d + 1) for d in range(1, radius + 1)])
+        inside = depth * depth + col * col <= radius * (radius + 1)
+        p_depth, p_col = depth[inside], col[inside]
+        n_probes = p_depth.size
+        quad_bits = (n_probes + 63) // 64 * 64
+
+        # Shadow relations between probes (rows) and potential walls (columns)
+        d, c = p_depth[:, None], p_col[:, None]
+        wd, wc = depth[None, :], col[None, :]
+        nearer = wd < d
+        centre = 2 * c * wd  # centre slope c/d scaled by 2*d*wd
+        low = (2 * wc - 1) * d
+        high = (2 * wc + 1) * d
+        left = ((2 * p_col - 1) / (2 * p_depth) + 1e-9)[:, None]
+        right = ((2 * p_col + 1) / (2 * p_depth) - 1e-9)[:, None]
+        w_low = (2 * wc - 1) / (2 * wd)
+        w_high = (2 * wc + 1) / (2 * wd)
+        relations = np.stack([
+            nearer & (low < centre) & (centre < high),
+            nearer & (centre == high),
+            nearer & (centre == low),
+            nearer & (w_low < left) & (left < w_high),
+            nearer & (w_low < right) & (right < w_high),
+        ]).transpose(2, 0, 1)
+        relations = np.pad(relations, ((0, 0), (0, 0), (0, quad_bits - n_probes)))
+        # (depth, col) pair -> (5, quad_bits // 64) masks, pairs in depth order
+        self.masks = np.packbits(relations, axis=2, bitorder="little").view(np.uint64)
+
+        # Window tile of each quadrant's pairs, and of each probe bit
+        self.quad_tiles = np.empty((4, depth.size), dtype=np.int64)
+        self.probe_tile = np.full(4 * quad_bits, n_tiles, dtype=np.int64)
+        for q, transform in enumerate(QUADRANTS):
+            dx, dy = transform(depth, col)
+            self.quad_tiles[q] = (dx + radius) * self.size + (dy + radius)
+            dx, dy = transform(p_depth, p_col)
+            self.probe_tile[q * quad_bits:q * quad_bits + n_probes] = (dx + radius) * self.size + (dy + radius)
+
+        # At long range the nearer half of the walls is OR-ed first, so a
+        # quadrant already dark beyond it (common on dense maps) skips the rest.
+        # Each band costs a fixed few numpy calls, so short ranges use one.
+        probe_depth = np.zeros(quad_bits, dtype=np.int64)
+        probe_depth[:n_probes] = p_depth
+        bands = [radius // 2, radius] if radius >= 24 else [radius]
+        self.bands = [
+            (int(np.searchsorted(depth, band, side="right")),
+             np.packbits(probe_depth > band, bitorder="little").view(np.uint64))
+            for band in bands
+        ]
+
+    def compute(self, opaque):
+        """
+        Field of view inside the window
+        :param opaque: (size, size) boolean window centred on the observer
+        :return: (size, size) boolean visibility window
+        """
+        flat = opaque.ravel()
+        is_wall = flat[self.quad_tiles]
+        shadow = np.zeros((4,) + self.masks.shape[1:], dtype=np.uint64)
+
+        quadrants = np.arange(4)
+        start = 0
+        for end, deeper in self.bands:
+            quad, pair = np.nonzero(is_wall[quadrants, start:end])
+            if pair.size:
+                # One reduction over every quadrant's walls, split per quadrant
+                counts = np.bincount(quad, minlength=quadrants.size)
+                walled = np.flatnonzero(counts)
+                offsets = np.concatenate(([0], np.cumsum(counts[walled])[:-1]))
+                shadow[quadrants[walled]] |= np.bitwise_or.reduceat(self.masks[pair + start], offsets, axis=0)
+            start = end
+            # Shadows only grow, so a quadrant is done once every deeper probe is dark
+            dark = shadow[quadrants, SHADOW] & shadow[quadrants, SHADOW_LEFT] & shadow[quadrants, SHADOW_RIGHT]
+            quadrants = quadrants[((dark & deeper) != deeper).any(axis=1)]
+            if not quadrants.size:
+                break
+
+        # (5, probe bits) in the quadrant order of probe_tile
+        shadow = np.ascontiguousarray(shadow.transpose(1, 0, 2)).reshape(5, -1)
+        bits = np.unpackbits(shadow.view(np.uint8), axis=1, bitorder="little").astype(bool)
+        centre_visible = ~(bits[SHADOW] | (bits[TOUCH_HIGH] & bits[TOUCH_LOW]))
+        probe_is_wall = np.append(flat, False)[self.probe_tile]
+        visible = centre_visible | (probe_is_wall & ~(bits[SHADOW_LEFT] & bits[SHADOW_RIGHT]))
+
+        result = np.zeros(flat.size + 1, dtype=bool)
+        result[self.probe_tile[visible]] = True
+        result[self.radius * self.size + self.radius] = True  # observer
+        return result[:-1].reshape(self.size, self.size)
+
+_fov_tables = {}
+
+def get_fov_table(radius):
+    """FOV tables are shared by every observer with the same sight range"""
+    if radius not in _fov_tables:
+        _fov_tables[radius] = FOVTable(radius)
+    return _fov_tables[radius]
+
+def compute_fov(game_map, observer_pos, radius):
+    """
+    Symmetric shadowcasting field of view around one observer
+    :param game_map: 2D array (0 = walkable, 1 = obstacle)
+    :return: (x_slice, y_slice, visible) where visible covers game_map[x_slice, y_slice]
+    """
+    table = get_fov_table(radius)
+    width, height = game_map.shape
+    x0, y0 = observer_pos
+    x_lo, x_hi = max(0, x0 - radius), min(width, x0 + radius + 1)
+    y_lo, y_hi = max(0, y0 - radius), min(height, y0 + radius + 1)
+    wx, wy = x_lo - (x0 - radius), y_lo - (y0 - radius)
+
+    # Tiles beyond the map edge cast no shadows; they are clipped from the result
+    opaque = np.zeros((table.size, table.size), dtype=bool)
+    opaque[wx:wx + x_hi - x_lo, wy:wy + y_hi - y_lo] = game_map[x_lo:x_hi, y_lo:y_hi] == 1
+
+    visible = table.compute(opaque)
+    return (slice(x_lo, x_hi), slice(y_lo, y_hi),
+            visible[wx:wx + x_hi - x_lo, wy:wy + y_hi - y_lo])
+
+def merge_dirty(current, box):
+    """Union of two dirty regions: True (everything), a tile box (x0, x1, y0, y1) or False"""
+    if current is True or box is True:
+        return True
+    if not current:
+        return box
+    if not box:
+        return current
+    return (min(current[0], box[0]), max(current[1], box[1]),
+            min(current[2], box[2]), max(current[3], box[3]))
+
 class VisionSystem:
     def __init__(self, game_map):
         """
         Initialize the vision system
         :param game_map: 2D array representing the game map (0 = walkable, 1 = obstacle)
         """
-        self.game_map = game_map
-        self.visible = np.zeros((MAP_WIDTH, MAP_HEIGHT), dtype=bool)
-        self.explored = np.zeros((MAP_WIDTH, MAP_HEIGHT), dtype=bool)
+        self.game_map = as_map(game_map)
+        self.width, self.height = self.game_map.shape
+        self.visible = np.zeros((self.width, self.height), dtype=bool)
+        self.explored = np.zeros((self.width, self.height), dtype=bool)
         self.sight_range = 8  # Default vision radius
         self.fow_surface = None
+        self.fow_tiles = None  # one pixel per tile, scaled up into fow_surface
+        self.fog_pixels = None  # fow_tiles pixel value per tile state
+        self.fow_dirty = True  # True = whole layer, (x0, x1, y0, y1) = tile box, False = clean
+        self.fow_scaled_dirty = True  # same, for the full-size fow_surface
+        self.fow_view = None  # camera-sized fog, see get_fow_view
+        self.fow_view_rect = None  # tile_rect fow_view currently shows
+        self.fow_view_dirty = True  # same as fow_dirty, for fow_view
+        self.fov_window = None  # (x_slice, y_slice) touched by the last update
         
     def update_vision(self, observer_pos):
         """
-        Update visible and explored tiles using raycasting
+        Update visible and explored tiles using symmetric shadowcasting
         :param observer_pos: (x, y) tuple of observer's grid position
         """
-        self.visible.fill(False)
+        # Only the last update's window can hold visible tiles, so only it
+        # and the new window need clearing and repainting
+        if self.fov_window is None:
+            self.visible.fill(False)
+        else:
+            xs, ys = self.fov_window
+            self.visible[xs, ys] = False
+            self.mark_fow_dirty((xs.start, xs.stop, ys.start, ys.stop))
+        self.fov_window = None
         x0, y0 = observer_pos
         
         # If out of bounds, return early
-        if not (0 <= x0 < MAP_WIDTH and 0 <= y0 < MAP_HEIGHT):
+        if not (0 <= x0 < self.width and 0 <= y0 < self.height):
             return
             
-        # Mark observer's position as visible
-        self.visible[x0, y0] = True
-        self.explored[x0, y0] = True
-        
-        # Scan through 360 degrees
-        for angle in range(0, 360, 2):  # Step by 2 degrees
-            rad = math.radians(angle)
-            dx = math.cos(rad)
-            dy = math.sin(rad)
+        xs, ys, visible = compute_fov(self.game_map, observer_pos, self.sight_range)
+        self.visible[xs, ys] = visible
+        self.explored[xs, ys] |= visible
+        self.fov_window = (xs, ys)
+        self.mark_fow_dirty((xs.start, xs.stop, ys.start, ys.stop))
+
+    def update_vision_incremental(self, observer_pos):
+        """
+        Move the observer without clearing the whole map. Only the windows
+        around the old and new positions are touched, and only tiles whose
+        fog state changed are repainted by get_fow_surface.
+        :param observer_pos: (x, y) tuple of observer's grid position
+        :return: (x_slice, y_slice, changed) boolean mask of tiles whose
+                 visibility changed, covering visible[x_slice, y_slice]
+        """
+        if self.fov_window is None:
+            self.update_vision(observer_pos)
+            return slice(0, self.width), slice(0, self.height), np.ones((self.width, self.height), dtype=bool)
             
-            # Cast ray with small increments
-            for distance in range(1, self.sight_range + 1):
-                x = int(x0 + dx * distance)
-                y = int(y0 + dy * distance)
-                
-                # Stop if out of bounds
-                if not (0 <= x < MAP_WIDTH and 0 <= y < MAP_HEIGHT):
-                    break
-                
-                # Mark as visible and explored
-                self.visible[x, y] = True
-                self.explored[x, y] = True
-                
-                # Stop ray at obstacles
-                if self.game_map[x][y] == 1:  # 1 represents obstacle
-                    break
-                    
-        # Invalidate cached fog surface
-        self.fow_surface = None
+        old_xs, old_ys = self.fov_window
+        x0, y0 = observer_pos
+        if 0 <= x0 < self.width and 0 <= y0 < self.height:
+            new_xs, new_ys, visible = compute_fov(self.game_map, observer_pos, self.sight_range)
+            self.fov_window = (new_xs, new_ys)
+        else:
+            new_xs, new_ys, visible = old_xs, old_ys, None
+            self.fov_window = None
+            
+        # Union of the old and new windows
+        xs = slice(min(old_xs.start, new_xs.start), max(old_xs.stop, new_xs.stop))
+        ys = slice(min(old_ys.start, new_ys.start), max(old_ys.stop, new_ys.stop))
+        before = self.visible[xs, ys].copy()
+        self.visible[old_xs, old_ys] = False
+        if visible is not None:
+            self.visible[new_xs, new_ys] = visible
+            self.explored[new_xs, new_ys] |= visible
+        changed = before != self.visible[xs, ys]
+        
+        # Explored-but-hidden and visible tiles differ only where visibility flipped
+        rows = np.flatnonzero(changed.any(axis=1))
+        if rows.size:
+            cols = np.flatnonzero(changed.any(axis=0))
+            self.mark_fow_dirty((xs.start + rows[0], xs.start + rows[-1] + 1,
+                                 ys.start + cols[0], ys.start + cols[-1] + 1))
+        return xs, ys, changed
+
+    def mark_fow_dirty(self, box):
+        """Add a tile box (x0, x1, y0, y1) to the region get_fow_surface repaints"""
+        self.fow_dirty = merge_dirty(self.fow_dirty, box)
 
     def is_visible(self, pos):
         """
@@ -68,67 +280,367 @@ class VisionSystem:
         :return: Boolean visibility status
         """
         x, y = pos
-        if 0 <= x < MAP_WIDTH and 0 <= y < MAP_HEIGHT:
+        if 0 <= x < self.width and 0 <= y < self.height:
             return self.visible[x, y]
         return False
 
+    def sync_fow_tiles(self):
+        """Bring the one-pixel-per-tile fog layer up to date"""
+        if self.fow_tiles is None:
+            self.fow_tiles = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            self.fow_dirty = True
+        if not self.fow_dirty:
+            return
+        box = (0, self.width, 0, self.height) if self.fow_dirty is True else self.fow_dirty
+        self.build_fow_tiles(box)
+        self.fow_scaled_dirty = merge_dirty(self.fow_scaled_dirty, box)
+        self.fow_view_dirty = merge_dirty(self.fow_view_dirty, box)
+        self.fow_dirty = False
+
     def get_fow_surface(self):
         """
         Generate fog-of-war overlay surface
         :return: Pygame surface with fog of war
         """
-        if self.fow_surface:
+        self.sync_fow_tiles()
+        if self.fow_surface is None:
+            # Create the surface with per-pixel alpha once and reuse it
+            self.fow_surface = pygame.Surface(
+                (self.width * TILE_SIZE, self.height * TILE_SIZE), 
+                pygame.SRCALPHA
+            )
+            self.fow_scaled_dirty = True
+        if not self.fow_scaled_dirty:
             return self.fow_surface
             
-        # Create new surface with per-pixel alpha
-        self.fow_surface = pygame.Surface(
-            (MAP_WIDTH * TILE_SIZE, MAP_HEIGHT * TILE_SIZE), 
-            pygame.SRCALPHA
-        )
+        if self.fow_scaled_dirty is True:
+            box = (0, self.width, 0, self.height)
+        else:
+            box = self.fow_scaled_dirty
         
-        # Draw fog based on visibility states
-        for x in range(MAP_WIDTH):
-            for y in range(MAP_HEIGHT):
-                if not self.explored[x, y]:
-                    # Unexplored - dark gray
-                    pygame.draw.rect(
-                        self.fow_surface, (30, 30, 40, 240),
-                        (x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                    )
-                elif not self.visible[x, y]:
-                    # Explored but not visible - medium gray
-                    pygame.draw.rect(
-                        self.fow_surface, (60, 60, 80, 200),
-                        (x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                    )
-                # Visible areas remain transparent
-                    
+        self.scale_fow_tiles(self.fow_surface, box, (0, 0))
+        self.fow_scaled_dirty = False
         return self.fow_surface
 
+    def get_fow_view(self, tile_rect):
+        """
+        Fog overlay for part of the map only, for camera views of maps too
+        large for a full-size fog surface. Like get_fow_surface, only tiles
+        repainted since the last call are scaled again; when the camera pans,
+        the view is scrolled and only the newly exposed tiles are scaled.
+        :param tile_rect: (x, y, width, height) in tiles, already clipped to the map
+        :return: Pygame surface covering tile_rect at TILE_SIZE per tile
+        """
+        self.sync_fow_tiles()
+        x, y, w, h = tile_rect = tuple(tile_rect)
+        size = (w * TILE_SIZE, h * TILE_SIZE)
+        if self.fow_view is None or self.fow_view.get_size() != size:
+            self.fow_view = pygame.Surface(size, pygame.SRCALPHA)
+            self.fow_view_rect = None
+        
+        if self.fow_view_rect is None:
+            dirty = [(x, x + w, y, y + h)]
+        else:
+            dirty = []
+            old_x, old_y = self.fow_view_rect[:2]
+            dx, dy = x - old_x, y - old_y
+            if abs(dx) >= w or abs(dy) >= h:
+                dirty.append((x, x + w, y, y + h))
+            elif dx or dy:
+                self.fow_view.scroll(-dx * TILE_SIZE, -dy * TILE_SIZE)
+                # Columns and rows that scrolled into view
+                if dx:
+                    x0, x1 = (x + w - dx, x + w) if dx > 0 else (x, x - dx)
+                    dirty.append((x0, x1, y, y + h))
+                if dy:
+                    y0, y1 = (y + h - dy, y + h) if dy > 0 else (y, y - dy)
+                    dirty.append((x, x + w, y0, y1))
+            if self.fow_view_dirty:
+                box = (0, self.width, 0, self.height) if self.fow_view_dirty is True else self.fow_view_dirty
+                dirty.append(box)
+        
+        for x0, x1, y0, y1 in dirty:
+            # Only the part of each box under the camera
+            x0, x1 = max(x0, x), min(x1, x + w)
+            y0, y1 = max(y0, y), min(y1, y + h)
+            if x0 < x1 and y0 < y1:
+                self.scale_fow_tiles(self.fow_view, (x0, x1, y0, y1), (x, y))
+        self.fow_view_rect = tile_rect
+        self.fow_view_dirty = False
+        return self.fow_view
+
+    def scale_fow_tiles(self, surface, box, origin):
+        """
+        Nearest-neighbour upscale of a tile box of the fog layer
+        :param surface: fog surface whose top-left pixel shows tile origin
+        :param box: (x0, x1, y0, y1) tile box to scale
+        """
+        x0, x1, y0, y1 = box
+        tiles = self.fow_tiles.subsurface((x0, y0, x1 - x0, y1 - y0))
+        target = surface.subsurface(
+            ((x0 - origin[0]) * TILE_SIZE, (y0 - origin[1]) * TILE_SIZE,
+             (x1 - x0) * TILE_SIZE, (y1 - y0) * TILE_SIZE)
+        )
+        pygame.transform.scale(tiles, target.get_size(), target)
+
+    def build_fow_tiles(self, box=None):
+        """
+        Write the fog state of each tile into the one-pixel-per-tile surface
+        :param box: (x0, x1, y0, y1) tile box to write, or None for the whole map
+        """
+        x0, x1, y0, y1 = box or (0, self.width, 0, self.height)
+        
+        # Visible areas stay transparent. Each state's colour is mapped to
+        # the surface's pixel format once, so painting is one lookup and
+        # one write of whole pixels
+        if self.fog_pixels is None:
+            colors = [(*rgb, alpha) for rgb, alpha in zip(FOG_RGB, FOG_ALPHA)]
+            self.fog_pixels = np.array(
+                [self.fow_tiles.map_rgb(color) & 0xFFFFFFFF for color in colors], dtype=np.uint32
+            )
+        state = self.explored[x0:x1, y0:y1].astype(np.uint8) + self.visible[x0:x1, y0:y1]
+        pixels = pygame.surfarray.pixels2d(self.fow_tiles)
+        pixels[x0:x1, y0:y1] = self.fog_pixels[state]
+        del pixels
+
     def reset_exploration(self):
         """Reset map exploration (for new missions)"""
         self.explored.fill(False)
         self.visible.fill(False)
-        self.fow_surface = None
+        self.fov_window = None
+        self.fow_dirty = True
+
+class SquadVision:
+    def __init__(self, game_map, sight_range=8, cache_size=4096):
+        """
+        Field of view for many observers (operatives and enemies alike)
+        :param game_map: 2D array representing the game map (0 = walkable, 1 = obstacle)
+        :param sight_range: default vision radius for new observers
+        :param cache_size: number of (position, sight range) results kept
+        
+        Each result is stored bit-packed: one np.uint64 row mask per map
+        column x, covering the full height, but only for the columns inside
+        the observer's window. A team's visibility is the bitwise OR of its
+        members' rows.
+        """
+        self.game_map = as_map(game_map)
+        self.width, self.height = self.game_map.shape
+        self.words = (self.height + 63) // 64
+        self.sight_range = sight_range
+        self.observers = {}  # unit_id -> (pos, sight_range, team)
+        self.cache = OrderedDict()  # (pos, sight_range) -> (x_slice, rows)
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+
+    def set_observer(self, unit_id, pos, sight_range=None, team="squad"):
+        self.observers[unit_id] = (tuple(pos), sight_range or self.sight_range, team)
+
+    def remove_observer(self, unit_id):
+        self.observers.pop(unit_id, None)
+
+    def update(self, positions, team="squad"):
+        """Move several observers at once: {unit_id: (x, y)}"""
+        for unit_id, pos in positions.items():
+            previous = self.observers.get(unit_id)
+            sight_range = previous[1] if previous else None
+            self.set_observer(unit_id, pos, sight_range, team)
+
+    def observer_mask(self, unit_id):
+        """
+        Packed visibility of one observer
+        :return: (x_slice, rows) where rows[i] is the uint64 row mask of column x_slice.start + i
+        """
+        pos, sight_range, _ = self.observers[unit_id]
+        key = (pos, sight_range)
+        if key in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return self.cache[key]
+            
+        self.misses += 1
+        x0, y0 = pos
+        if 0 <= x0 < self.width and 0 <= y0 < self.height:
+            xs, ys, visible = compute_fov(self.game_map, pos, sight_range)
+            bits = np.zeros((visible.shape[0], self.words * 64), dtype=bool)
+            bits[:, ys] = visible
+            rows = np.packbits(bits, axis=1, bitorder="little").view(np.uint64)
+        else:
+            xs, rows = slice(0, 0), np.zeros((0, self.words), dtype=np.uint64)
+            
+        self.cache[key] = (xs, rows)
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return xs, rows
+
+    def team_mask(self, team="squad"):
+        """Bitwise OR of every observer on a team: (width, words) uint64"""
+        mask = np.zeros((self.width, self.words), dtype=np.uint64)
+        for unit_id, (_, _, unit_team) in self.observers.items():
+            if unit_team == team:
+                xs, rows = self.observer_mask(unit_id)
+                mask[xs] |= rows
+        return mask
+
+    def team_visible(self, team="squad"):
+        """Unpacked (width, height) boolean visibility of a team"""
+        mask = self.team_mask(team)
+        bits = np.unpackbits(mask.view(np.uint8), axis=1, bitorder="little")
+        return bits[:, :self.height].astype(bool)
+
+    def can_see(self, pos, team="squad"):
+        """Whether any observer on a team sees a tile"""
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        word, bit = divmod(y, 64)
+        for unit_id, (_, _, unit_team) in self.observers.items():
+            if unit_team != team:
+                continue
+            xs, rows = self.observer_mask(unit_id)
+            if xs.start <= x < xs.stop and (int(rows[x - xs.start, word]) >> bit) & 1:
+                return True
+        return False
+
+    def invalidate(self, box=None):
+        """
+        Drop cached results after the map changes
+        :param box: (x0, x1, y0, y1) tile box that changed, or None for everything
+        """
+        if box is None:
+            self.cache.clear()
+            return
+        x0, x1, y0, y1 = box
+        stale = [
+            key for key in self.cache
+            if abs(key[0][0] - min(max(key[0][0], x0), x1 - 1)) <= key[1]
+            and abs(key[0][1] - min(max(key[0][1], y0), y1 - 1)) <= key[1]
+        ]
+        for key in stale:
+            del self.cache[key]
+
+class Camera:
+    def __init__(self, viewport_size, world_size):
+        """
+        Viewport onto a map larger than the window
+        :param viewport_size: (width, height) in pixels
+        :param world_size: (width, height) of the whole map in pixels
+        """
+        self.rect = pygame.Rect((0, 0), viewport_size)
+        self.world = pygame.Rect((0, 0), world_size)
+
+    def center_on(self, pixel_pos):
+        self.rect.center = pixel_pos
+        self.rect.clamp_ip(self.world)
+
+    def tile_rect(self, game_map_shape):
+        """Tiles under the viewport as (x, y, width, height), clipped to the map"""
+        width, height = game_map_shape
+        x0 = max(0, self.rect.left // TILE_SIZE)
+        y0 = max(0, self.rect.top // TILE_SIZE)
+        x1 = min(width, -(-self.rect.right // TILE_SIZE))
+        y1 = min(height, -(-self.rect.bottom // TILE_SIZE))
+        return (x0, y0, max(0, x1 - x0), max(0, y1 - y0))
+
+    def to_screen(self, pixel_pos):
+        return (pixel_pos[0] - self.rect.left, pixel_pos[1] - self.rect.top)
+
+class TerrainRenderer:
+    def __init__(self, game_map, chunk_tiles=CHUNK_TILES, cache_size=64):
+        """
+        Terrain rasterized once into cached chunk surfaces
+        :param game_map: 2D array representing the game map (0 = walkable, 1 = obstacle)
+        :param chunk_tiles: chunk edge length in tiles
+        :param cache_size: chunks kept before the least recently drawn are dropped
+        """
+        self.game_map = as_map(game_map)
+        self.chunk_tiles = chunk_tiles
+        self.chunk_px = chunk_tiles * TILE_SIZE
+        self.chunks = OrderedDict()  # (cx, cy) -> Surface
+        self.cache_size = cache_size
+        self.chunks_built = 0
+
+    def set_tile(self, x, y, value):
+        self.game_map[x, y] = value
+        self.invalidate_tile(x, y)
+
+    def invalidate_tile(self, x, y):
+        self.chunks.pop((x // self.chunk_tiles, y // self.chunk_tiles), None)
+
+    def invalidate(self):
+        self.chunks.clear()
+
+    def get_chunk(self, cx, cy):
+        key = (cx, cy)
+        if key in self.chunks:
+            self.chunks.move_to_end(key)
+            return self.chunks[key]
+            
+        x0, y0 = cx * self.chunk_tiles, cy * self.chunk_tiles
+        tiles = self.game_map[x0:x0 + self.chunk_tiles, y0:y0 + self.chunk_tiles]
+        colors = TERRAIN_COLORS[(tiles == 1).astype(np.intp)]
+        small = pygame.surfarray.make_surface(colors)
+        chunk = pygame.transform.scale(small, (tiles.shape[0] * TILE_SIZE, tiles.shape[1] * TILE_SIZE))
+        if pygame.display.get_surface() is not None:
+            chunk = chunk.convert()
+            
+        self.chunks[key] = chunk
+        self.chunks_built += 1
+        if len(self.chunks) > self.cache_size:
+            self.chunks.popitem(last=False)
+        return chunk
+
+    def draw(self, surface, camera):
+        """Blit only the chunks intersecting the camera viewport"""
+        width, height = self.game_map.shape
+        view = camera.rect
+        cx0, cy0 = view.left // self.chunk_px, view.top // self.chunk_px
+        cx1 = min((view.right - 1) // self.chunk_px, (width - 1) // self.chunk_tiles)
+        cy1 = min((view.bottom - 1) // self.chunk_px, (height - 1) // self.chunk_tiles)
+        for cx in range(max(0, cx0), cx1 + 1):
+            for cy in range(max(0, cy0), cy1 + 1):
+                surface.blit(self.get_chunk(cx, cy),
+                             (cx * self.chunk_px - view.left, cy * self.chunk_px - view.top))
+
+def nearest_floor(game_map, pos):
+    """Walkable tile closest to pos (pos itself if walkable)"""
+    if game_map[pos] == 0:
+        return tuple(pos)
+    floor = np.argwhere(game_map == 0)
+    if not len(floor):
+        return tuple(pos)
+    return tuple(int(v) for v in floor[np.abs(floor - pos).sum(axis=1).argmin()])
 
 # Example usage with PyGame dashboard
 class GameDashboard:
-    def __init__(self):
+    def __init__(self, map_size=(MAP_WIDTH, MAP_HEIGHT), viewport_size=(1600, 1600),
+                 map_path=None, seed=None):
         pygame.init()
+        if map_path:
+            self.game_map = load_map(map_path)
+        elif generator_enabled():
+            # Seeded maps are cached on disk; unseeded ones are throwaway
+            if seed is None:
+                self.game_map = generate_map(*map_size, seed=None)
+            else:
+                self.game_map = load_or_generate(*map_size, seed=seed)
+        else:
+            # Generate a sample map (0 = empty, 1 = obstacle)
+            self.game_map = random_map(*map_size, rng=np.random.default_rng(seed))
+        self.map_width, self.map_height = self.game_map.shape
+        world_size = (self.map_width * TILE_SIZE, self.map_height * TILE_SIZE)
         self.screen = pygame.display.set_mode(
-            (MAP_WIDTH * TILE_SIZE, MAP_HEIGHT * TILE_SIZE)
+            (min(viewport_size[0], world_size[0]), min(viewport_size[1], world_size[1]))
         )
         pygame.display.set_caption("BlackOpsMissionCommand - Tactical Dashboard")
         self.clock = pygame.time.Clock()
         
-        # Generate a sample map (0 = empty, 1 = obstacle)
-        self.game_map = np.random.choice(
-            [0, 1], size=(MAP_WIDTH, MAP_HEIGHT), p=[0.7, 0.3]
-        ).tolist()
-        
-        # Create vision system
+        # Create vision system, terrain cache and camera
         self.vision = VisionSystem(self.game_map)
-        self.player_pos = (MAP_WIDTH // 2, MAP_HEIGHT // 2)
+        self.terrain = TerrainRenderer(self.game_map)
+        self.camera = Camera(self.screen.get_size(), world_size)
+        self.font = pygame.font.SysFont(None, 24)
+        self.player_pos = nearest_floor(self.game_map, (self.map_width // 2, self.map_height // 2))
         self.vision.update_vision(self.player_pos)
         
     def handle_events(self):
@@ -139,43 +651,43 @@ class GameDashboard:
                 x, y = self.player_pos
                 if event.key == pygame.K_UP and y > 0:
                     self.player_pos = (x, y-1)
-                elif event.key == pygame.K_DOWN and y < MAP_HEIGHT-1:
+                elif event.key == pygame.K_DOWN and y < self.map_height-1:
                     self.player_pos = (x, y+1)
                 elif event.key == pygame.K_LEFT and x > 0:
                     self.player_pos = (x-1, y)
-                elif event.key == pygame.K_RIGHT and x < MAP_WIDTH-1:
+                elif event.key == pygame.K_RIGHT and x < self.map_width-1:
                     self.player_pos = (x+1, y)
                 elif event.key == pygame.K_r:
                     self.vision.reset_exploration()
                     
-                self.vision.update_vision(self.player_pos)
+                self.vision.update_vision_incremental(self.player_pos)
         return True
         
     def render(self):
+        px, py = self.player_pos
+        player_px = (px * TILE_SIZE + TILE_SIZE//2, py * TILE_SIZE + TILE_SIZE//2)
+        self.camera.center_on(player_px)
+        
         # Draw terrain
         self.screen.fill((40, 40, 50))  # Dark background
-        for x in range(MAP_WIDTH):
-            for y in range(MAP_HEIGHT):
-                rect = (x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                if self.game_map[x][y] == 1:
-                    pygame.draw.rect(self.screen, (80, 70, 60), rect)  # Obstacles
-                else:
-                    pygame.draw.rect(self.screen, (50, 60, 40), rect)  # Ground
+        self.terrain.draw(self.screen, self.camera)
                     
         # Draw player
-        px, py = self.player_pos
         pygame.draw.circle(
             self.screen, (0, 255, 0),
-            (px * TILE_SIZE + TILE_SIZE//2, py * TILE_SIZE + TILE_SIZE//2),
+            self.camera.to_screen(player_px),
             TILE_SIZE//3
         )
         
-        # Draw fog of war
-        self.screen.blit(self.vision.get_fow_surface(), (0, 0))
+        # Draw fog of war over the visible tiles only
+        tile_rect = self.camera.tile_rect((self.map_width, self.map_height))
+        self.screen.blit(
+            self.vision.get_fow_view(tile_rect),
+            self.camera.to_screen((tile_rect[0] * TILE_SIZE, tile_rect[1] * TILE_SIZE))
+        )
         
         # Draw UI elements
-        font = pygame.font.SysFont(None, 24)
-        text = font.render("Arrow keys: Move | R: Reset Fog of War", True, (255, 255, 255))
+        text = self.font.render("Arrow keys: Move | R: Reset Fog of War", True, (255, 255, 255))
         self.screen.blit(text, (10, 10))
         
         pygame.display.flip()
@@ -188,6 +700,7 @@ class GameDashboard:
             self.clock.tick(60)
             
 if __name__ == "__main__":
-    dashboard = GameDashboard()
+    # Optional map file: python visioning.py maps/ops.map
+    dashboard = GameDashboard(map_path=sys.argv[1] if len(sys.argv) > 1 else None)
     dashboard.run()
     pygame.quit()
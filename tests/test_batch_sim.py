@@ -0,0 +1,32 @@
+import random
+import numpy as np
+from game.batch_sim import simulate_mission, summarize
+from game.characters import create_team
+from game.combat_core import CombatState, reset_units, run_battle
+from game.enemies import Enemy
+from game.missions import Mission, create_missions
+
+def scalar_summary(mission, team, battles, seed):
+    """(win rate, mean turns-to-win) over seeded run_battle calls"""
+    rng = random.Random(seed)
+    turns = []
+    for _ in range(battles):
+        reset_units(team, mission.enemies)
+        state = CombatState(team, mission.enemies, rng=rng)
+        if run_battle(state) == "win":
+            turns.append(state.turn)
+    reset_units(team, mission.enemies)
+    return len(turns) / battles, float(np.mean(turns)) if turns else None
+
+def test_batch_matches_run_battle():
+    team = create_team()
+    # A squad the team sometimes loses to, next to the stock missions
+    guards = [Enemy(f"Guard {i}", 70, 18, 5, (200, 50, 50)) for i in range(4)]
+    missions = create_missions() + [Mission("Guards", "", "", 2, guards)]
+    for seed, mission in enumerate(missions):
+        win_rate, mean_turns = scalar_summary(mission, team, 2000, seed)
+        batch = summarize(simulate_mission(mission, team, 20000, rng=seed))
+        assert abs(batch["win_rate"] - win_rate) < 0.02, mission.title
+        if mean_turns is None:
+            continue
+        assert abs(batch["mean_turns_to_win"] - mean_turns) < 0.2, mission.title
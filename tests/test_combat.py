@@ -0,0 +1,57 @@
+import pygame
+from game.characters import create_team
+from game.combat import CHARACTER_CLICK_RADIUS, ENEMY_CLICK_RADIUS, register_combat_regions
+from game.combat_core import CombatState, reset_units
+from game.event_router import EventRouter
+from game.missions import create_missions
+from game.particles import ParticleSystem
+from game.ui import enemy_slot, team_slot
+
+def new_combat():
+    team, enemies = create_team(), create_missions()[0].enemies
+    reset_units(team, enemies)
+    state = CombatState(team, enemies, seed=1)
+    router = EventRouter()
+    register_combat_regions(router, state, ParticleSystem(seed=0))
+    return state, router
+
+def click(router, pos):
+    router.dispatch("combat", pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos))
+
+def within(pos, center, radius):
+    return (pos[0] - center[0]) ** 2 + (pos[1] - center[1]) ** 2 < radius ** 2
+
+def test_overlap_selects_operative_when_nothing_is_selected():
+    state, router = new_combat()
+    overlap = (625, 200)
+    assert team_slot(2) == (600, 200) and enemy_slot(0) == (650, 200)
+    assert within(overlap, team_slot(2), CHARACTER_CLICK_RADIUS)
+    assert within(overlap, enemy_slot(0), ENEMY_CLICK_RADIUS)
+
+    click(router, overlap)
+    assert state.selected is state.team[2]
+    assert state.actions == [["s", 2]]
+
+def test_overlap_attacks_enemy_once_an_operative_is_selected():
+    state, router = new_combat()
+    click(router, team_slot(0))
+    assert state.selected is state.team[0]
+
+    click(router, (625, 200))
+    assert state.actions == [["s", 0], ["a", 0, 0]]
+    assert not state.player_turn
+
+def test_dead_enemy_is_clicked_through():
+    state, router = new_combat()
+    state.enemies[0].health = 0
+    click(router, team_slot(0))
+    click(router, (625, 200))
+    assert state.selected is state.team[2]
+    assert state.actions == [["s", 0], ["s", 2]]
+
+def test_miss_clears_selection():
+    state, router = new_combat()
+    click(router, team_slot(1))
+    click(router, (5, 650))
+    assert state.selected is None
+    assert state.actions == [["s", 1]]
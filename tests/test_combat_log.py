@@ -0,0 +1,59 @@
+from game.combat_log import CombatLog
+
+def test_ring_buffer_keeps_the_last_lines():
+    log = CombatLog(max_lines=5)
+    for i in range(12):
+        log.append(f"line {i}")
+    assert len(log) == 5 and log.total == 12
+    assert list(log) == [f"line {i}" for i in range(7, 12)]
+    assert log[-1] == "line 11" and log[1:3] == ["line 8", "line 9"]
+    assert log.tail(2) == ["line 10", "line 11"]
+    assert log.tail(50) == list(log)
+    assert log.history() == list(log)
+
+def test_render_runs_once_per_line():
+    calls = []
+
+    def render(line):
+        calls.append(line)
+        return line.upper()
+
+    log = CombatLog(["a", "b"], max_lines=3, render=render)
+    for line in "cde":
+        log.append(line)
+    assert calls == list("abcde")
+    assert log.rendered_tail(2) == ["D", "E"]
+    assert log.rendered_tail(10) == ["C", "D", "E"]
+
+def test_spill_file_keeps_full_history(tmp_path):
+    path = tmp_path / "logs" / "player.log"
+    path.parent.mkdir()
+    path.write_text("earlier session\n")
+
+    log = CombatLog(["start"], max_lines=3, spill_path=str(path))
+    for i in range(10):
+        log.append(f"hit {i}")
+    expected = ["start"] + [f"hit {i}" for i in range(10)]
+    assert len(log) == 3
+    # Lines are on disk as they arrive, before close
+    assert path.read_text().splitlines() == ["earlier session"] + expected
+    assert log.history() == expected
+    log.close()
+    assert path.read_text().splitlines() == ["earlier session"] + expected
+
+def test_spill_creates_directories(tmp_path):
+    path = tmp_path / "a" / "b" / "player.log"
+    log = CombatLog(["x"], spill_path=str(path))
+    log.close()
+    assert path.read_text() == "x\n"
+
+def test_close_stops_spilling_and_is_idempotent(tmp_path):
+    path = tmp_path / "player.log"
+    log = CombatLog(["before"], spill_path=str(path))
+    spill = log.spill
+    log.close()
+    assert spill.closed and log.spill is None
+    log.close()
+    log.append("after")  # still logged in memory, no longer written
+    assert list(log) == ["before", "after"]
+    assert path.read_text() == "before\n"
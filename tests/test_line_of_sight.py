@@ -0,0 +1,108 @@
+from fractions import Fraction
+import numpy as np
+from line_of_sight import (LINE_TABLE_RADIUS, LOSCache, batch_line_of_sight,
+                           has_line_of_sight, lines_through, pairs_line_of_sight)
+
+def reference_tiles(a, b):
+    """
+    Intermediate tiles of the line a -> b, one per step along the major
+    axis, with both minor-axis tiles where the exact line crosses a corner
+    """
+    (x0, y0), (x1, y1) = a, b
+    dx, dy = x1 - x0, y1 - y0
+    n = max(abs(dx), abs(dy))
+    tiles = set()
+    for k in range(1, n):
+        fx, fy = Fraction(x0 * n + k * dx, n), Fraction(y0 * n + k * dy, n)
+        xs = {fx.__floor__(), fx.__ceil__()} if fx.denominator == 2 else {round(fx)}
+        ys = {fy.__floor__(), fy.__ceil__()} if fy.denominator == 2 else {round(fy)}
+        tiles.update((x, y) for x in xs for y in ys)
+    return tiles
+
+def reference_los(game_map, a, b):
+    return not any(game_map[tile] == 1 for tile in reference_tiles(a, b))
+
+def random_map(size, density, seed):
+    rng = np.random.default_rng(seed)
+    return (rng.random((size, size)) < density).astype(np.uint8), rng
+
+def random_pairs(rng, size, count):
+    return rng.integers(0, size, (count, 2)), rng.integers(0, size, (count, 2))
+
+def test_matches_scalar_reference():
+    # 150 tiles is wide enough for lines past LINE_TABLE_RADIUS, which are traced on the fly
+    size = 150
+    assert size > LINE_TABLE_RADIUS + 2
+    game_map, rng = random_map(size, 0.02, seed=1)
+    a, b = random_pairs(rng, size, 3000)
+    result = pairs_line_of_sight(game_map, a, b)
+    expected = [reference_los(game_map, tuple(p), tuple(q)) for p, q in zip(a.tolist(), b.tolist())]
+    assert result.tolist() == expected
+    assert result.any() and not result.all()
+
+def test_exact_corner_crossings_check_both_tiles():
+    game_map = np.zeros((5, 5), dtype=np.uint8)
+    assert has_line_of_sight(game_map, (0, 1), (2, 2))
+    game_map[1, 1] = 1  # (0, 1) -> (2, 2) crosses the corner of (1, 1) and (1, 2)
+    assert not has_line_of_sight(game_map, (0, 1), (2, 2))
+    assert not has_line_of_sight(game_map, (2, 2), (0, 1))
+    game_map[1, 1], game_map[1, 2] = 0, 1
+    assert not has_line_of_sight(game_map, (0, 1), (2, 2))
+
+def test_symmetric():
+    size = 150
+    game_map, rng = random_map(size, 0.05, seed=2)
+    a, b = random_pairs(rng, size, 5000)
+    assert (pairs_line_of_sight(game_map, a, b) == pairs_line_of_sight(game_map, b, a)).all()
+
+def test_endpoints_never_block():
+    game_map = np.ones((6, 6), dtype=np.uint8)
+    assert has_line_of_sight(game_map, (0, 0), (0, 0))
+    assert has_line_of_sight(game_map, (0, 0), (1, 1))
+    assert not has_line_of_sight(game_map, (0, 0), (2, 2))
+
+def test_batch_matches_pairs():
+    game_map, rng = random_map(40, 0.15, seed=3)
+    sources, targets = rng.integers(0, 40, (7, 2)), rng.integers(0, 40, (11, 2))
+    matrix = batch_line_of_sight(game_map, sources, targets)
+    for i, source in enumerate(sources):
+        assert (matrix[i] == pairs_line_of_sight(game_map, np.tile(source, (11, 1)), targets)).all()
+
+def test_lines_through_matches_reference_tiles():
+    game_map, rng = random_map(30, 0.0, seed=4)
+    a, b = random_pairs(rng, 30, 400)
+    for tile in [(15, 15), (3, 27), (0, 0)]:
+        through = lines_through(a, b, tile)
+        expected = [tile in reference_tiles(tuple(p), tuple(q)) for p, q in zip(a.tolist(), b.tolist())]
+        assert through.tolist() == expected
+
+def test_cache_matches_uncached_and_is_order_independent():
+    game_map, rng = random_map(60, 0.1, seed=5)
+    cache = LOSCache(game_map.copy())
+    a, b = random_pairs(rng, 60, 2000)
+    first = cache.pairs(a, b)
+    assert (first == pairs_line_of_sight(game_map, a, b)).all()
+    misses = cache.misses
+    assert (cache.pairs(b, a) == first).all()  # same pairs, reversed: all hits
+    assert cache.misses == misses
+    assert cache.hits == len(a)
+
+def test_cache_invalidated_by_terrain_edits():
+    game_map, rng = random_map(60, 0.1, seed=6)
+    cache = LOSCache(game_map)
+    a, b = random_pairs(rng, 60, 2000)
+    cache.pairs(a, b)
+    for x, y, value in [(30, 30, 1), (12, 40, 0), (30, 30, 0), (5, 5, 1)]:
+        cache.set_tile(x, y, value)
+        assert (cache.pairs(a, b) == pairs_line_of_sight(cache.game_map, a, b)).all()
+
+    # Only pairs whose line crosses the tile are recomputed
+    stored = len(cache.keys)
+    crossing = lines_through(a, b, (20, 20))
+    cache.set_tile(20, 20, 1 - cache.game_map[20, 20])
+    assert len(cache.keys) == stored - len(np.unique(cache.pair_keys(a[crossing], b[crossing])))
+
+    # Writing the same opacity keeps everything
+    stored = len(cache.keys)
+    cache.set_tile(20, 20, cache.game_map[20, 20])
+    assert len(cache.keys) == stored
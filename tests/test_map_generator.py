@@ -0,0 +1,76 @@
+import os
+from collections import deque
+import numpy as np
+import pytest
+from map_generator import generate_map, label_regions, load_or_generate
+from tactical_map import FLOOR
+
+def flood_fill_regions(floor):
+    """4-connected regions by BFS, numbered in flat (row-major) order of their first tile"""
+    width, height = floor.shape
+    labels = np.full(floor.shape, -1, dtype=np.int32)
+    sizes, first = [], []
+    for start in zip(*np.nonzero(floor)):
+        if labels[start] != -1:
+            continue
+        region = len(sizes)
+        labels[start] = region
+        queue, size = deque([start]), 0
+        while queue:
+            x, y = queue.popleft()
+            size += 1
+            for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+                if 0 <= nx < width and 0 <= ny < height and floor[nx, ny] and labels[nx, ny] == -1:
+                    labels[nx, ny] = region
+                    queue.append((nx, ny))
+        sizes.append(size)
+        first.append(start[0] * height + start[1])
+    return labels, sizes, first
+
+@pytest.mark.parametrize("density", [0.2, 0.45, 0.6])
+def test_labels_match_flood_fill(density):
+    rng = np.random.default_rng(1)
+    for shape in [(40, 40), (17, 63), (1, 30), (30, 1)]:
+        floor = rng.random(shape) > density
+        labels, sizes, first = label_regions(floor)
+        expected, expected_sizes, expected_first = flood_fill_regions(floor)
+        # Region numbering is an implementation detail: compare as a relabelling
+        pairs = np.unique(np.stack([labels.ravel(), expected.ravel()]), axis=1)
+        assert len(np.unique(pairs[0])) == len(np.unique(pairs[1])) == pairs.shape[1]
+        assert sorted(sizes.tolist()) == sorted(expected_sizes)
+        assert sorted(first.tolist()) == sorted(expected_first)
+        for region, index in enumerate(first):
+            assert labels.flat[index] == region
+
+def test_labels_on_empty_and_full_maps():
+    labels, sizes, first = label_regions(np.zeros((5, 5), dtype=bool))
+    assert (labels == -1).all() and len(sizes) == len(first) == 0
+    labels, sizes, _ = label_regions(np.ones((5, 5), dtype=bool))
+    assert (labels == 0).all() and sizes.tolist() == [25]
+
+def test_seeded_maps_are_reproducible():
+    first = generate_map(80, 60, seed=7)
+    assert np.array_equal(first, generate_map(80, 60, seed=7))
+    assert not np.array_equal(first, generate_map(80, 60, seed=8))
+    assert not np.array_equal(first, generate_map(80, 60, seed=7, fill=0.5))
+
+@pytest.mark.parametrize("seed", range(8))
+def test_generated_maps_are_connected(seed):
+    game_map = generate_map(96, 72, seed=seed)
+    floor = game_map == FLOOR
+    assert floor.mean() > 0.2
+    assert not floor[[0, -1], :].any() and not floor[:, [0, -1]].any()
+    _, sizes, _ = label_regions(floor)
+    assert len(sizes) == 1
+    assert len(flood_fill_regions(floor)[1]) == 1
+
+def test_cached_map_matches_generated(tmp_path):
+    cached = load_or_generate(64, 48, 3, cache_dir=str(tmp_path), rooms=6)
+    assert np.array_equal(cached, generate_map(64, 48, 3, rooms=6))
+    assert len(os.listdir(tmp_path)) == 1
+
+    cached[1, 1] ^= 1  # copy-on-write: edits never reach the cache file
+    again = load_or_generate(64, 48, 3, cache_dir=str(tmp_path), rooms=6)
+    assert np.array_equal(again, generate_map(64, 48, 3, rooms=6))
+    load_or_generate(64, 48, 4, cache_dir=str(tmp_path), rooms=6)
+    assert len(os.listdir(tmp_path)) == 2
@@ -0,0 +1,79 @@
+import random
+import numpy as np
+import pytest
+from game.particles import Particle, ParticleGovernor, ParticleSystem, update_particles
+
+def as_objects(system):
+    """The live particles of a ParticleSystem as reference Particle objects"""
+    particles = []
+    for i in range(system.count):
+        particle = Particle(0, 0, None)
+        particle.x, particle.y = (float(v) for v in system.pos[i])
+        particle.speed_x, particle.speed_y = (float(v) for v in system.vel[i])
+        particle.size, particle.life = float(system.size[i]), int(system.life[i])
+        particle.color = int(system.color[i])
+        particles.append(particle)
+    return particles
+
+def assert_matches(system, particles):
+    assert system.count == len(particles)
+    n = system.count
+    assert system.life[:n].tolist() == [p.life for p in particles]
+    assert system.color[:n].tolist() == [p.color for p in particles]
+    # The arrays are float32, so positions drift from the float64 reference by a few ulps per frame
+    assert system.pos[:n] == pytest.approx(np.array([(p.x, p.y) for p in particles]).reshape(n, 2), rel=1e-5, abs=1e-3)
+    assert system.size[:n] == pytest.approx(np.array([p.size for p in particles]), abs=1e-4)
+
+def test_update_matches_reference_particles():
+    system = ParticleSystem(capacity=16, seed=1)
+    rng = random.Random(2)
+    particles = []
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    for frame in range(100):
+        if frame % 7 == 0 and frame < 50:
+            before = system.count
+            system.emit(rng.randint(0, 800), rng.randint(0, 600), rng.choice(colors), rng.randint(5, 60))
+            # The new particles join the reference list in the same slots
+            particles += as_objects(system)[before:]
+        system.update()
+        particles = update_particles(particles)
+        assert_matches(system, particles)
+    assert system.count == 0
+    assert system.capacity > 16  # bursts grew the arrays while live particles were kept
+
+def test_capacity_limit_drops_extra_particles():
+    system = ParticleSystem(capacity=8, max_capacity=32, seed=3)
+    assert system.emit(0, 0, (255, 255, 255), 20) == 20
+    assert system.emit(0, 0, (255, 255, 255), 20) == 12
+    assert (system.count, system.capacity, system.dropped) == (32, 32, 8)
+
+def test_governor_scale_stays_in_bounds():
+    governor = ParticleGovernor(budget_ms=2.0, frame_budget_ms=16.0, min_scale=0.2)
+    rng = random.Random(4)
+    for _ in range(2000):
+        governor.observe(rng.uniform(0, 20), rng.uniform(0, 60))
+        assert governor.min_scale <= governor.scale <= 1.0
+    for _ in range(200):
+        governor.observe(0.1, 1.0)
+    assert governor.scale == 1.0
+    for _ in range(200):
+        governor.observe(50.0)
+    assert governor.scale == governor.min_scale
+
+def test_governor_scales_emission_and_culls():
+    governor = ParticleGovernor(budget_ms=1.0, min_scale=0.1)
+    system = ParticleSystem(capacity=4096, seed=5, governor=governor)
+    governor.observe(4.0)  # four times over budget
+    assert governor.scale == pytest.approx(0.25)
+    for _ in range(100):
+        system.emit(100, 100, (255, 255, 0), 40)
+    assert governor.requested == 4000
+    assert governor.emitted == system.count
+    assert 850 < system.count < 1150
+    assert system.life[:system.count].max() <= 40 * governor.lifetime_scale
+
+    live = system.count
+    system.update()
+    assert system.count + governor.culled == live
+    assert system.count == pytest.approx(live / 4, rel=0.2)
+    assert (system.life[:system.count] > 0).all()
@@ -0,0 +1,117 @@
+import math
+import heapq
+import numpy as np
+import pytest
+from pathfinding import PathFinder
+
+MOVES = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+
+def open_tile(game_map, x, y):
+    width, height = game_map.shape
+    return 0 <= x < width and 0 <= y < height and game_map[x, y] == 0
+
+def step_allowed(game_map, x, y, dx, dy):
+    """Eight-way step without cutting corners"""
+    if not open_tile(game_map, x + dx, y + dy):
+        return False
+    return not (dx and dy) or (open_tile(game_map, x + dx, y) and open_tile(game_map, x, y + dy))
+
+def reference_costs(game_map, targets):
+    """Plain Dijkstra from a set of targets over (x, y) tuples"""
+    cost = {}
+    heap = [(0.0, tuple(t)) for t in targets if open_tile(game_map, *t)]
+    while heap:
+        c, (x, y) = heapq.heappop(heap)
+        if (x, y) in cost:
+            continue
+        cost[x, y] = c
+        for dx, dy in MOVES:
+            if step_allowed(game_map, x, y, dx, dy) and (x + dx, y + dy) not in cost:
+                heapq.heappush(heap, (c + math.hypot(dx, dy), (x + dx, y + dy)))
+    return cost
+
+def path_cost(game_map, path):
+    total = 0.0
+    for (x0, y0), (x1, y1) in zip(path, path[1:]):
+        dx, dy = x1 - x0, y1 - y0
+        assert max(abs(dx), abs(dy)) == 1, "path skips tiles"
+        assert step_allowed(game_map, x0, y0, dx, dy), "path crosses a wall or cuts a corner"
+        total += math.hypot(dx, dy)
+    return total
+
+def random_grids(count, size=24, density=0.3):
+    rng = np.random.default_rng(11)
+    for _ in range(count):
+        yield (rng.random((size, size)) < density).astype(np.uint8), rng
+
+def floor_tiles(game_map, rng, count):
+    floor = np.argwhere(game_map == 0)
+    return [tuple(int(v) for v in floor[i]) for i in rng.choice(len(floor), count)]
+
+@pytest.mark.parametrize("method", ["astar", "jps"])
+def test_path_cost_is_optimal(method):
+    for game_map, rng in random_grids(20):
+        finder = PathFinder(game_map)
+        for start, goal in zip(floor_tiles(game_map, rng, 10), floor_tiles(game_map, rng, 10)):
+            optimum = reference_costs(game_map, [goal]).get(start)
+            path = finder.find_path(start, goal, method=method)
+            if optimum is None:
+                assert path is None
+                continue
+            assert path[0] == start and path[-1] == goal
+            assert path_cost(game_map, path) == pytest.approx(optimum)
+
+def test_jps_cost_matches_astar():
+    for game_map, rng in random_grids(20, size=40, density=0.15):
+        finder = PathFinder(game_map)
+        for start, goal in zip(floor_tiles(game_map, rng, 10), floor_tiles(game_map, rng, 10)):
+            astar = finder.find_path(start, goal, method="astar")
+            jps = finder.find_path(start, goal, method="jps")
+            assert (astar is None) == (jps is None)
+            if astar is not None:
+                assert path_cost(game_map, jps) == pytest.approx(path_cost(game_map, astar))
+
+def test_distance_field_matches_dijkstra():
+    for game_map, rng in random_grids(10):
+        targets = floor_tiles(game_map, rng, 3)
+        field = PathFinder(game_map).distance_field(targets)
+        reference = reference_costs(game_map, targets)
+        per_target = {target: reference_costs(game_map, [target]) for target in targets}
+        width, height = game_map.shape
+        for x in range(width):
+            for y in range(height):
+                if (x, y) in reference:
+                    assert field.distance[x, y] == pytest.approx(reference[x, y], rel=1e-5)
+                    nearest = field.nearest_target((x, y))
+                    assert per_target[nearest][x, y] == pytest.approx(reference[x, y], rel=1e-5)
+                else:
+                    assert not np.isfinite(field.distance[x, y])
+                    assert field.nearest_target((x, y)) is None
+
+def test_set_tile_invalidates_affected_fields():
+    game_map = np.zeros((12, 12), dtype=np.uint8)
+    game_map[6, :] = 1
+    game_map[6, 11] = 0  # one gap at the bottom of the wall
+    finder = PathFinder(game_map)
+    field = finder.distance_field([(0, 0)], key="squad")
+    before = field.cost_at((11, 0))
+    assert finder.distance_field([(0, 0)], key="squad") is field
+
+    finder.set_tile(6, 0, 0)  # open a shortcut at the top
+    rebuilt = finder.distance_field([(0, 0)], key="squad")
+    assert rebuilt is not field
+    assert rebuilt.cost_at((11, 0)) < before
+    assert rebuilt.cost_at((11, 0)) == pytest.approx(reference_costs(finder.game_map, [(0, 0)])[11, 0])
+
+    finder.set_tile(6, 11, 1)  # close the old gap: still reachable through the new one
+    again = finder.distance_field([(0, 0)], key="squad")
+    assert again is not rebuilt
+    assert again.cost_at((11, 11)) == pytest.approx(reference_costs(finder.game_map, [(0, 0)])[11, 11])
+
+def test_set_tile_keeps_unreachable_fields():
+    game_map = np.zeros((10, 10), dtype=np.uint8)
+    game_map[4, :] = 1  # the field from (0, 0) never reaches x > 4
+    finder = PathFinder(game_map)
+    field = finder.distance_field([(0, 0)])
+    finder.set_tile(8, 8, 1)
+    assert finder.distance_field([(0, 0)]) is field
@@ -0,0 +1,60 @@
+from game import replay
+from game.characters import create_team
+from game.combat_core import CombatState, choose_attack, enemy_turn, player_attack, reset_units, select_character
+from game.missions import create_missions
+from game.rng import RNGStreams
+
+def play(mission_index, seed):
+    """A whole combat driven the way the UI does: select, attack, enemy turn"""
+    team, missions = create_team(), create_missions()
+    enemies = missions[mission_index].enemies
+    reset_units(team, enemies)
+    state = CombatState(team, enemies, seed=seed)
+    while state.check_result() == "continue" and state.turn < 200:
+        attacker, target = choose_attack(state)
+        select_character(state, attacker)
+        player_attack(state, attacker, target)
+        enemy_turn(state)
+    return state
+
+def test_saved_replay_reproduces_the_combat(tmp_path, monkeypatch):
+    monkeypatch.setattr(replay, "REPLAY_DIR", str(tmp_path))
+    played = [play(mission, seed) for mission, seed in [(0, 1), (0, 2), (1, 3)]]
+    for mission, state in zip([0, 0, 1], played):
+        path = replay.save_replay(replay.make_replay(state, mission), player_id="test")
+
+    loaded = replay.load_replays(path)
+    assert len(loaded) == len(played)
+    for record, state in zip(loaded, played):
+        rerun = replay.run_replay(record)
+        assert rerun.actions == state.actions == record["actions"]
+        assert rerun.result == state.result == record["result"]
+        assert list(rerun.log) == list(state.log)
+        assert [char.health for char in rerun.team] == [char.health for char in state.team]
+        assert [enemy.health for enemy in rerun.enemies] == [enemy.health for enemy in state.enemies]
+    assert {state.result for state in played} == {"win", "lose"}
+
+def test_streams_are_independent():
+    reference = RNGStreams(42)
+    combat = [reference.stream("combat").random() for _ in range(5)]
+
+    busy = RNGStreams(42)
+    particles = busy.stream("particles")
+    for _ in range(1000):
+        particles.random()
+    busy.spawn_seed("background")
+    assert [busy.stream("combat").random() for _ in range(5)] == combat
+
+def test_streams_reproduce_from_the_master_seed():
+    first, second = RNGStreams(7), RNGStreams(7)
+    assert first.spawn_seed("combat") == second.spawn_seed("combat")
+    assert first.stream("combat").random() != first.stream("particles").random()
+    assert RNGStreams(8).stream("combat").random() != RNGStreams(7).stream("combat").random()
+
+def test_reseed_keeps_stream_references():
+    streams = RNGStreams(1)
+    combat = streams.stream("combat")
+    combat.random()
+    streams.reseed(5)
+    assert combat is streams.stream("combat")
+    assert combat.random() == RNGStreams(5).stream("combat").random()